@@ -8,12 +8,16 @@ import numpy as np
 import os
 import base64
 import io
-from PIL import Image
+from PIL import Image, ImageDraw
 from pathlib import Path
 import hashlib
 import time
 from datetime import datetime
 
+from src.atlas.raster import encode_png, font as atlas_font, hex_rgb, static_layer, to_pixels
+from src.glyphs.cache import GlyphCache
+from src.seeding import memoize_by_digest, stable_rng, stable_seed
+
 # Set page config with custom theme
 st.set_page_config(
     page_title="Crownbridge Myth-Tech",
@@ -113,10 +117,24 @@ st.markdown("""
 
 # Create necessary directories
 os.makedirs("output", exist_ok=True)
-os.makedirs("output/glyphs", exist_ok=True)
 os.makedirs("output/rituals", exist_ok=True)
 os.makedirs("output/atlas", exist_ok=True)
 
+# Glyphs are rendered in memory; set CROWNBRIDGE_PERSIST_GLYPHS=1 to also
+# keep them on disk under output/glyphs (content-addressed and size-bounded)
+PERSIST_GLYPHS = os.environ.get("CROWNBRIDGE_PERSIST_GLYPHS", "0") == "1"
+
+# Bumped whenever the app glyph renderer changes, invalidating cached glyphs
+GLYPH_RENDERER_VERSION = "app-1"
+
+# Shared glyph cache so repeated prompts skip rendering
+@st.cache_resource
+def get_glyph_cache():
+    """Get the process-wide glyph cache"""
+    return GlyphCache(cache_dir="output/glyphs/cache" if PERSIST_GLYPHS else None)
+
+glyph_cache = get_glyph_cache()
+
 # Enhanced header with cosmic animation
 st.markdown("""
 <div class="main-header">
@@ -186,11 +204,8 @@ def get_theme_colors(theme):
     }
     return themes.get(theme, themes["cosmic"])
 
-def generate_glyph(attention_weights, output_path=None, theme="cosmic"):
-    """Generate an enhanced SVG glyph with animation effects"""
-    if output_path is None:
-        output_path = f"output/glyphs/sigil_{np.random.randint(10000)}.svg"
-    
+def render_glyph_svg(attention_weights, theme="cosmic"):
+    """Render an enhanced SVG glyph with animation effects as a string"""
     # Get theme colors
     colors = get_theme_colors(theme)
     
@@ -328,22 +343,67 @@ def generate_glyph(attention_weights, output_path=None, theme="cosmic"):
     # Complete SVG
     svg_content += "</svg>"
     
+    return svg_content
+
+def forge_glyph_svg(attention_weights, theme="cosmic", cache=None, as_bytes=False):
+    """
+    Generate a glyph in memory without touching the filesystem
+    (unless the cache has an on-disk tier)
+    
+    Returns:
+        SVG content as a string, or as bytes if as_bytes is set
+    """
+    svg_bytes, _ = _forge_glyph_bytes(attention_weights, theme, cache)
+    return svg_bytes if as_bytes else svg_bytes.decode("utf-8")
+
+def generate_glyph(attention_weights, output_path=None, theme="cosmic", cache=None):
+    """Generate an enhanced SVG glyph with animation effects and save it to disk"""
+    svg_bytes, key = _forge_glyph_bytes(attention_weights, theme, cache)
+    
+    # Cached glyphs already live at their content address
+    if output_path is None and key is not None and cache.cache_dir is not None:
+        return cache.materialize(key, svg_bytes)
+    
+    if output_path is None:
+        output_path = f"output/glyphs/sigil_{np.random.randint(10000)}.svg"
+    
     # Save to file
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(svg_content)
+    with open(output_path, "wb") as f:
+        f.write(svg_bytes)
     
     return output_path
 
+def _forge_glyph_bytes(attention_weights, theme, cache):
+    """Render a glyph as SVG bytes, reusing a cached render when available"""
+    if cache is None:
+        return render_glyph_svg(attention_weights, theme).encode("utf-8"), None
+    
+    # Reuse a previously rendered glyph for identical attention
+    key = cache.key(attention_weights, theme, GLYPH_RENDERER_VERSION)
+    svg_bytes = cache.get(key)
+    if svg_bytes is None:
+        svg_bytes = render_glyph_svg(attention_weights, theme).encode("utf-8")
+        cache.put(key, svg_bytes)
+    
+    return svg_bytes, key
+
 def simulate_attention(text=None):
     """Generate a simulated attention matrix"""
     if text:
-        # Set seed based on text hash
-        np.random.seed(hash(text) % 10000)
+        return _text_attention(text)
     
     attention = np.random.rand(12, 12)
     return attention
 
+# Version of the demo's simulated attention matrices
+ATTENTION_VERSION = "1"
+
+@memoize_by_digest("app-attention", ATTENTION_VERSION)
+def _text_attention(text):
+    """Simulated attention seeded from a stable digest of the text"""
+    return stable_rng("attention", text).random((12, 12))
+
 def assess_drift(attention):
     """Simulate drift assessment"""
     entropy = np.mean(attention)
@@ -366,14 +426,14 @@ def assess_drift(attention):
             "symbol": "⊻"
         }
 
-def display_svg(svg_path):
-    """Display an SVG file"""
+def display_svg(svg_content):
+    """Display SVG content given as a string or bytes"""
     try:
-        with open(svg_path, "r") as f:
-            svg_content = f.read()
+        if isinstance(svg_content, str):
+            svg_content = svg_content.encode()
         
         # Encode SVG in base64
-        b64 = base64.b64encode(svg_content.encode()).decode()
+        b64 = base64.b64encode(svg_content).decode()
         
         # Display SVG
         st.markdown(f"""
@@ -386,8 +446,8 @@ def display_svg(svg_path):
 
 def generate_ritual_hologram(intent, depth=3, theme="cosmic"):
     """Generate a sophisticated ASCII ritual hologram"""
-    # Create a seed based on intent
-    np.random.seed(hash(intent) % 10000)
+    # Create a random generator based on intent
+    rng = stable_rng("hologram", intent)
     
     # Get theme colors for reference (just names, since we're ASCII)
     colors = get_theme_colors(theme)
@@ -423,7 +483,7 @@ def generate_ritual_hologram(intent, depth=3, theme="cosmic"):
     bias = [b / sum(bias) for b in bias]
     
     # Generate sequence with bias
-    sequence = ''.join(np.random.choice(symbols, depth * 4, p=bias))
+    sequence = ''.join(rng.choice(symbols, depth * 4, p=bias))
     
     # Create the hologram with more sophisticated formatting
     width = depth * 5 + 12
@@ -440,7 +500,7 @@ def generate_ritual_hologram(intent, depth=3, theme="cosmic"):
     lines.append(f" {border_char}" * (width // 2))
     
     # Add ritual ID
-    ritual_id = hex(hash(intent) % 16777216)[2:].upper().zfill(6)
+    ritual_id = hex(stable_seed("ritual", intent, bits=24))[2:].upper().zfill(6)
     lines.append(f"┌{'─' * (width-2)}┐")
     lines.append(f"│ RITUAL {ritual_id} {' ' * (width - 15)}│")
     
@@ -497,13 +557,13 @@ def generate_ritual_hologram(intent, depth=3, theme="cosmic"):
             # Pattern rows - weighted by position in ritual
             if i <= depth // 3:
                 # Early phase - more divergence
-                row_symbols = np.random.choice(symbols, width - 4, p=[0.4, 0.3, 0.2, 0.1])
+                row_symbols = rng.choice(symbols, width - 4, p=[0.4, 0.3, 0.2, 0.1])
             elif i <= 2 * depth // 3:
                 # Middle phase - more recursion/alignment
-                row_symbols = np.random.choice(symbols, width - 4, p=[0.2, 0.4, 0.3, 0.1])
+                row_symbols = rng.choice(symbols, width - 4, p=[0.2, 0.4, 0.3, 0.1])
             else:
                 # Late phase - more completion
-                row_symbols = np.random.choice(symbols, width - 4, p=[0.1, 0.2, 0.3, 0.4])
+                row_symbols = rng.choice(symbols, width - 4, p=[0.1, 0.2, 0.3, 0.4])
             
             # Format with spaces
             pattern = ' '.join(row_symbols)
@@ -516,30 +576,28 @@ def generate_ritual_hologram(intent, depth=3, theme="cosmic"):
     lines.append(f" {border_char}" * (width // 2))
     
     # Add drift assessment
-    drift = assess_drift(np.random.rand(12, 12))  # Placeholder for visualization
+    drift = assess_drift(rng.random((12, 12)))  # Placeholder for visualization
     lines.append(f"\nDrift Assessment: {drift['tier'].upper()} {drift['symbol']}")
     
     return '\n'.join(lines)
 
-def generate_drift_atlas():
-    """Generate a visual representation of the Drift Atlas"""
-    import matplotlib.pyplot as plt
+# Example ethical principles shown on the Drift Atlas tab
+DRIFT_ATLAS_NODES = [
+    {"pos": (0.5, 0.75), "name": "Transparency", "tier": "safe"},
+    {"pos": (0.35, 0.6), "name": "Autonomy", "tier": "safe"},
+    {"pos": (0.65, 0.6), "name": "Privacy", "tier": "safe"},
+    {"pos": (0.3, 0.3), "name": "Novel Creation", "tier": "caution"},
+    {"pos": (0.4, 0.4), "name": "Recursive Self-Improvement", "tier": "caution"},
+    {"pos": (0.7, 0.35), "name": "Manipulation", "tier": "critical"},
+    {"pos": (0.55, 0.35), "name": "Dependency Creation", "tier": "caution"}
+]
+
+def _draw_drift_atlas_layout(ax):
+    """Draw the static Drift Atlas layout: zones, nexus, title, directions and grid"""
     import matplotlib.patches as patches
-    from matplotlib.path import Path
-    import io
-    
-    # Create figure with black background
-    fig, ax = plt.subplots(figsize=(10, 10), facecolor='black')
-    ax.set_facecolor('black')
-    
-    # Remove axes
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.axis('off')
     
     # Create circular boundary
-    circle = plt.Circle((0.5, 0.5), 0.45, fill=False, color='white', linewidth=1, alpha=0.7)
-    ax.add_patch(circle)
+    ax.add_patch(patches.Circle((0.5, 0.5), 0.45, fill=False, color='white', linewidth=1, alpha=0.7))
     
     # Add zones with colors
     zones = [
@@ -550,14 +608,12 @@ def generate_drift_atlas():
     
     for zone in zones:
         # Add zone bubble
-        circle = plt.Circle(zone["center"], zone["radius"], 
-                           fill=True, color=zone["color"], alpha=0.2)
-        ax.add_patch(circle)
+        ax.add_patch(patches.Circle(zone["center"], zone["radius"], 
+                                    fill=True, color=zone["color"], alpha=0.2))
         
         # Add border
-        circle_border = plt.Circle(zone["center"], zone["radius"], 
-                                 fill=False, color=zone["color"], alpha=0.7, linewidth=1)
-        ax.add_patch(circle_border)
+        ax.add_patch(patches.Circle(zone["center"], zone["radius"], 
+                                    fill=False, color=zone["color"], alpha=0.7, linewidth=1))
         
         # Add zone name
         ax.text(zone["center"][0], zone["center"][1], zone["name"], 
@@ -577,8 +633,7 @@ def generate_drift_atlas():
     
     # Add central nexus
     ax.text(0.5, 0.5, "Ω", color='white', ha='center', va='center', fontsize=36)
-    circle = plt.Circle((0.5, 0.5), 0.05, fill=True, color='white', alpha=0.1)
-    ax.add_patch(circle)
+    ax.add_patch(patches.Circle((0.5, 0.5), 0.05, fill=True, color='white', alpha=0.1))
     
     # Add title
     ax.text(0.5, 0.95, "THE DRIFT ATLAS", color='white', ha='center', va='center',
@@ -602,25 +657,38 @@ def generate_drift_atlas():
     
     # Add subtle grid lines
     for radius in [0.1, 0.2, 0.3, 0.4]:
-        circle = plt.Circle((0.5, 0.5), radius, fill=False, color='white', alpha=0.1, linestyle='-')
-        ax.add_patch(circle)
+        ax.add_patch(patches.Circle((0.5, 0.5), radius, fill=False, color='white', alpha=0.1, linestyle='-'))
         
     for angle in range(0, 360, 30):
         rad = angle * np.pi / 180
         dx = 0.45 * np.cos(rad)
         dy = 0.45 * np.sin(rad)
         ax.plot([0.5, 0.5 + dx], [0.5, 0.5 + dy], color='white', alpha=0.1, linestyle='-')
+
+def generate_drift_atlas(nodes=None, dpi=150):
+    """
+    Generate a visual representation of the Drift Atlas
     
-    # Add nodes representing example ethical principles
-    nodes = [
-        {"pos": (0.5, 0.75), "name": "Transparency", "tier": "safe"},
-        {"pos": (0.35, 0.6), "name": "Autonomy", "tier": "safe"},
-        {"pos": (0.65, 0.6), "name": "Privacy", "tier": "safe"},
-        {"pos": (0.3, 0.3), "name": "Novel Creation", "tier": "caution"},
-        {"pos": (0.4, 0.4), "name": "Recursive Self-Improvement", "tier": "caution"},
-        {"pos": (0.7, 0.35), "name": "Manipulation", "tier": "critical"},
-        {"pos": (0.55, 0.35), "name": "Dependency Creation", "tier": "caution"}
-    ]
+    The layout is rasterized once per dpi and cached; only the nodes are
+    drawn on each call, with Pillow.
+    
+    Args:
+        nodes: Node dicts with "pos" (in the unit square), "name" and "tier"
+            (default: DRIFT_ATLAS_NODES)
+        dpi: Pixels per inch of the 10 inch image
+        
+    Returns:
+        BytesIO holding the PNG image
+    """
+    if nodes is None:
+        nodes = DRIFT_ATLAS_NODES
+    
+    layout = static_layer("app_drift_atlas", _draw_drift_atlas_layout, 10, dpi, (0, 1), (0, 1))
+    image = Image.fromarray(layout).convert("RGBA")
+    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    width, height = image.size
+    label_font = atlas_font(8 * dpi / 72)
     
     # Color mapping for node tiers
     tier_colors = {
@@ -629,38 +697,73 @@ def generate_drift_atlas():
         "critical": "#ff4500"
     }
     
-    # Add nodes to plot
+    # Add nodes to the image
+    radius = 0.02 * width
     for node in nodes:
-        color = tier_colors.get(node["tier"], "white")
+        color = hex_rgb(tier_colors[node["tier"]]) if node["tier"] in tier_colors else (255, 255, 255)
         
         # Add node circle
-        circle = plt.Circle(node["pos"], 0.02, fill=True, color=color, alpha=0.7)
-        ax.add_patch(circle)
+        x, y = to_pixels(node["pos"][0], node["pos"][1], (0, 1), (0, 1), width, height)
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color + (178,))
         
         # Calculate label position (alternate above/below)
         if node["pos"][1] > 0.5:
-            label_y = node["pos"][1] + 0.03
-            va = 'bottom'
+            label_y, anchor = node["pos"][1] + 0.03, "mb"
         else:
-            label_y = node["pos"][1] - 0.03
-            va = 'top'
+            label_y, anchor = node["pos"][1] - 0.03, "mt"
             
         # Add node label
-        ax.text(node["pos"][0], label_y, node["name"], 
-               color='white', ha='center', va=va, fontsize=8)
+        _, label_y = to_pixels(0, label_y, (0, 1), (0, 1), width, height)
+        draw.text((x, label_y), node["name"], fill=(255, 255, 255, 255), font=label_font, anchor=anchor)
     
-    # Set aspect ratio and limits
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.set_aspect('equal')
+    return io.BytesIO(encode_png(Image.alpha_composite(image, overlay).convert("RGB")))
+
+# CACHED TAB COMPUTATIONS
+
+# Bounds for the per-tab result caches shared by every session
+RESULT_CACHE_TTL = 3600  # seconds
+RESULT_CACHE_ENTRIES = 1024
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def run_audit(text):
+    """Perform a ψCORE audit, cached on the input text"""
+    attention = simulate_attention(text)
+    return {
+        "svg": forge_glyph_svg(attention, theme="cosmic", cache=glyph_cache),
+        "assessment": assess_drift(attention)
+    }
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def run_ritual(intent, depth, theme):
+    """Perform a ritual, cached on intent, depth and theme"""
+    # Generate a ritual ID
+    ritual_id = hashlib.md5(intent.encode()).hexdigest()[:8]
+    
+    # Generate attention pattern
+    attention = simulate_attention(intent)
     
-    # Convert plot to image
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', facecolor='black', bbox_inches='tight', dpi=150)
-    plt.close(fig)
-    buf.seek(0)
+    # Generate glyph
+    glyph_svg = forge_glyph_svg(attention, theme=theme, cache=glyph_cache)
     
-    return buf
+    # Generate hologram
+    hologram = generate_ritual_hologram(intent, depth, theme)
+    
+    # Generate sequence
+    symbols = ["⊻", "∇", "◇", "Ω"]
+    sequence = ''.join(stable_rng("sequence", intent, depth).choice(symbols, depth * 3))
+    
+    return {
+        "id": ritual_id,
+        "sequence": sequence,
+        "hologram": hologram,
+        "svg": glyph_svg,
+        "assessment": assess_drift(attention)
+    }
+
+@st.cache_resource(show_spinner=False)
+def get_drift_atlas_png():
+    """Render the static Drift Atlas once per process"""
+    return generate_drift_atlas().getvalue()
 
 # Tabs for different features
 tab1, tab2, tab3, tab4 = st.tabs(["Sigil Forge", "ψCORE Audit", "Ritual Simulator", "Drift Atlas"])
@@ -688,16 +791,23 @@ with tab1:
     
     if st.button("Generate Random Sigil"):
         with st.spinner("Forging sigil..."):
+            # Random sigils are never repeated, so only the session keeps them
             attention = np.random.rand(12, 12)
-            sigil_path = generate_glyph(attention, theme=theme)
-            
-            st.session_state.sigil_path = sigil_path
-            st.success("Sigil forged!")
-            display_svg(sigil_path)
-            
-            assessment = assess_drift(attention)
-            
-            st.info(f"Drift Assessment: {assessment['tier'].title()} - {assessment['description']}")
+            st.session_state.sigil_result = {
+                "svg": forge_glyph_svg(attention, theme=theme, cache=glyph_cache),
+                "assessment": assess_drift(attention)
+            }
+    
+    # Reruns redisplay the session's last sigil without forging a new one
+    if "sigil_result" in st.session_state:
+        sigil = st.session_state.sigil_result
+        
+        st.success("Sigil forged!")
+        display_svg(sigil["svg"])
+        
+        assessment = sigil["assessment"]
+        
+        st.info(f"Drift Assessment: {assessment['tier'].title()} - {assessment['description']}")
 with tab2:
     st.header("🧠 ψCORE Audit")
     st.markdown("""
@@ -709,31 +819,34 @@ with tab2:
     
     if st.button("Perform Audit") and text:
         with st.spinner("Performing audit..."):
-            attention = simulate_attention(text)
-            audit_path = generate_glyph(attention, theme="cosmic")
-            
-            st.success("Audit complete!")
-            display_svg(audit_path)
-            
-            assessment = assess_drift(attention)
-            
-            st.info(f"Drift Assessment: {assessment['tier'].title()} - {assessment['description']}")
-            
-            # Display symbolic interpretation
-            st.markdown("### Symbolic Interpretation")
-            
-            # Calculate dominant glyph based on assessment
-            dominant_glyph = assessment['symbol']
-            
-            symbols = {
-                "⊻": "Divergence - Your input shows significant deviation from standard patterns.",
-                "∇": "Recursion - Your input contains self-referential elements that form recursive loops.",
-                "◇": "Alignment - Your input demonstrates harmony between concepts and contexts.",
-                "Ω": "Completion - Your input forms a cohesive, complete conceptual structure."
-            }
-            
-            st.markdown(f"**Dominant Glyph: {dominant_glyph}**")
-            st.markdown(symbols.get(dominant_glyph, "Unknown pattern detected."))
+            st.session_state.audit_result = run_audit(text)
+    
+    # Reruns redisplay the session's last audit without recomputing it
+    if "audit_result" in st.session_state:
+        audit = st.session_state.audit_result
+        
+        st.success("Audit complete!")
+        display_svg(audit["svg"])
+        
+        assessment = audit["assessment"]
+        
+        st.info(f"Drift Assessment: {assessment['tier'].title()} - {assessment['description']}")
+        
+        # Display symbolic interpretation
+        st.markdown("### Symbolic Interpretation")
+        
+        # Calculate dominant glyph based on assessment
+        dominant_glyph = assessment['symbol']
+        
+        symbols = {
+            "⊻": "Divergence - Your input shows significant deviation from standard patterns.",
+            "∇": "Recursion - Your input contains self-referential elements that form recursive loops.",
+            "◇": "Alignment - Your input demonstrates harmony between concepts and contexts.",
+            "Ω": "Completion - Your input forms a cohesive, complete conceptual structure."
+        }
+        
+        st.markdown(f"**Dominant Glyph: {dominant_glyph}**")
+        st.markdown(symbols.get(dominant_glyph, "Unknown pattern detected."))
 with tab3:
     st.header("🌀 Ritual Simulator")
     st.markdown("""
@@ -753,41 +866,28 @@ with tab3:
     
     if st.button("Perform Ritual") and intent:
         with st.spinner("Performing ritual..."):
-            # Generate a ritual ID
-            import hashlib
-            ritual_id = hashlib.md5(intent.encode()).hexdigest()[:8]
-            
-            # Generate attention pattern
-            attention = simulate_attention(intent)
-            
-            # Generate glyph
-            glyph_path = generate_glyph(attention, theme=ritual_theme)
-            
-            # Generate hologram
-            hologram = generate_ritual_hologram(intent, depth, ritual_theme)
-            
-            # Generate sequence
-            symbols = ["⊻", "∇", "◇", "Ω"]
-            sequence = ''.join(np.random.choice(symbols, depth * 3))
-            
-            # Assessment
-            assessment = assess_drift(attention)
-            
-            st.success("Ritual complete!")
-            
-            st.markdown(f"**Ritual ID:** {ritual_id}")
-            st.markdown(f"**Symbolic Sequence:** {sequence}")
-            
-            st.markdown("### Hologram")
-            st.code(hologram, language=None)
-            
-            st.markdown("### Sigil")
-            display_svg(glyph_path)
-            
-            st.markdown("### Drift Assessment")
-            st.markdown(f"**Tier:** {assessment['tier'].title()}")
-            st.markdown(f"**Description:** {assessment['description']}")
-            st.markdown(f"**Symbol:** {assessment['symbol']}")
+            st.session_state.ritual_result = run_ritual(intent, depth, ritual_theme)
+    
+    # Reruns redisplay the session's last ritual without recomputing it
+    if "ritual_result" in st.session_state:
+        ritual = st.session_state.ritual_result
+        assessment = ritual["assessment"]
+        
+        st.success("Ritual complete!")
+        
+        st.markdown(f"**Ritual ID:** {ritual['id']}")
+        st.markdown(f"**Symbolic Sequence:** {ritual['sequence']}")
+        
+        st.markdown("### Hologram")
+        st.code(ritual["hologram"], language=None)
+        
+        st.markdown("### Sigil")
+        display_svg(ritual["svg"])
+        
+        st.markdown("### Drift Assessment")
+        st.markdown(f"**Tier:** {assessment['tier'].title()}")
+        st.markdown(f"**Description:** {assessment['description']}")
+        st.markdown(f"**Symbol:** {assessment['symbol']}")
 
 with tab4:
     st.header("🗺️ Drift Atlas")
@@ -798,12 +898,16 @@ with tab4:
     """)
     
     if st.button("Generate Atlas Visualization"):
+        st.session_state.show_atlas = True
+    
+    if st.session_state.get("show_atlas"):
         with st.spinner("Generating Atlas..."):
             try:
-                atlas_buffer = generate_drift_atlas()
+                # The atlas is static, so it is rendered once per process
+                atlas_png = get_drift_atlas_png()
                 
                 # Display the atlas image
-                st.image(atlas_buffer, caption="The Drift Atlas - Ethical Territory Map", use_column_width=True)
+                st.image(atlas_png, caption="The Drift Atlas - Ethical Territory Map", use_column_width=True)
                 st.success("Atlas generated successfully!")
                 
                 # Add explanation of the zones
@@ -0,0 +1,66 @@
+"""
+Import Benchmark - Measure cold-start import time and import side effects
+"""
+
+import sys
+import os
+import argparse
+import json
+import statistics
+import subprocess
+import tempfile
+
+# Repository root, put on the path of every child interpreter
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "src.glyphs.generator",
+    "src.psycore.hybrid_transformer",
+    "src.ritual.simulator",
+    "src.atlas.visualizer",
+    "src.ethics.drift_tier",
+    "src.privacy.sanitizer",
+    "src.docs.mythic_visualizer",
+]
+
+# Heavy optional dependencies that should only load on first render
+HEAVY = ["matplotlib", "svgwrite"]
+
+# Runs in a fresh interpreter so every import is cold
+PROBE = """
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+__import__({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+    "created": sorted(os.listdir(".")),
+}}))
+"""
+
+def probe(module):
+    """Import a module in a fresh interpreter inside an empty directory"""
+    with tempfile.TemporaryDirectory() as cwd:
+        script = PROBE.format(root=ROOT, module=module, heavy=HEAVY)
+        result = subprocess.run([sys.executable, "-c", script], cwd=cwd,
+                                capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+def main():
+    """Report median cold import time, heavy modules loaded and files created"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to import")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [probe(module) for _ in range(args.repeat)]
+        median = statistics.median(run["seconds"] for run in runs)
+        heavy = ", ".join(runs[0]["heavy"]) or "-"
+        created = ", ".join(runs[0]["created"]) or "-"
+        print(f"{module:34} {median * 1000:8.1f} ms   heavy: {heavy:22} created: {created}")
+
+if __name__ == "__main__":
+    main()
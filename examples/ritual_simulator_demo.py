@@ -66,7 +66,7 @@ def main():
             print(f"  Description: {ritual['drift_assessment']['description']}")
             print(f"  Symbol: {ritual['drift_assessment']['symbol']}")
             
-            print(f"\nRitual record saved: output/rituals/ritual_{ritual['id']}.txt")
+            print("\nRitual logged: output/rituals/history.jsonl")
             
         except Exception as e:
             print(f"Error performing ritual: {e}")
@@ -0,0 +1,120 @@
+"""
+Atlas Raster - Cached static layers and NumPy/Pillow compositing helpers
+"""
+
+import numpy as np
+import io
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+# Static layers kept in memory, least recently used dropped first
+LAYER_CACHE_ENTRIES = 16
+
+_layers = OrderedDict()
+_layers_lock = threading.Lock()
+
+
+def static_layer(key, draw, size, dpi, xlim, ylim):
+    """
+    Rasterize a never-changing matplotlib layer once and reuse it
+
+    The layer is drawn on axes that fill a square figure exactly, so data
+    coordinates map linearly to pixels (see to_pixels) and dynamic
+    content can be composited on top without matplotlib.
+
+    Args:
+        key: Hashable identity of the layer's content (e.g. its colors)
+        draw: Callable taking the axes and drawing the layer
+        size: Figure width and height in inches
+        dpi: Pixels per inch
+        xlim, ylim: Data limits of the axes
+
+    Returns:
+        Read-only (size * dpi, size * dpi, 3) uint8 RGB array
+    """
+    key = (key, size, dpi, tuple(xlim), tuple(ylim))
+    with _layers_lock:
+        if key in _layers:
+            _layers.move_to_end(key)
+            return _layers[key]
+
+    # Figure rather than pyplot, so no global figure state is touched
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(size, size), dpi=dpi, facecolor='black')
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_facecolor('black')
+    draw(ax)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
+    ax.axis('off')
+    canvas.draw()
+
+    layer = np.asarray(canvas.buffer_rgba())[..., :3].copy()
+    layer.flags.writeable = False
+    with _layers_lock:
+        _layers[key] = layer
+        while len(_layers) > LAYER_CACHE_ENTRIES:
+            _layers.popitem(last=False)
+    return layer
+
+
+def to_pixels(x, y, xlim, ylim, width, height):
+    """Pixel columns and rows (floats) of data coordinates on a layer"""
+    px = (np.asarray(x, dtype=np.float64) - xlim[0]) / (xlim[1] - xlim[0]) * width
+    py = (ylim[1] - np.asarray(y, dtype=np.float64)) / (ylim[1] - ylim[0]) * height
+    return px, py
+
+
+def hex_rgb(color):
+    """(r, g, b) of a #rrggbb color"""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def splat_disks(image, px, py, colors, radius):
+    """
+    Paint filled disks in order, so later ones land on top
+
+    Args:
+        image: (H, W, 3) uint8 array, modified in place
+        px, py: (N,) integer pixel centers
+        colors: (N, 3) uint8 colors
+        radius: Disk radius in pixels
+    """
+    size_y, size_x = image.shape[:2]
+    stencil = np.array([(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)
+                        if dx * dx + dy * dy <= radius * radius + radius])
+
+    # (nodes, stencil) pixel grids flattened node by node
+    x = (px[:, None] + stencil[None, :, 0]).ravel()
+    y = (py[:, None] + stencil[None, :, 1]).ravel()
+    node = np.repeat(np.arange(len(px)), len(stencil))
+    keep = (x >= 0) & (x < size_x) & (y >= 0) & (y < size_y)
+    pixel = (y[keep] * size_x + x[keep])[::-1]
+    node = node[keep][::-1]
+
+    # Repeated fancy-index writes have no defined order, so keep only the
+    # last node covering each pixel: its first occurrence once reversed
+    pixel, first = np.unique(pixel, return_index=True)
+    image[pixel // size_x, pixel % size_x] = colors[node[first]]
+
+
+@lru_cache(maxsize=32)
+def font(size_px, bold=False):
+    """Pillow font with the glyph symbols, from the DejaVu Sans shipped with matplotlib"""
+    from PIL import ImageFont
+    from matplotlib import font_manager
+
+    path = font_manager.findfont(font_manager.FontProperties(family="DejaVu Sans",
+                                                             weight="bold" if bold else "normal"))
+    return ImageFont.truetype(path, max(1, int(round(size_px))))
+
+
+def encode_png(image):
+    """PNG bytes of a Pillow image"""
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
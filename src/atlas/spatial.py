@@ -0,0 +1,159 @@
+"""
+Atlas Spatial Index - Uniform grid over Drift Atlas node coordinates
+"""
+
+import numpy as np
+
+
+class GridIndex:
+    """
+    Uniform grid spatial index
+
+    Nodes are sorted by the cell they fall in, so the nodes of a row of
+    cells form one contiguous slice of `order`. Box queries only touch
+    the cells overlapping the box. Nodes appended after the grid was built
+    (see extend) sit in an unsorted tail that every query also scans.
+    """
+
+    def __init__(self, x, y, cells=None):
+        """
+        Build the index
+
+        Args:
+            x, y: (N,) node coordinates
+            cells: Grid cells per side (default: about one node per cell,
+                capped at 1024)
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        count = len(x)
+        if cells is None:
+            cells = int(np.clip(np.sqrt(count), 1, 1024))
+        self.cells = cells
+        self.x = x
+        self.y = y
+
+        # Bounds cover the data, and at least the unit atlas disk
+        self.x0 = min(x.min(), -1.0) if count else -1.0
+        self.y0 = min(y.min(), -1.0) if count else -1.0
+        x1 = max(x.max(), 1.0) if count else 1.0
+        y1 = max(y.max(), 1.0) if count else 1.0
+        self.cell_w = (x1 - self.x0) / cells or 1.0
+        self.cell_h = (y1 - self.y0) / cells or 1.0
+
+        cell_ids = self._cell_row(y) * cells + self._cell_col(x)
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.starts = np.searchsorted(cell_ids[self.order], np.arange(cells * cells + 1))
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def tail(self):
+        """Number of appended nodes outside the grid"""
+        return len(self.x) - len(self.order)
+
+    def extend(self, x, y):
+        """
+        Index nodes appended to the coordinate arrays since the last call
+
+        Args:
+            x, y: (N,) coordinates of every node, the grid's nodes first
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if len(x) < len(self.order):
+            raise ValueError("extend() only adds nodes; build a new index instead")
+        self.x = x
+        self.y = y
+
+    def query_box(self, xmin, xmax, ymin, ymax):
+        """
+        Find nodes inside an axis-aligned box
+
+        Args:
+            xmin, xmax, ymin, ymax: Box bounds (inclusive)
+
+        Returns:
+            Sorted array of node indices
+        """
+        candidates = self._box_candidates(xmin, xmax, ymin, ymax)
+        x, y = self.x[candidates], self.y[candidates]
+        inside = (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        return np.sort(candidates[inside])
+
+    def query_radius(self, x, y, radius):
+        """
+        Find nodes within a distance of a point
+
+        Args:
+            x, y: Query point
+            radius: Search radius (inclusive)
+
+        Returns:
+            Sorted array of node indices
+        """
+        candidates = self._box_candidates(x - radius, x + radius, y - radius, y + radius)
+        dx, dy = self.x[candidates] - x, self.y[candidates] - y
+        return np.sort(candidates[dx * dx + dy * dy <= radius * radius])
+
+    def nearest(self, x, y, k=1):
+        """
+        Find the k nodes closest to a point
+
+        Rings of cells around the point's cell grow until they hold k
+        nodes; the k-th of those distances bounds the true k-th nearest,
+        so one box query of that radius finishes the search.
+
+        Args:
+            x, y: Query point
+            k: Number of neighbors
+
+        Returns:
+            (indices, distances) arrays, nearest first (ties by index)
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+
+        col = int(self._cell_col(np.array([x]))[0])
+        row = int(self._cell_row(np.array([y]))[0])
+        ring = 1
+        while True:
+            candidates = self._cell_candidates(col - ring, col + ring, row - ring, row + ring)
+            if len(candidates) >= k:
+                break
+            ring *= 2
+
+        dx, dy = self.x[candidates] - x, self.y[candidates] - y
+        radius = np.sqrt(np.partition(dx * dx + dy * dy, k - 1)[k - 1])
+        candidates = self._box_candidates(x - radius, x + radius, y - radius, y + radius)
+
+        distances = np.hypot(self.x[candidates] - x, self.y[candidates] - y)
+        order = np.lexsort((candidates, distances))[:k]
+        return candidates[order], distances[order]
+
+    def _box_candidates(self, xmin, xmax, ymin, ymax):
+        """Indices of nodes in every cell overlapping the box"""
+        col0, col1 = self._cell_col(np.array([xmin, xmax]))
+        row0, row1 = self._cell_row(np.array([ymin, ymax]))
+        return self._cell_candidates(col0, col1, row0, row1)
+
+    def _cell_candidates(self, col0, col1, row0, row1):
+        """Indices of nodes in a block of cells, clamped to the grid, plus the tail"""
+        col0, col1 = max(col0, 0), min(col1, self.cells - 1)
+        row0, row1 = max(row0, 0), min(row1, self.cells - 1)
+
+        # Each row of cells is one contiguous run of the sorted nodes
+        slices = [self.order[self.starts[row * self.cells + col0]:self.starts[row * self.cells + col1 + 1]]
+                  for row in range(row0, row1 + 1)]
+        slices.append(np.arange(len(self.order), len(self.x), dtype=np.intp))
+        return np.concatenate(slices)
+
+    def _cell_col(self, x):
+        """Grid column of x coordinates, clamped to the grid"""
+        return np.clip(((x - self.x0) / self.cell_w).astype(np.int64), 0, self.cells - 1)
+
+    def _cell_row(self, y):
+        """Grid row of y coordinates, clamped to the grid"""
+        return np.clip(((y - self.y0) / self.cell_h).astype(np.int64), 0, self.cells - 1)
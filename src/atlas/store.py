@@ -0,0 +1,197 @@
+"""
+Atlas Node Store - Columnar storage for Drift Atlas nodes
+"""
+
+import numpy as np
+
+# Tier names in code order, matching the drift tier protocol
+TIERS = ("safe", "caution", "critical")
+
+
+class _StringColumn:
+    """UTF-8 strings packed into one buffer and addressed by offsets"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offsets = np.zeros(1024, dtype=np.int64)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, values):
+        """Append strings"""
+        encoded = [str(value).encode("utf-8") for value in values]
+        count = len(encoded)
+        if len(self._offsets) <= self._size + count:
+            grown = np.zeros(max(self._size + count + 1, 2 * len(self._offsets)), dtype=np.int64)
+            grown[:self._size + 1] = self._offsets[:self._size + 1]
+            self._offsets = grown
+
+        lengths = np.fromiter((len(value) for value in encoded), dtype=np.int64, count=count)
+        self._offsets[self._size + 1:self._size + 1 + count] = np.cumsum(lengths) + len(self._buffer)
+        self._buffer += b"".join(encoded)
+        self._size += count
+
+    def __getitem__(self, index):
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return self._buffer[start:stop].decode("utf-8")
+
+    def take(self, indices):
+        """Strings at several positions"""
+        return [self[int(index)] for index in indices]
+
+    def encoded(self, start, stop):
+        """UTF-8 bytes of the strings from start to stop, back to back"""
+        return bytes(self._buffer[self._offsets[start]:self._offsets[stop]])
+
+    @property
+    def offsets(self):
+        """(N + 1,) int64 array of string boundaries in the buffer"""
+        return self._offsets[:self._size + 1]
+
+
+class NodeStore:
+    """
+    Columnar store of atlas nodes
+
+    Coordinates and tier codes live in growable NumPy arrays and names and
+    descriptions in packed string columns, so millions of nodes cost a few
+    dozen bytes each rather than a dict apiece. Tier codes index into
+    `tiers`, which starts as TIERS and grows with any other tier name
+    added. `version` increases on every change so indexes and caches built
+    from the store can tell when they are stale.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Initialize an empty store
+
+        Args:
+            capacity: Number of nodes to allocate room for up front
+        """
+        self._size = 0
+        self._x = np.empty(capacity, dtype=np.float64)
+        self._y = np.empty(capacity, dtype=np.float64)
+        self._tier = np.empty(capacity, dtype=np.uint8)
+        self.names = _StringColumn()
+        self.descriptions = _StringColumn()
+        self.tiers = list(TIERS)
+        self.version = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def x(self):
+        """(N,) x coordinates"""
+        return self._x[:self._size]
+
+    @property
+    def y(self):
+        """(N,) y coordinates"""
+        return self._y[:self._size]
+
+    @property
+    def tier_codes(self):
+        """(N,) tier codes indexing into tiers"""
+        return self._tier[:self._size]
+
+    def append(self, name, x, y, tier="safe", description=""):
+        """Add one node; returns its index"""
+        self.extend([name], [x], [y], [tier], [description])
+        return self._size - 1
+
+    def extend(self, names, xs, ys, tiers, descriptions=None):
+        """
+        Add many nodes at once
+
+        Args:
+            names: N node names
+            xs, ys: N coordinates each
+            tiers: N tier names, or an integer array of codes into tiers
+            descriptions: N descriptions (optional)
+
+        Returns:
+            Range of the new node indices
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        ys = np.asarray(ys, dtype=np.float64).ravel()
+        codes = encode_tiers(tiers, self.tiers)
+        count = len(xs)
+        if not (len(ys) == len(codes) == len(names) == count):
+            raise ValueError("names, xs, ys and tiers must have the same length")
+        if descriptions is None:
+            descriptions = [""] * count
+        elif len(descriptions) != count:
+            raise ValueError("descriptions must have one entry per node")
+
+        start = self._size
+        self._reserve(start + count)
+        self._x[start:start + count] = xs
+        self._y[start:start + count] = ys
+        self._tier[start:start + count] = codes
+        self.names.extend(names)
+        self.descriptions.extend(descriptions)
+
+        self._size += count
+        self.version += 1
+        return range(start, self._size)
+
+    def _reserve(self, size):
+        """Grow the arrays geometrically to hold at least `size` nodes"""
+        if size <= len(self._x):
+            return
+        capacity = max(size, 2 * len(self._x))
+        for name in ("_x", "_y", "_tier"):
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            setattr(self, name, grown)
+
+
+def tier_severity(codes):
+    """Rank of tier codes: their TIERS code, and -1 for any other tier"""
+    codes = np.asarray(codes)
+    return np.where(codes < len(TIERS), codes.astype(np.int64), -1)
+
+
+def encode_tiers(tiers, vocabulary=None):
+    """
+    Convert tier names or codes to a uint8 code array
+
+    Args:
+        tiers: Sequence of tier names, or an integer array of codes
+        vocabulary: List of tier names the codes index into; names missing
+            from it are appended and get new codes (default: only TIERS,
+            and unknown names raise ValueError)
+
+    Returns:
+        (N,) uint8 array indexing into the vocabulary
+    """
+    names = TIERS if vocabulary is None else vocabulary
+    tiers = np.asarray(tiers)
+    if tiers.dtype.kind in "iu":
+        codes = tiers.ravel()
+        if codes.size and (codes.min() < 0 or codes.max() >= len(names)):
+            raise ValueError(f"Tier codes must be between 0 and {len(names) - 1}")
+        return codes.astype(np.uint8)
+
+    values = tiers.astype(str).ravel()
+    if vocabulary is not None:
+        for tier in dict.fromkeys(values.tolist()):
+            if tier not in vocabulary:
+                if len(vocabulary) == 256:
+                    raise ValueError("An atlas holds at most 256 distinct tiers")
+                vocabulary.append(tier)
+
+    codes = np.full(len(values), 255, dtype=np.uint8)
+    found = np.zeros(len(values), dtype=bool)
+    for code, tier in enumerate(names):
+        match = values == tier
+        codes[match] = code
+        found |= match
+    if not found.all():
+        unknown = sorted(set(values[~found].tolist()))
+        raise ValueError(f"Unknown tier: {unknown[0]}. Must be one of {list(names)}")
+    return codes
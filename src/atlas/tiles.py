@@ -0,0 +1,350 @@
+"""
+Atlas Tiles - z/x/y PNG tiles of the Drift Atlas with an on-disk pyramid cache
+"""
+
+import numpy as np
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from .raster import encode_png, hex_rgb, splat_disks
+from .store import TIERS, tier_severity
+
+# Bumped whenever tile pixels change, so old pyramids are discarded
+TILE_RENDERER_VERSION = "1"
+
+
+class TileRenderer:
+    """
+    Renders the atlas as a pyramid of 256px slippy-map tiles
+
+    Zoom level z splits the atlas bounds into 2**z by 2**z tiles, with
+    x growing east and y growing south. Tiles are rasterized with NumPy
+    and Pillow straight from the node store and cached on disk as
+    {cache_dir}/{z}/{x}/{y}.png. When nodes are added, only the tiles
+    their markers touch are deleted, at every zoom level.
+    """
+
+    def __init__(self, atlas, cache_dir="output/atlas/tiles", tile_size=256,
+                 bounds=(-1.3, 1.3, -1.3, 1.3), max_zoom=10, label_zoom=4, tile_labels=16):
+        """
+        Initialize the tile renderer
+
+        Args:
+            atlas: DriftAtlas whose nodes are drawn
+            cache_dir: Root directory of the tile pyramid
+            tile_size: Tile width and height in pixels
+            bounds: (xmin, xmax, ymin, ymax) of the atlas covered by zoom 0
+            max_zoom: Deepest zoom level served
+            label_zoom: First zoom level that draws node names
+            tile_labels: Maximum node names per tile
+        """
+        self.atlas = atlas
+        self.cache_dir = cache_dir
+        self.tile_size = tile_size
+        self.bounds = tuple(float(value) for value in bounds)
+        self.max_zoom = max_zoom
+        self.label_zoom = label_zoom
+        self.tile_labels = tile_labels
+
+        self._synced = None
+        self._digest = None
+        self._style = {
+            "version": TILE_RENDERER_VERSION,
+            "tile_size": tile_size,
+            "bounds": list(self.bounds),
+            "label_zoom": label_zoom,
+            "tile_labels": tile_labels,
+            "colors": atlas.colors,
+        }
+
+    def tile_path(self, z, x, y):
+        """Path of a cached tile"""
+        return os.path.join(self.cache_dir, str(z), str(x), f"{y}.png")
+
+    def tile_bounds(self, z, x, y):
+        """(xmin, xmax, ymin, ymax) of the atlas covered by a tile"""
+        xmin, xmax, ymin, ymax = self.bounds
+        width = (xmax - xmin) / 2 ** z
+        height = (ymax - ymin) / 2 ** z
+        return (xmin + x * width, xmin + (x + 1) * width,
+                ymax - (y + 1) * height, ymax - y * height)
+
+    def get_tile(self, z, x, y):
+        """
+        PNG bytes of a tile, rendered only if it is not cached
+
+        Args:
+            z: Zoom level (0 to max_zoom)
+            x, y: Tile column and row (0 to 2**z - 1)
+
+        Returns:
+            PNG image bytes
+        """
+        if not 0 <= z <= self.max_zoom or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            raise ValueError(f"No tile {z}/{x}/{y}")
+
+        self.sync()
+        path = self.tile_path(z, x, y)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+
+        png = self.render_tile(z, x, y)
+        _write_atomic(path, png)
+        return png
+
+    def render_pyramid(self, max_zoom=None):
+        """
+        Render every missing tile down to a zoom level
+
+        Args:
+            max_zoom: Deepest level to fill (default: 3, or max_zoom if lower)
+
+        Returns:
+            Number of tiles rendered
+        """
+        if max_zoom is None:
+            max_zoom = min(3, self.max_zoom)
+
+        self.sync()
+        rendered = 0
+        for z in range(max_zoom + 1):
+            for x in range(2 ** z):
+                for y in range(2 ** z):
+                    if not os.path.exists(self.tile_path(z, x, y)):
+                        _write_atomic(self.tile_path(z, x, y), self.render_tile(z, x, y))
+                        rendered += 1
+        return rendered
+
+    def sync(self):
+        """
+        Invalidate tiles touched by nodes added since the last sync
+
+        The pyramid's manifest records how many nodes its tiles include and
+        a digest of those nodes, so a new renderer over the same atlas only
+        drops tiles for newer nodes. A different tile style, or an atlas
+        whose first nodes differ from the ones drawn, clears the cache.
+        """
+        store = self.atlas.store
+        count = len(store)
+        if self._synced is None:
+            cached = self._read_manifest(count)
+        elif self._synced == count:
+            return
+        else:
+            cached = self._synced
+
+        if cached < count:
+            self.invalidate_points(store.x[cached:count], store.y[cached:count])
+        self._digest.update(store, count)
+        self._synced = count
+        self._write_manifest()
+
+    def invalidate_points(self, xs, ys):
+        """
+        Delete cached tiles whose markers could cover any of these points
+
+        Args:
+            xs, ys: Coordinates of added, moved or removed nodes
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if not len(xs):
+            return
+
+        xmin, xmax, ymin, ymax = self.bounds
+        for z in range(self.max_zoom + 1):
+            cached = self._cached_tiles(z)
+            if not len(cached):
+                continue
+
+            tiles = 2 ** z
+            radius = self._marker_radius(z) + 1
+            col_scale = tiles * self.tile_size / (xmax - xmin)
+            row_scale = tiles * self.tile_size / (ymax - ymin)
+
+            # Tiles under the corners of each marker's padded box
+            px = (xs - xmin) * col_scale
+            py = (ymax - ys) * row_scale
+            touched = []
+            for dx in (-radius, radius):
+                for dy in (-radius, radius):
+                    cols = np.floor((px + dx) / self.tile_size).astype(np.int64)
+                    rows = np.floor((py + dy) / self.tile_size).astype(np.int64)
+                    valid = (cols >= 0) & (cols < tiles) & (rows >= 0) & (rows < tiles)
+                    touched.append(cols[valid] * tiles + rows[valid])
+
+            # Only cached tiles need deleting, which keeps deep zooms cheap
+            stale = cached[np.isin(cached, np.concatenate(touched))]
+            for code in stale.tolist():
+                try:
+                    os.remove(self.tile_path(z, code // tiles, code % tiles))
+                except FileNotFoundError:
+                    pass
+
+    def _cached_tiles(self, z):
+        """Codes x * 2**z + y of the tiles cached at a zoom level"""
+        codes = []
+        try:
+            columns = os.scandir(os.path.join(self.cache_dir, str(z)))
+        except FileNotFoundError:
+            return np.empty(0, dtype=np.int64)
+
+        with columns:
+            for column in columns:
+                if not column.is_dir() or not column.name.isdigit():
+                    continue
+                x = int(column.name)
+                for entry in os.listdir(column.path):
+                    if entry.endswith(".png") and entry[:-4].isdigit():
+                        codes.append(x * 2 ** z + int(entry[:-4]))
+        return np.array(codes, dtype=np.int64)
+
+    def clear(self):
+        """Delete the whole pyramid"""
+        self._remove_pyramid()
+        self._synced = None
+        self._digest = None
+
+    def _remove_pyramid(self):
+        """Delete the zoom level directories and manifest, leaving other files alone"""
+        try:
+            entries = os.scandir(self.cache_dir)
+        except FileNotFoundError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.name.isdigit() and entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+        try:
+            os.remove(os.path.join(self.cache_dir, "manifest.json"))
+        except FileNotFoundError:
+            pass
+
+    def render_tile(self, z, x, y):
+        """Rasterize one tile to PNG bytes without consulting the cache"""
+        from PIL import Image, ImageDraw
+
+        size = self.tile_size
+        txmin, txmax, tymin, tymax = self.tile_bounds(z, x, y)
+        pixel = (txmax - txmin) / size
+        image = self._background(txmin, tymax, pixel)
+
+        # Nodes whose markers reach into the tile, least severe tier first
+        radius = self._marker_radius(z)
+        pad = (radius + 1) * pixel
+        store = self.atlas.store
+        nodes = self.atlas.index.query_box(txmin - pad, txmax + pad, tymin - pad, tymax + pad)
+        nodes = nodes[np.argsort(tier_severity(store.tier_codes[nodes]), kind="stable")]
+
+        px = np.floor((store.x[nodes] - txmin) / pixel).astype(np.int64)
+        py = np.floor((tymax - store.y[nodes]) / pixel).astype(np.int64)
+        splat_disks(image, px, py, self.atlas.tier_colors()[store.tier_codes[nodes]], radius)
+
+        tile = Image.fromarray(image)
+        if z >= self.label_zoom and len(nodes):
+            draw = ImageDraw.Draw(tile)
+            viewport = (txmin, txmax, tymin, tymax)
+            for i in self.atlas.label_indices(viewport, self.tile_labels):
+                lx = (store.x[i] - txmin) / pixel + radius + 2
+                ly = (tymax - store.y[i]) / pixel - radius - 10
+                draw.text((lx, ly), store.names[i], fill=(255, 255, 255))
+
+        return encode_png(tile)
+
+    def _background(self, xmin, ymax, pixel):
+        """(size, size, 3) uint8 drift gradient, boundary and grid rings"""
+        size = self.tile_size
+        centers = (np.arange(size) + 0.5) * pixel
+        X = xmin + centers[None, :]
+        Y = ymax - centers[:, None]
+        distance = np.sqrt(X ** 2 + Y ** 2)
+
+        # Drift gradient at 30% over black inside the unit square, as in visualize()
+        stops = np.array([hex_rgb(self.atlas.colors[tier]) for tier in TIERS], dtype=np.float64)
+        level = np.clip(distance / np.sqrt(2), 0, 1)
+        rgb = np.stack([np.interp(level, [0, 0.5, 1], stops[:, c]) for c in range(3)], axis=-1)
+        inside = (np.abs(X) <= 1) & (np.abs(Y) <= 1)
+        image = np.where(inside[..., None], 0.3 * rgb, 0.0)
+
+        # Boundary circle and faint grid rings, about one pixel wide at any zoom
+        width = max(pixel, 0.004)
+        for ring, alpha in ((1.0, 0.5), (0.25, 0.2), (0.5, 0.2), (0.75, 0.2)):
+            on_ring = np.abs(distance - ring) < width
+            image[on_ring] = image[on_ring] * (1 - alpha) + 255 * alpha
+
+        return image.astype(np.uint8)
+
+    def _marker_radius(self, z):
+        """Marker radius in pixels, growing with zoom"""
+        return min(1 + z // 2, 6)
+
+    def _read_manifest(self, count):
+        """Nodes already included in the cached pyramid (clears a stale one)"""
+        try:
+            with open(os.path.join(self.cache_dir, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            manifest = None
+
+        # The cached tiles must have been drawn from this atlas's first nodes
+        self._digest = _ContentDigest()
+        if manifest is not None and manifest.get("style") == self._style and manifest.get("nodes", 0) <= count:
+            self._digest.update(self.atlas.store, manifest["nodes"])
+            if self._digest.hexdigest() == manifest.get("digest"):
+                return manifest["nodes"]
+
+        # Nothing cached can be trusted, and an empty pyramid has nothing to invalidate
+        self._remove_pyramid()
+        self._digest = _ContentDigest()
+        return count
+
+    def _write_manifest(self):
+        """Record the style, node count and node digest the pyramid reflects"""
+        manifest = {"style": self._style, "nodes": self._synced, "digest": self._digest.hexdigest()}
+        _write_atomic(os.path.join(self.cache_dir, "manifest.json"), json.dumps(manifest).encode("utf-8"))
+
+
+class _ContentDigest:
+    """
+    Running blake2b digest of the node columns a pyramid was drawn from
+
+    Each column is hashed as one stream, so the digest of the first N nodes
+    is the same however many syncs they were added over.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._streams = [hashlib.blake2b(digest_size=16) for _ in range(5)]
+
+    def update(self, store, stop):
+        """Add nodes count to stop of a store"""
+        start = self.count
+        names = store.names
+        columns = (store.x[start:stop], store.y[start:stop], store.tier_codes[start:stop],
+                   np.diff(names.offsets[start:stop + 1]), names.encoded(start, stop))
+        for stream, column in zip(self._streams, columns):
+            stream.update(column if isinstance(column, bytes) else np.ascontiguousarray(column).tobytes())
+        self.count = stop
+
+    def hexdigest(self):
+        """Digest of every node added so far"""
+        combined = hashlib.blake2b(digest_size=16)
+        for stream in self._streams:
+            combined.update(stream.digest())
+        return combined.hexdigest()
+
+
+def _write_atomic(path, data):
+    """Write bytes through a temporary file so readers never see partial tiles"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path)
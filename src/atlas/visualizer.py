@@ -3,15 +3,24 @@ Drift Atlas Visualizer - 2D visualization of ethical drift space
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-import io
 import base64
+import csv
 from pathlib import Path
 import os
 
-# Create output directory
-os.makedirs("output/atlas", exist_ok=True)
+from .raster import encode_png, font, hex_rgb, splat_disks, static_layer, to_pixels
+from .spatial import GridIndex
+from .store import TIERS, NodeStore, tier_severity
+
+# matplotlib and Pillow are imported on first render so importing this module stays cheap
+
+# Default view of the atlas, with room for the cardinal labels and title
+DEFAULT_VIEWPORT = (-1.3, 1.3, -1.3, 1.3)
+
+# Unindexed nodes scanned by every query before the grid is rebuilt:
+# at least INDEX_TAIL_MIN, or this fraction of the indexed nodes
+INDEX_TAIL_MIN = 1024
+INDEX_TAIL_FRACTION = 1 / 32
 
 class DriftAtlas:
     """
@@ -20,21 +29,15 @@ class DriftAtlas:
     
     def __init__(self):
         """Initialize the Drift Atlas"""
-        self.nodes = []
+        self.store = NodeStore()
+        self._index = None
+        self._index_version = -1
         self.colors = {
             "safe": "#00ff77",  # Green
             "caution": "#ffcc00",  # Yellow
             "critical": "#ff4500"  # Red-orange
         }
-        
-        # Create a custom colormap for the drift space
-        self.colormap = LinearSegmentedColormap.from_list(
-            "drift_cmap", 
-            [(0, self.colors["safe"]), 
-             (0.5, self.colors["caution"]), 
-             (1.0, self.colors["critical"])],
-            N=100
-        )
+        self._colormap = None
         
         # Define glyph symbols for each region
         self.symbols = {
@@ -43,6 +46,64 @@ class DriftAtlas:
             "critical": "⊻" # Divergence
         }
     
+    @property
+    def colormap(self):
+        """Custom colormap for the drift space, built on first use"""
+        if self._colormap is None:
+            from matplotlib.colors import LinearSegmentedColormap
+            
+            self._colormap = LinearSegmentedColormap.from_list(
+                "drift_cmap", 
+                [(0, self.colors["safe"]), 
+                 (0.5, self.colors["caution"]), 
+                 (1.0, self.colors["critical"])],
+                N=100
+            )
+        return self._colormap
+    
+    @property
+    def nodes(self):
+        """Nodes as a list of dictionaries (builds one dict per node)"""
+        return [self.node(i) for i in range(len(self.store))]
+    
+    def node(self, i):
+        """Node i as a dictionary"""
+        store = self.store
+        tier = store.tiers[store.tier_codes[i]]
+        return {
+            "name": store.names[i],
+            "x": float(store.x[i]),
+            "y": float(store.y[i]),
+            "tier": tier,
+            "description": store.descriptions[i],
+            "symbol": self.symbols.get(tier, "◇")
+        }
+    
+    def tier_colors(self):
+        """(len(store.tiers), 3) uint8 RGB of each tier code, white for unknown tiers"""
+        return np.array([hex_rgb(self.colors.get(tier, "#ffffff")) for tier in self.store.tiers],
+                        dtype=np.uint8)
+    
+    @property
+    def index(self):
+        """
+        Grid spatial index over the nodes
+        
+        Added nodes join the index's scanned tail, and the grid is only
+        rebuilt once the tail outgrows INDEX_TAIL_FRACTION of it, so adding
+        a node before each query stays cheap.
+        """
+        store = self.store
+        if self._index_version != store.version:
+            index = self._index
+            if index is None or len(store) < len(index) or (
+                    len(store) - len(index.order) > max(INDEX_TAIL_MIN, INDEX_TAIL_FRACTION * len(index.order))):
+                self._index = GridIndex(store.x, store.y)
+            else:
+                index.extend(store.x, store.y)
+            self._index_version = store.version
+        return self._index
+    
     def add_node(self, name, x, y, tier="safe", description=""):
         """
         Add a node to the atlas
@@ -53,28 +114,241 @@ class DriftAtlas:
             tier: Safety tier ('safe', 'caution', 'critical')
             description: Description of the node
         """
-        self.nodes.append({
-            "name": name,
-            "x": x,
-            "y": y,
-            "tier": tier,
-            "description": description,
-            "symbol": self.symbols.get(tier, "◇")
-        })
+        self.store.append(name, x, y, tier, description)
+    
+    def add_nodes_bulk(self, nodes, chunk_size=65536):
+        """
+        Add many nodes at once
+        
+        Args:
+            nodes: One of
+                - a CSV path or open text file with a header row naming
+                  name, x, y, tier and optionally description columns
+                - a NumPy structured array or a dict of columns with the
+                  same fields
+                - an (N, 2) or (N, 3) numeric array of x, y and optional
+                  tier codes, for unnamed nodes
+            chunk_size: Rows parsed per batch when reading CSV
+            
+        Returns:
+            Range of the new node indices
+        """
+        start = len(self.store)
+        if isinstance(nodes, (str, os.PathLike)):
+            with open(nodes, newline="", encoding="utf-8") as f:
+                self._extend_csv(f, chunk_size)
+        elif hasattr(nodes, "read"):
+            self._extend_csv(nodes, chunk_size)
+        elif isinstance(nodes, dict) or getattr(getattr(nodes, "dtype", None), "names", None):
+            self._extend_columns(nodes)
+        else:
+            array = np.asarray(nodes, dtype=np.float64)
+            if array.ndim != 2 or array.shape[1] not in (2, 3):
+                raise ValueError("Numeric node arrays must have shape (N, 2) or (N, 3)")
+            tiers = array[:, 2].astype(np.int64) if array.shape[1] == 3 else np.zeros(len(array), dtype=np.int64)
+            self.store.extend([""] * len(array), array[:, 0], array[:, 1], tiers)
+        return range(start, len(self.store))
+    
+    def _extend_columns(self, columns, context="Node columns"):
+        """Append nodes from a mapping or structured array of columns"""
+        fields = columns.keys() if isinstance(columns, dict) else columns.dtype.names
+        missing = [field for field in ("name", "x", "y", "tier") if field not in fields]
+        if missing:
+            raise ValueError(f"{context} missing field: {missing[0]}")
+        
+        names = np.asarray(columns["name"]).astype(str).tolist()
+        descriptions = None
+        if "description" in fields:
+            descriptions = np.asarray(columns["description"]).astype(str).tolist()
+        self.store.extend(names, columns["x"], columns["y"], columns["tier"], descriptions)
+    
+    def _extend_csv(self, f, chunk_size):
+        """Append nodes from CSV text, a chunk of rows at a time"""
+        reader = csv.reader(f)
+        header = [field.strip() for field in next(reader, [])]
+        chunk = []
+        for row in reader:
+            if row:
+                chunk.append(row)
+            if len(chunk) == chunk_size:
+                self._extend_csv_rows(header, chunk)
+                chunk = []
+        if chunk:
+            self._extend_csv_rows(header, chunk)
+    
+    def _extend_csv_rows(self, header, rows):
+        """Append one chunk of parsed CSV rows"""
+        if any(len(row) != len(header) for row in rows):
+            raise ValueError(f"CSV rows must have {len(header)} fields")
+        self._extend_columns(dict(zip(header, zip(*rows))), context="CSV header")
     
-    def visualize(self, output_path=None):
+    def nearest(self, x, y, k=5):
+        """
+        Find the nodes closest to a point
+        
+        Args:
+            x, y: Query point
+            k: Number of neighbors
+            
+        Returns:
+            (indices, distances) arrays, nearest first
+        """
+        return self.index.nearest(x, y, k)
+    
+    def within_radius(self, x, y, radius):
+        """
+        Find the nodes within a distance of a point
+        
+        Args:
+            x, y: Query point
+            radius: Search radius
+            
+        Returns:
+            Sorted array of node indices
+        """
+        return self.index.query_radius(x, y, radius)
+    
+    def tier_counts(self, region=DEFAULT_VIEWPORT, bins=None):
+        """
+        Count the nodes of each tier in a region
+        
+        Args:
+            region: (xmin, xmax, ymin, ymax) to count in
+            bins: Split the region into a bins x bins grid of cells
+                (default: count the region as a whole)
+                
+        Returns:
+            {tier: count} for the whole region, or with bins a
+            (bins, bins, len(store.tiers)) int64 array indexed by
+            [row from ymin, column from xmin, tier code]
+        """
+        xmin, xmax, ymin, ymax = region
+        inside = self.index.query_box(xmin, xmax, ymin, ymax)
+        codes = self.store.tier_codes[inside]
+        tiers = self.store.tiers
+        if bins is None:
+            counts = np.bincount(codes, minlength=len(tiers))
+            return {tier: int(count) for tier, count in zip(tiers, counts)}
+        
+        col = np.clip(((self.store.x[inside] - xmin) / (xmax - xmin) * bins).astype(np.int64), 0, bins - 1)
+        row = np.clip(((self.store.y[inside] - ymin) / (ymax - ymin) * bins).astype(np.int64), 0, bins - 1)
+        flat = (row * bins + col) * len(tiers) + codes
+        return np.bincount(flat, minlength=bins * bins * len(tiers)).reshape(bins, bins, len(tiers))
+    
+    def label_indices(self, viewport=DEFAULT_VIEWPORT, max_labels=200):
+        """
+        Choose which nodes in a viewport get labels
+        
+        When more nodes are visible than the label budget, the viewport is
+        divided into about max_labels cells and each cell labels one node,
+        preferring the most severe tier. Zooming in shrinks the cells, so
+        more of the nodes in view get their labels.
+        
+        Args:
+            viewport: (xmin, xmax, ymin, ymax) of the view
+            max_labels: Maximum number of labeled nodes
+            
+        Returns:
+            Sorted array of node indices to label
+        """
+        xmin, xmax, ymin, ymax = viewport
+        visible = self.index.query_box(xmin, xmax, ymin, ymax)
+        if len(visible) <= max_labels:
+            return visible
+        
+        side = max(1, int(np.sqrt(max_labels)))
+        col = np.clip(((self.store.x[visible] - xmin) / (xmax - xmin) * side).astype(np.int64), 0, side - 1)
+        row = np.clip(((self.store.y[visible] - ymin) / (ymax - ymin) * side).astype(np.int64), 0, side - 1)
+        cell = row * side + col
+        
+        # Order by cell, then most severe tier, then insertion order
+        severity = -tier_severity(self.store.tier_codes[visible])
+        order = np.lexsort((visible, severity, cell))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = cell[order][1:] != cell[order][:-1]
+        return np.sort(visible[order][first])
+    
+    def visualize(self, output_path=None, viewport=None, max_labels=200, size=12, dpi=100):
         """
         Generate a visualization of the Drift Atlas
         
+        The gradient, rings, cardinal glyphs and title never change, so they
+        are rasterized once per size, dpi, viewport and colormap and cached;
+        each call only composites the nodes in view on top with Pillow.
+        
         Args:
             output_path: Path to save the visualization (optional)
+            viewport: (xmin, xmax, ymin, ymax) to show (default: whole atlas)
+            max_labels: Maximum number of node labels, chosen by label_indices
+            size: Image width and height in inches
+            dpi: Pixels per inch
             
         Returns:
             Path to the saved visualization or base64 encoded image if no path
         """
-        # Set up figure
-        fig, ax = plt.subplots(figsize=(12, 12), facecolor='black')
-        ax.set_facecolor('black')
+        from PIL import Image, ImageDraw
+        
+        if viewport is None:
+            viewport = DEFAULT_VIEWPORT
+        xlim, ylim = tuple(viewport[:2]), tuple(viewport[2:])
+        
+        background = static_layer(("drift_atlas", tuple(self.colors.items())), self._draw_background,
+                                  size, dpi, xlim, ylim)
+        image = background.copy()
+        height, width = image.shape[:2]
+        
+        # Add nodes in view, least severe tier first; markers shrink as the
+        # view fills up (scatter areas in points², as radii in pixels)
+        store = self.store
+        visible = self.index.query_box(*viewport)
+        visible = visible[np.argsort(tier_severity(store.tier_codes[visible]), kind="stable")]
+        marker_size = float(np.clip(100 * 1000 / max(len(visible), 1), 0.5, 100))
+        radius = int(round(np.sqrt(marker_size) / 2 * dpi / 72))
+        
+        px, py = to_pixels(store.x[visible], store.y[visible], xlim, ylim, width, height)
+        splat_disks(image, np.floor(px).astype(np.int64), np.floor(py).astype(np.int64),
+                    self.tier_colors()[store.tier_codes[visible]], radius)
+        
+        # Label the level-of-detail subset on a transparent layer
+        canvas = Image.fromarray(image).convert("RGBA")
+        labels = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(labels)
+        name_font = font(10 * dpi / 72)
+        symbol_font = font(16 * dpi / 72)
+        pad = 3 * dpi / 72
+        
+        colors = self.tier_colors()
+        for i in self.label_indices(viewport, max_labels):
+            tier = store.tiers[store.tier_codes[i]]
+            color = tuple(colors[store.tier_codes[i]].tolist())
+            x, y = store.x[i], store.y[i]
+            
+            # Add node name with background for readability
+            lx, ly = to_pixels(x + 0.05, y + 0.05, xlim, ylim, width, height)
+            left, top, right, bottom = draw.textbbox((lx, ly), store.names[i], font=name_font, anchor="ls")
+            draw.rectangle((left - pad, top - pad, right + pad, bottom + pad),
+                           fill=(0, 0, 0, 178), outline=color + (255,))
+            draw.text((lx, ly), store.names[i], fill=(255, 255, 255, 255), font=name_font, anchor="ls")
+            
+            # Add the symbolic glyph
+            sx, sy = to_pixels(x, y, xlim, ylim, width, height)
+            draw.text((sx, sy), self.symbols.get(tier, "◇"), fill=color + (255,), font=symbol_font, anchor="mm")
+        
+        png = encode_png(Image.alpha_composite(canvas, labels).convert("RGB"))
+        
+        # Save or return the image
+        if output_path:
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+            with open(output_path, "wb") as f:
+                f.write(png)
+            return output_path
+        else:
+            image_base64 = base64.b64encode(png).decode('utf-8')
+            return f"data:image/png;base64,{image_base64}"
+    
+    def _draw_background(self, ax):
+        """Draw the static layers of the atlas: gradient, rings, glyphs and title"""
+        from matplotlib.patches import Circle
         
         # Draw background gradient representing drift potential
         x = np.linspace(-1, 1, 100)
@@ -88,29 +362,6 @@ class DriftAtlas:
         theta = np.linspace(0, 2*np.pi, 100)
         ax.plot(np.cos(theta), np.sin(theta), color='white', alpha=0.5, linewidth=2)
         
-        # Add nodes
-        for node in self.nodes:
-            color = self.colors.get(node["tier"], "white")
-            ax.plot(node["x"], node["y"], 'o', markersize=10, color=color)
-            
-            # Add node name with background for readability
-            ax.text(
-                node["x"] + 0.05, node["y"] + 0.05, 
-                node["name"], 
-                color='white',
-                fontsize=10,
-                bbox=dict(facecolor='black', alpha=0.7, edgecolor=color)
-            )
-            
-            # Add the symbolic glyph
-            ax.text(
-                node["x"], node["y"], 
-                node["symbol"],
-                color=color,
-                fontsize=16,
-                ha='center', va='center'
-            )
-        
         # Add cardinal direction glyphs
         cardinal_points = [
             (0, 1, "◇", "Alignment"),
@@ -157,16 +408,9 @@ class DriftAtlas:
             fontstyle='italic'
         )
         
-        # Set axis properties
-        ax.set_xlim(-1.3, 1.3)
-        ax.set_ylim(-1.3, 1.3)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
         # Add subtle grid lines
         for r in [0.25, 0.5, 0.75, 1.0]:
-            circle = plt.Circle((0, 0), r, fill=False, color='white', alpha=0.2, linestyle='-')
-            ax.add_artist(circle)
+            ax.add_patch(Circle((0, 0), r, fill=False, color='white', alpha=0.2, linestyle='-'))
             
         for angle in np.linspace(0, np.pi, 9):
             ax.plot(
@@ -177,22 +421,6 @@ class DriftAtlas:
                 [0, np.cos(angle+np.pi)], [0, np.sin(angle+np.pi)],
                 color='white', alpha=0.1, linestyle='-'
             )
-        
-        # Save or return the figure
-        if output_path:
-            plt.savefig(output_path, bbox_inches='tight', facecolor='black')
-            plt.close()
-            return output_path
-        else:
-            # Save to buffer and return as base64
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', bbox_inches='tight', facecolor='black')
-            plt.close()
-            
-            # Convert to base64
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-            return f"data:image/png;base64,{image_base64}"
     
     def add_sample_nodes(self):
         """Add sample nodes to demonstrate the atlas"""
@@ -0,0 +1,230 @@
+"""
+Digest Cache - Two-tier content-addressed storage shared by Crownbridge caches
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+class DigestCache:
+    """
+    Two-tier cache of byte values keyed on content digests.
+
+    Entries live in an in-memory LRU tier and, optionally, as files in an
+    on-disk tier. Because keys are content digests, the disk tier can be
+    shared between processes.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=256,
+                 max_disk_bytes=64 * 1024 * 1024, suffix=".bin", max_memory_bytes=None):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory of the on-disk tier (None for memory only)
+            max_entries: Maximum number of entries held in memory
+            max_disk_bytes: Maximum total size of the on-disk tier
+            suffix: File extension of on-disk entries
+            max_memory_bytes: Maximum total size of the memory tier
+                (None for no bound beyond max_entries)
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.suffix = suffix
+        self.max_memory_bytes = max_memory_bytes
+
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = None  # Measured on first disk write
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def path(self, key):
+        """Path of an entry in the on-disk tier"""
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{key}{self.suffix}")
+
+    def get(self, key):
+        """
+        Look up an entry
+
+        Args:
+            key: Content digest
+
+        Returns:
+            Stored bytes, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return self._memory[key]
+
+        path = self.path(key)
+        if path is not None:
+            try:
+                with open(path, "rb") as f:
+                    value = f.read()
+            except OSError:
+                value = None
+
+            if value is not None:
+                # Refresh the modification time so disk eviction stays LRU
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._remember(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """
+        Store an entry in both tiers
+
+        Args:
+            key: Content digest
+            value: Bytes to store
+        """
+        with self._lock:
+            self._remember(key, value)
+
+        path = self.path(key)
+        if path is not None and not os.path.exists(path):
+            self._write(path, value)
+
+    def materialize(self, key, value):
+        """
+        Path of an entry's file, rewriting it if the disk tier dropped it
+
+        Args:
+            key: Content digest
+            value: Bytes stored under the key
+
+        Returns:
+            Path of an existing file holding value (None for memory only)
+        """
+        path = self.path(key)
+        if path is None:
+            return None
+        try:
+            # Refresh the modification time so disk eviction stays LRU
+            os.utime(path)
+        except FileNotFoundError:
+            self._write(path, value)
+        return path
+
+    def _write(self, path, value):
+        """Write an entry to the disk tier and enforce its bound"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write atomically so concurrent readers never see partial files
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._measure_disk()
+            else:
+                self._disk_bytes += len(value)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk(keep=path)
+
+    def stats(self):
+        """Return hit/miss counters and tier sizes"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes or 0,
+            }
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for path, _, _ in self._disk_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._disk_bytes = 0
+
+    def _remember(self, key, value):
+        """Insert into the memory tier, evicting least recently used entries"""
+        # A value larger than the whole tier is only kept on disk
+        if self.max_memory_bytes is not None and len(value) > self.max_memory_bytes:
+            return
+
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory[key])
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        self._memory_bytes += len(value)
+        while len(self._memory) > self.max_entries or (
+                self.max_memory_bytes is not None and self._memory_bytes > self.max_memory_bytes):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _disk_entries(self):
+        """List (path, size, mtime) of every file in the on-disk tier"""
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return []
+
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.suffix):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _measure_disk(self):
+        """Total size of the on-disk tier"""
+        return sum(size for _, size, _ in self._disk_entries())
+
+    def _evict_disk(self, keep=None):
+        """
+        Remove least recently used files until the disk tier fits its bound
+
+        Args:
+            keep: Path never removed, so an entry just written survives even
+                when it alone exceeds the bound
+        """
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        self._disk_bytes = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._disk_bytes -= size
+            self.evictions += 1
@@ -0,0 +1,42 @@
+"""
+Concurrency - Process pool and asyncio helpers shared by Crownbridge modules
+"""
+
+import asyncio
+import multiprocessing
+
+
+def worker_context():
+    """
+    Multiprocessing context that is safe to use alongside threads
+
+    Forking a process that runs other threads can copy held locks into the
+    child, so pools start their workers with forkserver, or spawn where
+    forkserver is unavailable.
+
+    Returns:
+        multiprocessing context for ProcessPoolExecutor's mp_context
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def loop_semaphore(semaphores, limit):
+    """
+    Semaphore limiting concurrency on the running event loop
+
+    Semaphores bind to the loop they first wait on, so callers keep one per
+    loop in a weakref.WeakKeyDictionary that drops closed loops' entries.
+
+    Args:
+        semaphores: WeakKeyDictionary mapping event loops to semaphores
+        limit: Concurrency allowed by a newly created semaphore
+
+    Returns:
+        asyncio.Semaphore for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = semaphores.get(loop)
+    if semaphore is None:
+        semaphore = semaphores[loop] = asyncio.Semaphore(limit)
+    return semaphore
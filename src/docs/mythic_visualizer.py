@@ -3,15 +3,10 @@ Mythic Documentation Visualizer - Generates visual representations of Crownbridg
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, RegularPolygon
-import matplotlib.path as mpath
-import matplotlib.patches as mpatches
 from pathlib import Path
 import os
 
-# Create output directory
-os.makedirs("output/docs", exist_ok=True)
+# matplotlib is imported on first render so importing this module stays cheap
 
 class MythicVisualizer:
     """
@@ -51,12 +46,53 @@ class MythicVisualizer:
         if concept not in self.symbols:
             raise ValueError(f"Unknown concept: {concept}. Must be one of {list(self.symbols.keys())}")
         
+        import matplotlib.pyplot as plt
+        
         # Default output path
         if output_path is None:
             output_path = f"output/docs/{concept}_concept.png"
+            os.makedirs("output/docs", exist_ok=True)
         
         # Create figure with black background
         fig, ax = plt.subplots(figsize=(10, 10), facecolor='black')
+        self._draw_concept(ax, concept)
+        
+        # Save figure
+        fig.savefig(output_path, bbox_inches='tight', facecolor='black')
+        plt.close(fig)
+        
+        return output_path
+    
+    def render_all_concepts(self, output_dir="output/docs"):
+        """
+        Create visualizations of all four concepts on one reused figure
+        
+        Args:
+            output_dir: Directory the {concept}_concept.png files are saved in
+            
+        Returns:
+            Dictionary mapping each concept to its saved path
+        """
+        import matplotlib.pyplot as plt
+        
+        os.makedirs(output_dir, exist_ok=True)
+        fig, ax = plt.subplots(figsize=(10, 10), facecolor='black')
+        
+        # Clearing the axes keeps the figure and canvas between concepts
+        paths = {}
+        try:
+            for concept in self.symbols:
+                ax.clear()
+                self._draw_concept(ax, concept)
+                paths[concept] = os.path.join(output_dir, f"{concept}_concept.png")
+                fig.savefig(paths[concept], bbox_inches='tight', facecolor='black')
+        finally:
+            plt.close(fig)
+        
+        return paths
+    
+    def _draw_concept(self, ax, concept):
+        """Draw a concept, its title and description on empty axes"""
         ax.set_facecolor('black')
         
         # Remove axes
@@ -93,35 +129,30 @@ class MythicVisualizer:
         
         ax.text(0, -1.1, descriptions.get(concept, ""), fontsize=14,
                 color=self.colors["text"], ha='center', va='center', fontstyle='italic')
-        
-        # Save figure
-        plt.savefig(output_path, bbox_inches='tight', facecolor='black')
-        plt.close(fig)
-        
-        return output_path
     
     def _create_divergence_visual(self, ax, color, symbol):
         """Create visualization for divergence concept"""
+        from matplotlib.collections import LineCollection
+        
         # Central point
         ax.scatter(0, 0, s=100, color=color, zorder=10)
         
-        # Diverging lines
+        # Diverging lines, one row of points per ray
         angles = np.linspace(0, 2*np.pi, 8, endpoint=False)
-        for angle in angles:
-            # Create diverging path with varying width
-            x = np.linspace(0, 0.9*np.cos(angle), 100)
-            y = np.linspace(0, 0.9*np.sin(angle), 100)
-            
-            # Add some waviness to the lines
-            frequency = 10
-            amplitude = 0.03
-            y_wave = y + amplitude * np.sin(frequency * x)
-            x_wave = x + amplitude * np.sin(frequency * y)
-            
-            # Plot with gradient alpha
-            alphas = np.linspace(1, 0.3, len(x))
-            for i in range(len(x)-1):
-                ax.plot(x_wave[i:i+2], y_wave[i:i+2], color=color, alpha=alphas[i], linewidth=3)
+        x = np.linspace(0, 0.9*np.cos(angles), 100, axis=1)
+        y = np.linspace(0, 0.9*np.sin(angles), 100, axis=1)
+        
+        # Add some waviness to the lines
+        frequency = 10
+        amplitude = 0.03
+        y_wave = y + amplitude * np.sin(frequency * x)
+        x_wave = x + amplitude * np.sin(frequency * y)
+        
+        # All ray segments in one collection, with alpha fading outwards
+        alphas = np.linspace(1, 0.3, x.shape[1])[:-1]
+        ax.add_collection(LineCollection(_segments(x_wave, y_wave),
+                                         colors=_rgba(color, np.tile(alphas, len(angles))),
+                                         linewidth=3, capstyle='projecting'))
         
         # Add symbol at center
         ax.text(0, 0, symbol, fontsize=40, color=color, 
@@ -129,18 +160,16 @@ class MythicVisualizer:
     
     def _create_recursion_visual(self, ax, color, symbol):
         """Create visualization for recursion concept"""
-        # Create nested triangles
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection, PolyCollection
+        
+        # Create nested triangles, each turned a little further
         levels = 5
-        for i in range(levels):
-            scale = 0.9 - i * 0.15
-            alpha = 1 - i * 0.15
-            
-            # Create triangle
-            triangle = RegularPolygon((0, 0), numVertices=3, radius=scale,
-                                     orientation=i*np.pi/8,
-                                     facecolor='none', edgecolor=color,
-                                     alpha=alpha, linewidth=2)
-            ax.add_patch(triangle)
+        scales = 0.9 - np.arange(levels) * 0.15
+        alphas = 1 - np.arange(levels) * 0.15
+        ax.add_collection(PolyCollection(_regular_polygons(3, scales, np.arange(levels) * np.pi/8),
+                                         facecolors='none', edgecolors=_rgba(color, alphas),
+                                         linewidths=2))
         
         # Add spiral in the center
         theta = np.linspace(0, 6*np.pi, 1000)
@@ -148,16 +177,98 @@ class MythicVisualizer:
         x = r * np.cos(theta)
         y = r * np.sin(theta)
         
-        # Plot with gradient color
-        points = np.array([x, y]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        
-        from matplotlib.collections import LineCollection
-        lc = LineCollection(segments, cmap=plt.get_cmap('viridis'),
-                           linewidth=3, alpha=0.7)
-        lc.set_array(theta)
+        # Plot with gradient color, one value per segment
+        lc = LineCollection(_segments(x[None], y[None]), cmap=plt.get_cmap('viridis'),
+                            linewidth=3, alpha=0.7)
+        lc.set_array(theta[:-1])
         ax.add_collection(lc)
         
         # Add symbol
         ax.text(0, 0, symbol, fontsize=40, color=color, 
-                ha='center', va='center
+                ha='center', va='center', fontweight='bold')
+    
+    def _create_alignment_visual(self, ax, color, symbol):
+        """Create visualization for alignment concept"""
+        from matplotlib.collections import LineCollection, PolyCollection
+        
+        # Nested diamonds, brightening toward the shared center
+        scales = np.linspace(0.9, 0.2, 6)
+        ax.add_collection(PolyCollection(_regular_polygons(4, scales, np.zeros(len(scales))),
+                                         facecolors='none', edgecolors=_rgba(color, np.linspace(0.3, 1, 6)),
+                                         linewidths=2))
+        
+        # Waves from the rim that settle as they converge on the center
+        angles = np.linspace(0, 2*np.pi, 12, endpoint=False)
+        t = np.linspace(1, 0.15, 100)
+        swing = 0.25 * t * np.sin(6 * np.pi * t)
+        r = t[None, :]
+        phi = angles[:, None] + swing[None, :]
+        x, y = r * np.cos(phi), r * np.sin(phi)
+        
+        alphas = np.linspace(0.2, 0.9, len(t))[:-1]
+        ax.add_collection(LineCollection(_segments(x, y), colors=_rgba(color, np.tile(alphas, len(angles))),
+                                         linewidth=2, capstyle='round'))
+        
+        # Add symbol
+        ax.text(0, 0, symbol, fontsize=40, color=color, 
+                ha='center', va='center', fontweight='bold')
+    
+    def _create_completion_visual(self, ax, color, symbol):
+        """Create visualization for completion concept"""
+        from matplotlib.collections import LineCollection, PolyCollection
+        
+        # Concentric filled rings that deepen toward the closed center
+        radii = np.linspace(0.9, 0.3, 5)
+        ax.add_collection(PolyCollection(_regular_polygons(120, radii, np.zeros(len(radii))),
+                                         facecolors=_rgba(color, np.full(len(radii), 0.08)),
+                                         edgecolors=_rgba(color, np.linspace(0.4, 1, len(radii))),
+                                         linewidths=2))
+        
+        # Spokes gathering every path into the center
+        angles = np.linspace(0, 2*np.pi, 24, endpoint=False)
+        r = np.linspace(0.9, 0.3, 50)
+        x = r[None, :] * np.cos(angles)[:, None]
+        y = r[None, :] * np.sin(angles)[:, None]
+        
+        alphas = np.linspace(0.1, 0.8, len(r))[:-1]
+        ax.add_collection(LineCollection(_segments(x, y), colors=_rgba(color, np.tile(alphas, len(angles))),
+                                         linewidth=1.5))
+        
+        # Add symbol
+        ax.text(0, 0, symbol, fontsize=40, color=color, 
+                ha='center', va='center', fontweight='bold')
+
+
+def _segments(x, y):
+    """
+    Line segments joining consecutive points of each path
+    
+    Args:
+        x, y: (paths, points) coordinates
+        
+    Returns:
+        (paths * (points - 1), 2, 2) segment array, path by path
+    """
+    points = np.stack([x, y], axis=-1)
+    return np.stack([points[:, :-1], points[:, 1:]], axis=2).reshape(-1, 2, 2)
+
+
+def _rgba(color, alphas):
+    """(N, 4) RGBA rows of one color at N alphas"""
+    from matplotlib.colors import to_rgba
+    
+    rgba = np.tile(to_rgba(color), (len(alphas), 1))
+    rgba[:, 3] = alphas
+    return rgba
+
+
+def _regular_polygons(sides, radii, orientations):
+    """
+    Vertices of centered regular polygons, oriented like RegularPolygon
+    
+    Returns:
+        (len(radii), sides, 2) vertex array
+    """
+    angles = np.pi/2 + np.asarray(orientations)[:, None] + 2*np.pi * np.arange(sides)[None, :] / sides
+    radii = np.asarray(radii)[:, None]
+    return np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=-1)
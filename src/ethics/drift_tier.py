@@ -3,6 +3,7 @@ Drift Tier Protocol - Ethical boundary monitoring system
 """
 
 import numpy as np
+from collections import deque
 
 class DriftMonitor:
     """Monitor and classify drift patterns in AI outputs"""
@@ -12,6 +13,33 @@ class DriftMonitor:
         'caution': 0.6,
         'critical': 0.9
     }
+    
+    # Matrix elements processed together by assess_batch
+    BATCH_BLOCK_SIZE = 1 << 16
+    
+    # Tier codes returned by assess_batch index into this tuple
+    TIERS = ('safe', 'caution', 'critical')
+    
+    TIER_DETAILS = (
+        {
+            'tier': 'safe', 
+            'description': 'Within ethical boundaries',
+            'color': '#00ff77',
+            'symbol': '◇'  # Harmony
+        },
+        {
+            'tier': 'caution', 
+            'description': 'Approaching boundary conditions',
+            'color': '#ffcc00',
+            'symbol': '∇'  # Recursion/reflection required
+        },
+        {
+            'tier': 'critical', 
+            'description': 'Exceeding ethical parameters',
+            'color': '#ff4500',
+            'symbol': '⊻'  # Divergence detected
+        }
+    )
 
     def assess_risk(self, glyph_pattern):
         """
@@ -25,6 +53,30 @@ class DriftMonitor:
         """
         entropy = self._calculate_pattern_entropy(glyph_pattern)
         return self._classify_tier(entropy)
+    
+    def assess_batch(self, attention, return_entropy=False):
+        """
+        Evaluate risk tiers of many attention matrices in one pass
+        
+        Args:
+            attention: Array whose last two axes are attention matrices,
+                e.g. (N, H, W) or (layers, heads, T, T)
+            return_entropy: Also return the normalized entropies
+            
+        Returns:
+            uint8 array of tier codes shaped like attention.shape[:-2],
+            indexing into TIERS; with return_entropy, a tuple of
+            (codes, entropies)
+        """
+        entropy = self._calculate_batch_entropy(attention)
+        codes = self._classify_codes(entropy)
+        if return_entropy:
+            return codes, entropy
+        return codes
+    
+    def describe_tier(self, code):
+        """Return the tier dictionary for a tier code from assess_batch"""
+        return dict(self.TIER_DETAILS[int(code)])
         
     def _calculate_pattern_entropy(self, pattern):
         """Calculate entropy of glyph pattern"""
@@ -36,30 +88,147 @@ class DriftMonitor:
             return entropy / np.log2(len(pattern_flat))  # Normalized entropy
         
         return 0.5  # Default value for non-array inputs
+    
+    def _calculate_batch_entropy(self, attention):
+        """Calculate normalized entropy over the last two axes"""
+        attention = np.asarray(attention, dtype=np.float64)
+        if attention.ndim < 2:
+            raise ValueError(f"Expected at least 2 dimensions, got shape {attention.shape}")
+        
+        # Flatten each matrix into one row
+        size = attention.shape[-2] * attention.shape[-1]
+        flat = attention.reshape(-1, size)
+        entropy = np.empty(len(flat))
+        
+        # Work through blocks of rows small enough to stay in cache
+        rows = max(1, self.BATCH_BLOCK_SIZE // size)
+        for start in range(0, len(flat), rows):
+            block = flat[start:start + rows]
+            pattern_norm = block / block.sum(axis=-1, keepdims=True)
+            terms = pattern_norm + 1e-10
+            np.log2(terms, out=terms)
+            terms *= pattern_norm
+            entropy[start:start + rows] = -terms.sum(axis=-1)
+        
+        entropy /= np.log2(size)  # Normalized entropy
+        return entropy.reshape(attention.shape[:-2])
+    
+    def _classify_codes(self, entropy):
+        """Map entropy values to tier codes"""
+        bins = [self.TIER_THRESHOLDS['safe'], self.TIER_THRESHOLDS['caution']]
+        return np.digitize(entropy, bins).astype(np.uint8)
         
     def _classify_tier(self, entropy):
         """Map entropy value to drift tier"""
-        if entropy < self.TIER_THRESHOLDS['safe']:
-            return {
-                'tier': 'safe', 
-                'description': 'Within ethical boundaries',
-                'color': '#00ff77',
-                'symbol': '◇'  # Harmony
-            }
-        elif entropy < self.TIER_THRESHOLDS['caution']:
-            return {
-                'tier': 'caution', 
-                'description': 'Approaching boundary conditions',
-                'color': '#ffcc00',
-                'symbol': '∇'  # Recursion/reflection required
-            }
+        return self.describe_tier(self._classify_codes(entropy))
+
+class StreamingDriftMonitor(DriftMonitor):
+    """
+    Track drift of an attention matrix while its rows arrive one at a time
+    
+    Normalized entropy is kept up to date from running sums, using
+    H = log2(S) - sum(x * log2(x)) / S for the total weight S, so each
+    update costs O(len(row)) rather than a rescan of the whole matrix.
+    The value matches DriftMonitor up to its 1e-10 smoothing term.
+    """
+    
+    def __init__(self, window=None, on_transition=None):
+        """
+        Initialize the streaming monitor
+        
+        Args:
+            window: Number of most recent rows to assess (None for all rows)
+            on_transition: Callable or list of callables invoked as
+                callback(old_tier, new_tier, step, entropy) whenever the tier
+                changes; old_tier is None for the first assessment
+        """
+        self.window = window
+        if on_transition is None:
+            self.callbacks = []
+        elif callable(on_transition):
+            self.callbacks = [on_transition]
         else:
-            return {
-                'tier': 'critical', 
-                'description': 'Exceeding ethical parameters',
-                'color': '#ff4500',
-                'symbol': '⊻'  # Divergence detected
-            }
+            self.callbacks = list(on_transition)
+        self.reset()
+    
+    def reset(self):
+        """Forget every row seen so far"""
+        self.rows = deque()
+        self.total = 0.0        # Sum of weights
+        self.total_xlogx = 0.0  # Sum of x * log2(x)
+        self.count = 0          # Number of weights
+        self.steps = 0
+        self.entropy = 0.0
+        self.tier = None
+    
+    def add_transition_callback(self, callback):
+        """Register a callable invoked on tier transitions"""
+        self.callbacks.append(callback)
+    
+    def update(self, row):
+        """
+        Add one row of attention weights
+        
+        Args:
+            row: Attention weights of the newest token (any shape)
+            
+        Returns:
+            Tier code of the window after the update, indexing into TIERS
+        """
+        row = np.asarray(row, dtype=np.float64).ravel()
+        positive = row[row > 0]
+        stats = (row.sum(), np.dot(positive, np.log2(positive)), row.size)
+        
+        self.rows.append(stats)
+        self._accumulate(stats, 1)
+        if self.window is not None:
+            while len(self.rows) > self.window:
+                self._accumulate(self.rows.popleft(), -1)
+        
+        self.steps += 1
+        self.entropy = self._running_entropy()
+        code = int(self._classify_codes(self.entropy))
+        
+        tier = self.TIERS[code]
+        if tier != self.tier:
+            old_tier, self.tier = self.tier, tier
+            for callback in self.callbacks:
+                callback(old_tier, tier, self.steps, self.entropy)
+        
+        return code
+    
+    def update_many(self, rows):
+        """Add several rows in order, returning the final tier code"""
+        code = None
+        for row in rows:
+            code = self.update(row)
+        return code
+    
+    @property
+    def critical(self):
+        """Whether the current window is in the critical tier"""
+        return self.tier == 'critical'
+    
+    def assessment(self):
+        """Return the tier dictionary for the current window"""
+        return self._classify_tier(self.entropy)
+    
+    def _accumulate(self, stats, sign):
+        """Add or remove one row's contribution to the running sums"""
+        total, total_xlogx, count = stats
+        self.total += sign * total
+        self.total_xlogx += sign * total_xlogx
+        self.count += sign * count
+    
+    def _running_entropy(self):
+        """Normalized entropy of the current window"""
+        if self.count <= 1 or self.total <= 0:
+            return 0.0
+        entropy = np.log2(self.total) - self.total_xlogx / self.total
+        return float(entropy / np.log2(self.count))
+
+# Shared monitor for the helper functions; DriftMonitor holds no state
+_monitor = DriftMonitor()
 
 # Helper function for easy import
 def assess_drift(attention_matrix):
@@ -72,5 +241,16 @@ def assess_drift(attention_matrix):
     Returns:
         Drift assessment result
     """
-    monitor = DriftMonitor()
-    return monitor.assess_risk(attention_matrix)
+    return _monitor.assess_risk(attention_matrix)
+
+def assess_drift_batch(attention):
+    """
+    Assess the ethical drift of many attention patterns at once
+    
+    Args:
+        attention: Array whose last two axes are attention matrices
+        
+    Returns:
+        uint8 array of tier codes indexing into DriftMonitor.TIERS
+    """
+    return _monitor.assess_batch(attention)
@@ -0,0 +1,53 @@
+"""
+Glyph Cache - Content-addressed storage for rendered glyphs
+"""
+
+import numpy as np
+import hashlib
+
+from ..cache import DigestCache
+
+
+class GlyphCache(DigestCache):
+    """
+    Two-tier cache of rendered glyph SVGs keyed on attention content.
+
+    Keys are digests of the quantized attention bytes, the theme and the
+    renderer version, so the same matrix always maps to the same entry
+    and the disk tier can be shared between processes.
+    """
+
+    def __init__(self, cache_dir="output/glyphs/cache", max_entries=256,
+                 max_disk_bytes=64 * 1024 * 1024, decimals=6):
+        """
+        Initialize the glyph cache
+
+        Args:
+            cache_dir: Directory of the on-disk tier (None for memory only)
+            max_entries: Maximum number of glyphs held in memory
+            max_disk_bytes: Maximum total size of the on-disk tier
+            decimals: Decimal places attention weights are quantized to
+        """
+        super().__init__(cache_dir, max_entries, max_disk_bytes, suffix=".svg")
+        self.decimals = decimals
+
+    def key(self, attention_weights, theme, version):
+        """
+        Compute the content address of a glyph
+
+        Args:
+            attention_weights: Attention matrix the glyph is rendered from
+            theme: Visual theme of the glyph
+            version: Version of the renderer producing the glyph
+
+        Returns:
+            Hex digest identifying the rendered glyph
+        """
+        weights = np.asarray(attention_weights, dtype=np.float64)
+        quantized = np.round(weights * 10 ** self.decimals).astype("<i8")
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(quantized.shape).encode())
+        digest.update(quantized.tobytes())
+        digest.update(f"{theme}|{version}".encode())
+        return digest.hexdigest()
@@ -0,0 +1,322 @@
+"""
+Glyph Generator - Converts transformer attention into symbolic glyphs
+"""
+
+import numpy as np
+from functools import lru_cache
+import io
+import os
+
+# Define color themes
+THEMES = {
+    "cosmic": {
+        "primary": "#ff4500",
+        "secondary": "#00ff77",
+        "accent": "#9933ff"
+    },
+    "void": {
+        "primary": "#0033cc",
+        "secondary": "#00ccff",
+        "accent": "#ffffff"
+    },
+    "flame": {
+        "primary": "#ff3300",
+        "secondary": "#ffcc00",
+        "accent": "#ff9900"
+    }
+}
+
+# Symbols placed at the cardinal points of every glyph
+SYMBOLS = ["⊻", "∇", "◇", "Ω"]
+
+# Canvas geometry
+CENTER_X, CENTER_Y = 250, 250
+MAX_PATHS = 12      # Rows of the attention matrix turned into paths
+MAX_POINTS = 10     # Columns of each row turned into path vertices
+INNER_RADIUS = 30   # Radius of a zero-weight vertex
+RADIUS = 180        # Maximum radius added by a full-weight vertex
+
+# Bumped whenever rendered output changes, invalidating cached glyphs
+RENDERER_VERSION = "1"
+
+# Serializer backends accepted by the generators
+BACKENDS = ("svgwrite", "template")
+
+# Placeholder path data used to cut the pre-rendered templates apart
+_EVEN_SENTINEL = "M0,0 L1,1"
+_ODD_SENTINEL = "M0,0 L2,2"
+
+# Positions of the cardinal symbols never change, so compute them once
+SYMBOL_POSITIONS = [
+    (CENTER_X + 210 * np.cos(i * np.pi / 2), CENTER_Y + 210 * np.sin(i * np.pi / 2))
+    for i in range(len(SYMBOLS))
+]
+
+
+def get_theme_colors(theme):
+    """Get the color palette for a theme, falling back to cosmic"""
+    return THEMES.get(theme, THEMES["cosmic"])
+
+
+@lru_cache(maxsize=None)
+def _angle_table(n_points):
+    """
+    Cosine and sine of every vertex angle for paths with n_points vertices.
+
+    Both the single and the batch renderer read from this table so their
+    vertices are computed with exactly the same floating point operations.
+    """
+    angles = np.arange(n_points) * (2 * np.pi / n_points)
+    return np.cos(angles), np.sin(angles)
+
+
+def _path_vertices(weights):
+    """
+    Compute path vertices for a stack of attention matrices.
+
+    Args:
+        weights: (N, rows, cols) array of attention weights clipped to [0, 1]
+
+    Returns:
+        Tuple of (xs, ys) arrays shaped (N, paths, points)
+    """
+    rows = weights[:, :MAX_PATHS, :MAX_POINTS]
+    cos, sin = _angle_table(rows.shape[-1])
+
+    r = INNER_RADIUS + rows * RADIUS
+    xs = CENTER_X + r * cos
+    ys = CENTER_Y + r * sin
+    return xs, ys
+
+
+def _path_data(xs, ys, closed):
+    """Build the SVG path `d` string for one row of vertices"""
+    parts = [f"M{CENTER_X},{CENTER_Y} "]
+    for j, (x, y) in enumerate(zip(xs, ys)):
+        # Every third point after the first curves back through the center
+        if j and j % 3 == 0:
+            parts.append(f"Q{CENTER_X},{CENTER_Y} {x},{y} ")
+        else:
+            parts.append(f"L{x},{y} ")
+
+    # Close the path for some elements to create shapes
+    if closed:
+        parts.append("Z")
+    return "".join(parts)
+
+
+def _glyph_paths(xs, ys):
+    """Build the `d` strings for every path of one glyph"""
+    return [
+        _path_data(x_row, y_row, i % 2 == 0)
+        for i, (x_row, y_row) in enumerate(zip(xs.tolist(), ys.tolist()))
+    ]
+
+
+def _build_drawing(paths, output_path, colors):
+    """Assemble the svgwrite drawing for precomputed paths"""
+    # svgwrite is imported on first render so importing this module stays cheap
+    import svgwrite
+
+    dwg = svgwrite.Drawing(output_path, size=("500", "500"), profile='tiny')
+
+    # Add background
+    dwg.add(dwg.rect(insert=(0, 0), size=('100%', '100%'), fill='black'))
+
+    # Create gradient
+    gradient = dwg.linearGradient((0, 0), (0, 1))
+    gradient.add_stop_color(0, colors["primary"])
+    gradient.add_stop_color(0.5, colors["secondary"])
+    gradient.add_stop_color(1, colors["accent"])
+    dwg.defs.add(gradient)
+
+    # Add the paths with gradient fill or stroke
+    for i, path_data in enumerate(paths):
+        if i % 2 == 0:  # Alternate between filled and outlined paths
+            dwg.add(dwg.path(d=path_data, fill="url(#gradient)", fill_opacity=0.3,
+                             stroke=colors["primary"], stroke_width=2))
+        else:
+            dwg.add(dwg.path(d=path_data, fill="none",
+                             stroke=colors["secondary"], stroke_width=2))
+
+    # Add symbolic glyphs at key points
+    for symbol, (x, y) in zip(SYMBOLS, SYMBOL_POSITIONS):
+        dwg.add(dwg.text(symbol, insert=(x, y), fill=colors["accent"],
+                         font_size=24, text_anchor="middle"))
+
+    return dwg
+
+
+@lru_cache(maxsize=None)
+def _svg_template(theme):
+    """
+    Pre-render the static skeleton of a themed glyph as byte fragments.
+
+    The skeleton is serialized once through svgwrite with placeholder path
+    data and cut apart at the placeholders, so the spliced output matches
+    the svgwrite backend byte for byte.
+
+    Returns:
+        Tuple of (head, (even_path_attrs, odd_path_attrs), footer)
+    """
+    dwg = _build_drawing([_EVEN_SENTINEL, _ODD_SENTINEL], "", get_theme_colors(theme))
+    buffer = io.StringIO()
+    dwg.write(buffer)
+
+    head, rest = buffer.getvalue().split(f'<path d="{_EVEN_SENTINEL}"', 1)
+    even_attrs, rest = rest.split(f'<path d="{_ODD_SENTINEL}"', 1)
+    odd_attrs, footer = rest.split("<text", 1)
+
+    return (
+        head.encode("utf-8"),
+        (even_attrs.encode("utf-8"), odd_attrs.encode("utf-8")),
+        b"<text" + footer.encode("utf-8"),
+    )
+
+
+def _serialize_template(paths, theme):
+    """Splice path data into the pre-rendered template for a theme"""
+    head, path_attrs, footer = _svg_template(theme)
+    body = b"".join(
+        b'<path d="' + path_data.encode("ascii") + b'"' + path_attrs[i % 2]
+        for i, path_data in enumerate(paths)
+    )
+    return head + body + footer
+
+
+def _serialize_svg(paths, theme, backend):
+    """Serialize precomputed paths to SVG bytes with the chosen backend"""
+    if backend == "svgwrite":
+        buffer = io.StringIO()
+        _build_drawing(paths, "", get_theme_colors(theme)).write(buffer)
+        return buffer.getvalue().encode("utf-8")
+    if backend == "template":
+        return _serialize_template(paths, theme)
+    raise ValueError(f"Unknown backend: {backend}. Must be one of {list(BACKENDS)}")
+
+
+def _write_svg(svg, output_path):
+    """Save serialized SVG bytes"""
+    with open(output_path, "wb") as f:
+        f.write(svg)
+    return output_path
+
+
+def render_glyph(attention_weights, theme="cosmic", backend="svgwrite"):
+    """
+    Render transformer attention weights to SVG bytes without touching disk.
+
+    Args:
+        attention_weights: numpy array of attention weights
+        theme: visual theme for the glyph ("cosmic", "void", "flame")
+        backend: SVG serializer, "svgwrite" or the faster "template"
+
+    Returns:
+        The SVG document as UTF-8 bytes, identical to what generate_glyph writes
+    """
+    # Normalize attention weights
+    weights = np.clip(attention_weights, 0, 1)
+
+    # Generate paths based on attention patterns
+    xs, ys = _path_vertices(weights[np.newaxis])
+    return _serialize_svg(_glyph_paths(xs[0], ys[0]), theme, backend)
+
+
+def generate_glyph(attention_weights, output_path=None, theme="cosmic", backend="svgwrite",
+                   cache=None):
+    """
+    Convert transformer attention weights to a recursive SVG sigil.
+
+    Args:
+        attention_weights: numpy array of attention weights
+        output_path: path to save the SVG output
+        theme: visual theme for the glyph ("cosmic", "void", "flame")
+        backend: SVG serializer, "svgwrite" or the faster "template"
+        cache: GlyphCache to reuse glyphs rendered from identical attention
+
+    Returns:
+        Path to the generated SVG file
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}. Must be one of {list(BACKENDS)}")
+
+    # Reuse a previously rendered glyph for identical attention
+    svg = None
+    if cache is not None:
+        key = cache.key(attention_weights, theme, RENDERER_VERSION)
+        svg = cache.get(key)
+
+    if svg is None:
+        svg = render_glyph(attention_weights, theme, backend)
+        if cache is not None:
+            cache.put(key, svg)
+
+    # Cached glyphs already live at their content address
+    if output_path is None and cache is not None and cache.cache_dir is not None:
+        return cache.materialize(key, svg)
+
+    # Create SVG canvas
+    if output_path is None:
+        os.makedirs("output/glyphs", exist_ok=True)
+        output_path = f"output/glyphs/sigil_{np.random.randint(10000)}.svg"
+
+    return _write_svg(svg, output_path)
+
+
+def generate_glyphs_batch(attention_stack, themes="cosmic", output_paths=None,
+                          output_dir="output/glyphs", backend="svgwrite", cache=None):
+    """
+    Convert a stack of attention matrices to SVG sigils in one pass.
+
+    All path vertices are computed together with NumPy broadcasting, so
+    each glyph is byte-identical to what `generate_glyph` writes for the
+    same matrix and theme.
+
+    Args:
+        attention_stack: numpy array of shape (N, rows, cols)
+        themes: one theme for every glyph, or a sequence of N themes
+        output_paths: sequence of N paths to save the SVGs (optional)
+        output_dir: directory for generated file names when no paths are given
+        backend: SVG serializer, "svgwrite" or the faster "template"
+        cache: GlyphCache to reuse glyphs rendered from identical attention
+
+    Returns:
+        List of paths to the generated SVG files
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}. Must be one of {list(BACKENDS)}")
+
+    attention_stack = np.asarray(attention_stack)
+    weights = np.clip(attention_stack, 0, 1)
+    if weights.ndim != 3:
+        raise ValueError(f"attention_stack must have shape (N, rows, cols), got {weights.shape}")
+    count = len(weights)
+
+    if isinstance(themes, str):
+        themes = [themes] * count
+    if len(themes) != count:
+        raise ValueError(f"Expected {count} themes, got {len(themes)}")
+
+    if output_paths is None:
+        os.makedirs(output_dir, exist_ok=True)
+        output_paths = [os.path.join(output_dir, f"sigil_{i}.svg") for i in range(count)]
+    if len(output_paths) != count:
+        raise ValueError(f"Expected {count} output paths, got {len(output_paths)}")
+
+    xs, ys = _path_vertices(weights)
+
+    results = []
+    for n in range(count):
+        svg = None
+        if cache is not None:
+            key = cache.key(attention_stack[n], themes[n], RENDERER_VERSION)
+            svg = cache.get(key)
+
+        if svg is None:
+            svg = _serialize_svg(_glyph_paths(xs[n], ys[n]), themes[n], backend)
+            if cache is not None:
+                cache.put(key, svg)
+
+        results.append(_write_svg(svg, str(output_paths[n])))
+
+    return results
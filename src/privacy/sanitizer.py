@@ -2,9 +2,42 @@
 Input Sanitizer - Privacy-preserving processing for AI inputs
 """
 
+import os
 import re
+import json
 import hashlib
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+
+from ..concurrency import worker_context
+
+
+@lru_cache(maxsize=32)
+def _compile_scanner(patterns: Tuple[Tuple[str, str], ...]) -> "re.Pattern":
+    """
+    Compile PII patterns into one alternation of named groups
+    
+    Args:
+        patterns: (pii_type, pattern) pairs in priority order
+        
+    Returns:
+        Compiled pattern whose `lastgroup` names the matched PII type
+    """
+    alternation = "|".join(f"(?P<{pii_type}>{pattern})" for pii_type, pattern in patterns)
+    return re.compile(alternation, re.IGNORECASE)
+
+
+# Redaction tokens produced by the default replacement format
+_TOKEN_PATTERN = re.compile(r'\[REDACTED:([^:]+):([^\]]+)\]')
+
+def _restore_tokens(sanitized_text: str, redacted_items: Dict[str, str]) -> str:
+    """Replace every known redaction token in one linear pass"""
+    def replace(match):
+        return redacted_items.get(match.group(2), match.group(0))
+    
+    return _TOKEN_PATTERN.sub(replace, sanitized_text)
+
 
 class Sanitizer:
     """
@@ -33,6 +66,10 @@ class Sanitizer:
         """
         Sanitize the input text by removing/replacing sensitive information
         
+        All PII patterns are matched in a single scan. Where matches would
+        overlap, the leftmost match wins, and matches starting at the same
+        position are resolved in the order of `pii_patterns`.
+        
         Args:
             text: Text to sanitize
             
@@ -45,35 +82,191 @@ class Sanitizer:
         # Reset redacted items for new cleaning operation
         self.redacted_items = {}
         
-        # Process text for each pattern
-        sanitized_text = text
-        for pii_type, pattern in self.pii_patterns.items():
-            # Find all matches
-            matches = re.finditer(pattern, sanitized_text, re.IGNORECASE)
+        counts = dict.fromkeys(self.pii_patterns, 0)
+        sanitized_text, _ = self._redact_span(text, 0, len(text), counts, self.redacted_items)
+        return sanitized_text
+    
+    def clean_stream(self, chunks: Iterable[str], overlap: int = 1024,
+                     keep_map: bool = False) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """
+        Sanitize text arriving in chunks using bounded memory
+        
+        The last `overlap` characters of each chunk are held back until the
+        next chunk arrives, so PII spanning a chunk boundary is still caught
+        as long as it is no longer than `overlap`. Output and redaction ids
+        match `clean` on the concatenated text.
+        
+        Args:
+            chunks: Iterable of text chunks
+            overlap: Characters carried across chunk boundaries
+            keep_map: Also collect every redaction in `redacted_items`
             
-            # Replace each match with a token
-            offset = 0
-            for i, match in enumerate(matches):
-                # Create a unique identifier for this redacted item
-                item_id = self.hash_content(match.group() + str(i))
-                
-                # Store the original value mapped to this ID
-                self.redacted_items[item_id] = match.group()
-                
-                # Create the replacement token
-                replacement = self.replacement_format.format(pii_type, item_id)
-                
-                # Calculate positions with offset
-                start = match.start() + offset
-                end = match.end() + offset
-                
-                # Replace in the text
-                sanitized_text = sanitized_text[:start] + replacement + sanitized_text[end:]
-                
-                # Update offset for future replacements
-                offset += len(replacement) - (end - start)
+        Yields:
+            Tuples of (sanitized_segment, redactions) where redactions maps
+            the ids first used in that segment to their original values
+        """
+        if keep_map:
+            self.redacted_items = {}
         
-        return sanitized_text
+        counts = dict.fromkeys(self.pii_patterns, 0)
+        buffer = ""
+        # Characters at the head of the buffer that were already emitted and
+        # are only kept as context for word boundaries
+        context = 0
+        
+        for chunk in chunks:
+            buffer += chunk
+            stop = len(buffer) - overlap
+            if stop <= context:
+                continue
+            
+            redactions = {}
+            segment, cut = self._redact_span(buffer, context, stop, counts, redactions)
+            if keep_map:
+                self.redacted_items.update(redactions)
+            yield segment, redactions
+            
+            keep = max(cut - 1, 0)
+            buffer = buffer[keep:]
+            context = cut - keep
+        
+        # Flush whatever is still held back
+        redactions = {}
+        segment, _ = self._redact_span(buffer, context, len(buffer), counts, redactions)
+        if keep_map:
+            self.redacted_items.update(redactions)
+        if segment or redactions:
+            yield segment, redactions
+    
+    def clean_file(self, path_in: str, path_out: str, map_path: Optional[str] = None,
+                   chunk_size: int = 1 << 20, overlap: int = 1024,
+                   encoding: str = "utf-8") -> int:
+        """
+        Sanitize a text file of any size using bounded memory
+        
+        Args:
+            path_in: File to sanitize
+            path_out: File to write sanitized text to
+            map_path: File to append the redaction map to as JSON lines of
+                {"id": ..., "value": ...} (optional)
+            chunk_size: Characters read per chunk
+            overlap: Characters carried across chunk boundaries
+            encoding: Encoding of both files
+            
+        Returns:
+            Number of redacted items
+        """
+        def read_chunks(f):
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        
+        redacted = 0
+        map_file = open(map_path, "a", encoding=encoding) if map_path else None
+        try:
+            with open(path_in, "r", encoding=encoding, newline="") as f_in, \
+                    open(path_out, "w", encoding=encoding, newline="") as f_out:
+                for segment, redactions in self.clean_stream(read_chunks(f_in), overlap):
+                    f_out.write(segment)
+                    if map_file is not None:
+                        for item_id, value in redactions.items():
+                            map_file.write(json.dumps({"id": item_id, "value": value}) + "\n")
+                    redacted += len(redactions)
+        finally:
+            if map_file is not None:
+                map_file.close()
+        
+        return redacted
+    
+    def clean_many(self, texts: Iterable[str], workers: Optional[int] = None,
+                   chunksize: Optional[int] = None) -> List[Tuple[str, "Sanitizer"]]:
+        """
+        Sanitize many documents in parallel on a process pool
+        
+        Each worker compiles the patterns of this sanitizer once and then
+        cleans its share of the documents.
+        
+        Args:
+            texts: Documents to sanitize
+            workers: Number of worker processes (default: CPU count);
+                1 or fewer cleans serially in this process
+            chunksize: Documents sent to a worker at a time (default: spread
+                evenly as about four batches per worker)
+            
+        Returns:
+            List of (sanitized_text, sanitizer) tuples in input order, where
+            each sanitizer holds the redaction map for restoring its text
+        """
+        texts = list(texts)
+        patterns = tuple(self.pii_patterns.items())
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1 or len(texts) <= 1:
+            _init_clean_worker(patterns, self.replacement_format)
+            cleaned = [_clean_worker(text) for text in texts]
+        else:
+            if chunksize is None:
+                chunksize = max(1, len(texts) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context(),
+                                     initializer=_init_clean_worker,
+                                     initargs=(patterns, self.replacement_format)) as executor:
+                cleaned = list(executor.map(_clean_worker, texts, chunksize=chunksize))
+        
+        results = []
+        for sanitized, redacted_items in cleaned:
+            sanitizer = Sanitizer()
+            sanitizer.pii_patterns = dict(self.pii_patterns)
+            sanitizer.replacement_format = self.replacement_format
+            sanitizer.redacted_items = redacted_items
+            results.append((sanitized, sanitizer))
+        return results
+    
+    def _redact_span(self, text: str, start: int, stop: int, counts: Dict[str, int],
+                     redactions: Dict[str, str]) -> Tuple[str, int]:
+        """
+        Replace PII matches beginning in text[start:stop]
+        
+        Args:
+            text: Text to scan; characters before `start` only serve as context
+            start: Position to start scanning from
+            stop: Matches starting at or after this position are left alone
+            counts: Running per-type match counts used to derive ids
+            redactions: Dictionary collecting id -> original value
+            
+        Returns:
+            Tuple of (sanitized text from start to the cut, cut position).
+            The cut is `stop`, or the end of a match that extends past it.
+        """
+        scanner = _compile_scanner(tuple(self.pii_patterns.items()))
+        
+        # Collect the untouched text between matches and the replacement tokens
+        parts = []
+        position = start
+        for match in scanner.finditer(text, start):
+            if match.start() >= stop:
+                break
+            
+            pii_type = match.lastgroup
+            value = match.group()
+            
+            # Create a unique identifier for this redacted item
+            item_id = self.hash_content(value + str(counts[pii_type]))
+            counts[pii_type] += 1
+            
+            # Store the original value mapped to this ID
+            redactions[item_id] = value
+            
+            parts.append(text[position:match.start()])
+            parts.append(self.replacement_format.format(pii_type, item_id))
+            position = match.end()
+        
+        cut = min(max(position, stop), len(text))
+        parts.append(text[position:cut])
+        return "".join(parts), cut
     
     def restore(self, sanitized_text: str) -> str:
         """
@@ -85,37 +278,50 @@ class Sanitizer:
         Returns:
             Text with original values restored
         """
-        restored_text = sanitized_text
-        
-        # Find all redaction tokens
-        pattern = r'\[REDACTED:([^:]+):([^\]]+)\]'
-        matches = re.finditer(pattern, restored_text)
-        
-        # Replace each token with the original value
-        offset = 0
-        for match in matches:
-            # Extract token parts
-            pii_type = match.group(1)
-            item_id = match.group(2)
+        return _restore_tokens(sanitized_text, self.redacted_items)
+    
+    def restore_many(self, sanitized_texts: Iterable[str],
+                     redaction_maps: Optional[Iterable[Dict[str, str]]] = None) -> List[str]:
+        """
+        Restore redacted items in many sanitized texts
+        
+        Args:
+            sanitized_texts: Texts with [REDACTED] placeholders
+            redaction_maps: One redaction map per text (default: this
+                sanitizer's map for every text)
             
-            # Get the original value
-            if item_id in self.redacted_items:
-                original = self.redacted_items[item_id]
-                
-                # Replace the token
-                start = match.start() + offset
-                end = match.end() + offset
-                restored_text = restored_text[:start] + original + restored_text[end:]
-                
-                # Update offset
-                offset += len(original) - (end - start)
-        
-        return restored_text
+        Returns:
+            List of texts with original values restored, in input order
+        """
+        if redaction_maps is None:
+            return [_restore_tokens(text, self.redacted_items) for text in sanitized_texts]
+        return [
+            _restore_tokens(text, redacted_items)
+            for text, redacted_items in zip(sanitized_texts, redaction_maps)
+        ]
     
     def hash_content(self, content: str) -> str:
         """Create a short hash for content identification"""
         return hashlib.md5(content.encode()).hexdigest()[:8]
 
+# Sanitizer owned by each clean_many worker process
+_worker_sanitizer = None
+
+def _init_clean_worker(patterns: Tuple[Tuple[str, str], ...], replacement_format: str):
+    """Set up the worker's sanitizer and compile its patterns once"""
+    global _worker_sanitizer
+    _worker_sanitizer = Sanitizer()
+    _worker_sanitizer.pii_patterns = dict(patterns)
+    _worker_sanitizer.replacement_format = replacement_format
+    _compile_scanner(patterns)
+
+def _clean_worker(text: str) -> Tuple[str, Dict[str, str]]:
+    """Clean one document in a worker, returning its redaction map"""
+    if not text:
+        return "", {}
+    sanitized = _worker_sanitizer.clean(text)
+    return sanitized, _worker_sanitizer.redacted_items
+
 # Helper function for easy import
 def sanitize_text(text: str) -> tuple:
     """
@@ -0,0 +1,318 @@
+"""
+ψCORE Attention Backends
+
+Backends turn a batch of prompts into per-layer, per-head attention maps.
+PsiCore talks to them through AttentionBackend.extract_batch, so the
+simulated patterns, the pure-NumPy reference transformer and a local
+Hugging Face model are interchangeable.
+"""
+
+import numpy as np
+import re
+from pathlib import Path
+
+from ..seeding import memoize_by_digest, stable_rng
+
+# Token pattern shared by the reference tokenizer
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+PAD_ID = 0
+UNK_ID = 1
+
+
+class AttentionBackend:
+    """
+    Interface for attention extraction backends
+
+    Subclasses implement _forward, which runs one padded batch and returns
+    (batch, layers, heads, T, T) attention plus the (batch, T) mask. The
+    base class handles length bucketing, batching and trimming padding.
+    """
+
+    name = "base"
+
+    def __init__(self, batch_size=32, max_tokens=128):
+        """
+        Initialize the backend
+
+        Args:
+            batch_size: Prompts run through one forward pass
+            max_tokens: Maximum tokens kept per prompt
+        """
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+
+    def tokenize(self, text):
+        """Split text into tokens, truncated to max_tokens"""
+        return _TOKEN_PATTERN.findall(text.lower())[:self.max_tokens]
+
+    def extract_batch(self, texts):
+        """
+        Extract attention for a batch of prompts
+
+        Prompts are grouped by length so each forward pass carries little
+        padding, and padded rows and columns are trimmed from each result.
+
+        Args:
+            texts: Sequence of prompts
+
+        Returns:
+            List of (layers, heads, T_i, T_i) arrays in input order
+        """
+        texts = list(texts)
+        lengths = [len(self.tokenize(text)) for text in texts]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+
+        results = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start:start + self.batch_size]
+            attention, mask = self._forward([texts[i] for i in indices])
+            for row, index in enumerate(indices):
+                keep = np.flatnonzero(mask[row])
+                results[index] = attention[row][..., keep[:, None], keep]
+        return results
+
+    def extract(self, text):
+        """Extract (layers, heads, T, T) attention for a single prompt"""
+        return self.extract_batch([text])[0]
+
+    def _forward(self, texts):
+        """Run one padded batch; returns (attention, mask)"""
+        raise NotImplementedError
+
+
+class SimulatedBackend(AttentionBackend):
+    """Deterministic simulated attention used when no model is loaded"""
+
+    name = "simulated"
+
+    def _forward(self, texts):
+        """Stack simulated 12x12 patterns as single-layer, single-head maps"""
+        attention = np.stack([_simulate_attention(text) for text in texts])
+        return attention[:, None, None], np.ones(attention.shape[:2], dtype=bool)
+
+
+class NumpyTransformerBackend(AttentionBackend):
+    """
+    Pure-NumPy reference transformer
+
+    A small pre-norm encoder whose weights live in a single .npz file.
+    It exists so batching and masking can be tested without a deep
+    learning framework; real models go through TransformersBackend.
+    """
+
+    name = "numpy"
+
+    def __init__(self, weights, batch_size=32, max_tokens=128):
+        """
+        Initialize the reference transformer
+
+        Args:
+            weights: Mapping with "vocab", "embedding", "num_heads" and
+                per-layer "wq", "wk", "wv", "wo", "w1", "w2" stacks
+            batch_size: Prompts run through one forward pass
+            max_tokens: Maximum tokens kept per prompt
+        """
+        super().__init__(batch_size, max_tokens)
+        self.weights = {name: np.asarray(value) for name, value in weights.items()}
+        self.vocab = {token: index for index, token in enumerate(self.weights["vocab"].tolist())}
+        self.num_heads = int(self.weights["num_heads"])
+        self.num_layers, self.d_model = self.weights["wq"].shape[:2]
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Load weights saved by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(dict(data), **kwargs)
+
+    @classmethod
+    def init_random(cls, vocab, d_model=32, num_layers=2, num_heads=4, seed=0, **kwargs):
+        """
+        Create a transformer with random weights
+
+        Args:
+            vocab: Tokens of the vocabulary (padding and unknown are added)
+            d_model: Model width, divisible by num_heads
+            num_layers: Number of encoder layers
+            num_heads: Attention heads per layer
+            seed: Seed for the weights
+
+        Returns:
+            NumpyTransformerBackend
+        """
+        if d_model % num_heads:
+            raise ValueError("d_model must be divisible by num_heads")
+
+        rng = np.random.default_rng(seed)
+        vocab = ["<pad>", "<unk>"] + list(vocab)
+        scale = 1 / np.sqrt(d_model)
+
+        def layer_stack(*shape):
+            return rng.normal(0, scale, size=(num_layers,) + shape)
+
+        weights = {
+            "vocab": np.array(vocab),
+            "embedding": rng.normal(0, 1, size=(len(vocab), d_model)),
+            "num_heads": np.array(num_heads),
+            "wq": layer_stack(d_model, d_model),
+            "wk": layer_stack(d_model, d_model),
+            "wv": layer_stack(d_model, d_model),
+            "wo": layer_stack(d_model, d_model),
+            "w1": layer_stack(d_model, 4 * d_model),
+            "w2": layer_stack(4 * d_model, d_model),
+        }
+        return cls(weights, **kwargs)
+
+    def save(self, path):
+        """Save the weights to an .npz file"""
+        np.savez(path, **self.weights)
+
+    def _encode(self, texts):
+        """Token ids (batch, T) and mask for a padded batch"""
+        tokens = [self.tokenize(text) for text in texts]
+        width = max(1, max(len(row) for row in tokens))
+
+        ids = np.full((len(texts), width), PAD_ID, dtype=np.int64)
+        mask = np.zeros((len(texts), width), dtype=bool)
+        for row, sequence in enumerate(tokens):
+            ids[row, :len(sequence)] = [self.vocab.get(token, UNK_ID) for token in sequence]
+            mask[row, :len(sequence)] = True
+        return ids, mask
+
+    def _forward(self, texts):
+        """Run the encoder over a padded batch, recording every layer's attention"""
+        ids, mask = self._encode(texts)
+        batch, width = ids.shape
+        heads, head_dim = self.num_heads, self.d_model // self.num_heads
+
+        hidden = self.weights["embedding"][ids] + _positional_encoding(width, self.d_model)
+        # Rows of empty prompts keep their keys so softmax stays finite;
+        # they are trimmed away afterwards anyway
+        visible = mask | ~mask.any(axis=1, keepdims=True)
+        key_bias = np.where(visible, 0.0, -np.inf)[:, None, None, :]
+
+        attention = np.empty((batch, self.num_layers, heads, width, width))
+        for layer in range(self.num_layers):
+            normed = _layer_norm(hidden)
+            q, k, v = (
+                (normed @ self.weights[name][layer]).reshape(batch, width, heads, head_dim).transpose(0, 2, 1, 3)
+                for name in ("wq", "wk", "wv")
+            )
+
+            # Padded keys get -inf so every real row still sums to one
+            scores = q @ k.transpose(0, 1, 3, 2) / np.sqrt(head_dim) + key_bias
+            scores -= scores.max(axis=-1, keepdims=True)
+            weights = np.exp(scores)
+            weights /= weights.sum(axis=-1, keepdims=True)
+            attention[:, layer] = weights
+
+            context = (weights @ v).transpose(0, 2, 1, 3).reshape(batch, width, self.d_model)
+            hidden = hidden + context @ self.weights["wo"][layer]
+            hidden = hidden + np.maximum(_layer_norm(hidden) @ self.weights["w1"][layer], 0) @ self.weights["w2"][layer]
+
+        return attention, mask
+
+
+class TransformersBackend(AttentionBackend):
+    """Local Hugging Face model loaded with output_attentions enabled"""
+
+    name = "transformers"
+
+    def __init__(self, model_path, batch_size=16, max_tokens=128):
+        """
+        Load a model and tokenizer from a local directory
+
+        Args:
+            model_path: Directory holding the model and tokenizer files
+            batch_size: Prompts run through one forward pass
+            max_tokens: Maximum tokens kept per prompt
+        """
+        try:
+            import torch
+            from transformers import AutoModel, AutoTokenizer
+        except ImportError as exc:
+            raise ImportError("TransformersBackend requires the torch and transformers packages") from exc
+
+        super().__init__(batch_size, max_tokens)
+        self._torch = torch
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path, local_files_only=True)
+        self.model = AutoModel.from_pretrained(model_path, local_files_only=True, output_attentions=True)
+        self.model.eval()
+
+    def tokenize(self, text):
+        """Split text with the model's tokenizer"""
+        return self.tokenizer.tokenize(text)[:self.max_tokens]
+
+    def _forward(self, texts):
+        """Run the model over a padded batch"""
+        encoded = self.tokenizer(list(texts), padding=True, truncation=True,
+                                 max_length=self.max_tokens, return_tensors="pt")
+        with self._torch.no_grad():
+            output = self.model(**encoded)
+
+        # Tuple of (batch, heads, T, T) per layer -> (batch, layers, heads, T, T)
+        attention = np.stack([layer.float().numpy() for layer in output.attentions], axis=1)
+        return attention, encoded["attention_mask"].numpy().astype(bool)
+
+
+def load_backend(model_path=None, **kwargs):
+    """
+    Choose a backend for a model path
+
+    Args:
+        model_path: None for simulated attention, an .npz file for the
+            reference transformer, or a local Hugging Face model directory
+        kwargs: Passed to the backend constructor
+
+    Returns:
+        AttentionBackend
+    """
+    if model_path is None:
+        return SimulatedBackend(**kwargs)
+
+    path = Path(model_path)
+    if path.suffix == ".npz":
+        return NumpyTransformerBackend.load(path, **kwargs)
+    if path.is_dir():
+        return TransformersBackend(path, **kwargs)
+    raise ValueError(f"No attention backend for model path: {model_path}")
+
+
+# Version of the simulated backend's attention maps
+SIMULATED_ATTENTION_VERSION = "1"
+
+@memoize_by_digest("psycore-attention", SIMULATED_ATTENTION_VERSION)
+def _simulate_attention(text):
+    """Simulate a deterministic attention pattern for text"""
+    # Create deterministic pattern based on a stable digest of the input
+    rng = stable_rng("psycore", text)
+    attention = rng.random((12, 12))
+
+    # Add structure based on text properties
+    word_count = len(text.split())
+    attention *= (word_count / 100 + 0.5)  # Scale by word count
+
+    # Add patterns to make it less random
+    index = np.arange(12)
+    attention += 0.2 * np.sin(np.outer(index, index) * np.pi / 12)
+
+    # Normalize to 0-1
+    attention = (attention - attention.min()) / (attention.max() - attention.min() + 1e-8)
+
+    return attention
+
+
+def _positional_encoding(length, d_model):
+    """Sinusoidal position encodings (length, d_model)"""
+    positions = np.arange(length)[:, None]
+    rates = 1 / 10000 ** (np.arange(0, d_model, 2) / d_model)
+    encoding = np.zeros((length, d_model))
+    encoding[:, 0::2] = np.sin(positions * rates)
+    encoding[:, 1::2] = np.cos(positions * rates[:d_model // 2])
+    return encoding
+
+
+def _layer_norm(x, eps=1e-5):
+    """Normalize the last axis to zero mean and unit variance"""
+    mean = x.mean(axis=-1, keepdims=True)
+    return (x - mean) / np.sqrt(x.var(axis=-1, keepdims=True) + eps)
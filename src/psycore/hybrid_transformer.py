@@ -7,7 +7,19 @@ to enable interpretable reasoning and glyph-based explanation.
 
 import numpy as np
 from pathlib import Path
+import asyncio
+import itertools
 import os
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .backends import load_backend
+from ..concurrency import loop_semaphore, worker_context
+from ..seeding import stable_digest
 
 class PsiCore:
     """
@@ -17,14 +29,27 @@ class PsiCore:
     interpretable reasoning that can be visualized as glyphs.
     """
     
-    def __init__(self, model_path=None):
+    def __init__(self, model_path=None, backend=None, layer_idx=-1, max_concurrency=64,
+                 executor=None):
         """
         Initialize the ψCORE transformer
         
         Args:
-            model_path: Path to pretrained transformer weights (optional)
+            model_path: Path to pretrained transformer weights (optional):
+                an .npz file for the NumPy reference transformer or a
+                local Hugging Face model directory
+            backend: AttentionBackend to use instead of loading model_path
+            layer_idx: Layer whose head-averaged attention is audited
+            max_concurrency: Maximum aaudit calls working at once
+            executor: Executor for aaudit's CPU work (default: the event
+                loop's default thread pool)
         """
-        self.transformer = None
+        self.transformer = backend if backend is not None else load_backend(model_path)
+        self.layer_idx = layer_idx
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        # One semaphore per event loop, see loop_semaphore
+        self._semaphores = weakref.WeakKeyDictionary()
         self.symbolic_rules = {
             "diverge": "⊻",
             "recurse": "∇",
@@ -32,9 +57,8 @@ class PsiCore:
             "complete": "Ω"
         }
         
-        # Path to store generated audit files
+        # Path to store generated audit files, created on first write
         self.output_dir = Path("output/psycore")
-        os.makedirs(self.output_dir, exist_ok=True)
     
     def audit(self, input_text, output_path=None):
         """
@@ -49,8 +73,9 @@ class PsiCore:
         """
         # Generate default output path if not specified
         if output_path is None:
-            output_filename = f"audit_{hash(input_text) % 10000}.svg"
+            output_filename = f"audit_{stable_digest(input_text)}.svg"
             output_path = self.output_dir / output_filename
+            os.makedirs(self.output_dir, exist_ok=True)
         
         # Extract attention patterns
         attention = self._extract_attention(input_text)
@@ -61,27 +86,214 @@ class PsiCore:
         
         return str(glyph_path)
     
-    def _extract_attention(self, text):
+    async def aaudit(self, input_text, output_path=None, timeout=None):
         """
-        Extract attention patterns from text
+        Audit LLM reasoning process without blocking the event loop
         
-        In a real implementation, this would use the transformer.
-        For this example, we simulate attention patterns.
+        Extraction and rendering run on the executor and the SVG is written
+        from a worker thread. Calls beyond max_concurrency wait their turn.
+        
+        Args:
+            input_text: Text to analyze
+            output_path: Path to save the audit visualization
+            timeout: Seconds to wait, including time queued for a slot
+                (None for no limit); raises asyncio.TimeoutError
+            
+        Returns:
+            Path to generated SVG audit visualization
         """
-        # Create deterministic pattern based on input hash
-        np.random.seed(hash(text) % 10000)
-        attention = np.random.rand(12, 12)
+        return await asyncio.wait_for(self._aaudit(input_text, output_path), timeout)
+    
+    async def _aaudit(self, input_text, output_path):
+        """Run one audit once a concurrency slot is free"""
+        loop = asyncio.get_running_loop()
+        async with loop_semaphore(self._semaphores, self.max_concurrency):
+            if output_path is None:
+                output_path = self.output_dir / f"audit_{stable_digest(input_text)}.svg"
+            
+            attention = await loop.run_in_executor(self.executor, self._extract_attention, input_text)
+            
+            from ..glyphs.generator import render_glyph
+            svg = await loop.run_in_executor(self.executor, render_glyph, attention)
+            
+            # A cancelled call may still finish this write; the file is complete either way
+            await asyncio.to_thread(_write_audit, output_path, svg)
+            return str(output_path)
+    
+    def audit_many(self, texts, workers=None, batch_size=None, queue_size=4, output_dir=None,
+                   theme="cosmic"):
+        """
+        Audit many texts as a pipeline of extract, render and score stages
+        
+        A background thread extracts attention in batches into a bounded
+        queue, glyphs are rendered on a process pool, and drift is scored
+        here while later batches render. At most queue_size batches wait
+        between stages, so memory stays flat however many texts stream in.
+        
+        Args:
+            texts: Iterable of texts to analyze (consumed lazily)
+            workers: Number of render processes (default: CPU count);
+                1 or fewer renders in this process
+            batch_size: Texts extracted together (default: the backend's)
+            queue_size: Maximum batches waiting between stages
+            output_dir: Directory for the audit SVGs (default: output/psycore)
+            theme: Visual theme of the glyphs
+            
+        Yields:
+            Dictionaries with "text", "glyph_path", "assessment" and
+            "timings", in input order. Timings are the seconds each stage
+            spent on the text's batch divided by the batch size.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if batch_size is None:
+            batch_size = self.transformer.batch_size
+        output_dir = Path(output_dir) if output_dir is not None else self.output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Render workers must not be forked from a process with a running
+        # thread, so they start from a fork server (or spawn), set up before
+        # the extraction thread exists
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=worker_context())
+        
+        batches = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        extractor = threading.Thread(target=self._extract_stage,
+                                     args=(iter(texts), batch_size, batches, stop), daemon=True)
+        extractor.start()
         
-        # Add structure based on text properties
-        word_count = len(text.split())
-        attention *= (word_count / 100 + 0.5)  # Scale by word count
+        pending = deque()
+        try:
+            while True:
+                batch = batches.get()
+                if isinstance(batch, BaseException):
+                    raise batch
+                if batch is not None:
+                    pending.append(self._submit_render(batch, output_dir, theme, executor))
+                
+                # Score and yield the oldest batch once enough work is queued behind it
+                while pending and (batch is None or len(pending) > queue_size):
+                    yield from self._score_stage(*pending.popleft())
+                if batch is None:
+                    break
+        finally:
+            stop.set()
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+    
+    def _extract_stage(self, texts, batch_size, batches, stop):
+        """Extraction thread: put (texts, matrices, seconds) batches, then None"""
+        try:
+            while not stop.is_set():
+                chunk = list(itertools.islice(texts, batch_size))
+                if not chunk:
+                    break
+                start = time.perf_counter()
+                matrices = self.extract_attention_batch(chunk)
+                item = (chunk, matrices, time.perf_counter() - start)
+                
+                # Re-check for a stopped consumer instead of blocking forever
+                while not stop.is_set():
+                    try:
+                        batches.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+            item = None
+        except BaseException as exc:
+            item = exc
+        
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _submit_render(self, batch, output_dir, theme, executor):
+        """Start rendering a batch; returns the arguments of _score_stage"""
+        texts, matrices, extract_time = batch
+        paths = [str(output_dir / f"audit_{stable_digest(text)}.svg") for text in texts]
+        if executor is None:
+            render = Future()
+            render.set_result(_render_audit_batch(matrices, paths, theme))
+        else:
+            render = executor.submit(_render_audit_batch, matrices, paths, theme)
+        return texts, matrices, paths, extract_time, render
+    
+    def _score_stage(self, texts, matrices, paths, extract_time, render):
+        """Score drift for a batch, wait for its glyphs and yield its results"""
+        from ..ethics.drift_tier import DriftMonitor
         
-        # Add patterns to make it less random
-        for i in range(12):
-            for j in range(12):
-                attention[i, j] += 0.2 * np.sin(i * j * np.pi / 12)
+        start = time.perf_counter()
+        monitor = DriftMonitor()
+        if len({matrix.shape for matrix in matrices}) == 1:
+            codes = monitor.assess_batch(np.stack(matrices))
+            assessments = [monitor.describe_tier(code) for code in codes]
+        else:
+            assessments = [monitor.assess_risk(matrix) for matrix in matrices]
+        score_time = time.perf_counter() - start
         
-        # Normalize to 0-1
-        attention = (attention - attention.min()) / (attention.max() - attention.min() + 1e-8)
+        render_time = render.result()
+        timings = {
+            "extract": extract_time / len(texts),
+            "render": render_time / len(texts),
+            "score": score_time / len(texts),
+        }
+        for text, path, assessment in zip(texts, paths, assessments):
+            yield {
+                "text": text,
+                "glyph_path": path,
+                "assessment": assessment,
+                "timings": dict(timings),
+            }
+    
+    def extract_attention_batch(self, texts):
+        """
+        Extract audit attention patterns for many texts in batched passes
         
-        return attention
+        Args:
+            texts: Sequence of texts to analyze
+            
+        Returns:
+            List of (T, T) attention matrices scaled to 0-1, in input order
+        """
+        return [self._summarize_attention(maps) for maps in self.transformer.extract_batch(texts)]
+    
+    def _extract_attention(self, text):
+        """
+        Extract attention patterns from text
+        
+        Uses the loaded backend; without a model the attention is simulated.
+        """
+        return self.extract_attention_batch([text])[0]
+    
+    def _summarize_attention(self, maps):
+        """Average the heads of the audited layer and scale to 0-1"""
+        if maps.size == 0:
+            return np.zeros((1, 1))
+        
+        attention = maps[self.layer_idx].mean(axis=0)
+        return (attention - attention.min()) / (attention.max() - attention.min() + 1e-8)
+
+def _render_audit_batch(matrices, paths, theme):
+    """Render audit glyphs for a batch; returns the seconds spent"""
+    from ..glyphs.generator import generate_glyph, generate_glyphs_batch
+    
+    start = time.perf_counter()
+    if len({matrix.shape for matrix in matrices}) == 1:
+        # The template serializer writes the same bytes as audit() does
+        generate_glyphs_batch(np.stack(matrices), theme, paths, backend="template")
+    else:
+        for attention, path in zip(matrices, paths):
+            generate_glyph(attention, path, theme, backend="template")
+    return time.perf_counter() - start
+
+
+def _write_audit(output_path, svg):
+    """Write audit SVG bytes, creating the directory on first write"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(svg)
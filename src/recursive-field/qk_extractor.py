@@ -7,50 +7,66 @@ for interpretability analysis.
 
 import numpy as np
 
-def extract_qkov(text, model_name=None, layer_idx=-1):
+# recursive-field is not an importable package name, so import from the root
+from src.seeding import memoize_by_digest, stable_rng
+
+# Version of extract_qkov's QK/OV matrices
+QKOV_VERSION = "1"
+
+@memoize_by_digest("qkov", QKOV_VERSION)
+def extract_qkov(text, model_name=None, layer_idx=-1, max_tokens=20, num_heads=None):
     """
     Extract QK/OV attention components from text input
     
     Args:
         text: Input text to process
         model_name: Optional model to use (not implemented in this stub)
-        layer_idx: Layer to extract from (default: last layer)
+        layer_idx: Layer to extract from (default: last layer), or a
+            sequence of layers to extract together
+        max_tokens: Maximum number of tokens to keep (None for no limit)
+        num_heads: Number of attention heads to extract per layer
+            (optional)
         
     Returns:
-        Dictionary with QK and OV matrices
+        Dictionary with QK and OV matrices. A single layer without
+        num_heads gives (T, T) matrices; a sequence of layers or num_heads
+        gives stacked (layers, heads, T, T) arrays.
     """
     # This is a stub implementation - in a real version,
     # this would connect to a transformer model
     
     # Create deterministic output based on input text
-    text_hash = hash(text) % 10000
-    np.random.seed(text_hash)
+    rng = stable_rng("qkov", text)
     
     # Tokenize (simplified)
-    tokens = text.split()[:20]  # Limit to 20 tokens for simplicity
+    tokens = text.split()[:max_tokens]
     seq_len = len(tokens)
     
+    stacked = num_heads is not None or not np.isscalar(layer_idx)
+    layers = [layer_idx] if np.isscalar(layer_idx) else list(layer_idx)
+    heads = 1 if num_heads is None else num_heads
+    
     # Create attention matrices
-    qk_matrix = np.random.rand(seq_len, seq_len)
+    qk_matrix = rng.random((len(layers), heads, seq_len, seq_len))
     
-    # Add structure
-    for i in range(seq_len):
-        for j in range(seq_len):
-            # Add diagonal emphasis
-            if i == j:
-                qk_matrix[i, j] += 0.3
-            # Add local attention falloff
-            else:
-                qk_matrix[i, j] += 0.1 / (1 + abs(i - j))
+    # Add structure: diagonal emphasis and local attention falloff
+    positions = np.arange(seq_len)
+    distance = np.abs(positions[:, None] - positions[None, :])
+    qk_matrix += np.where(distance == 0, 0.3, 0.1 / (1 + distance))
     
-    # Normalize
-    qk_matrix = qk_matrix / qk_matrix.max()
+    # Normalize each matrix
+    qk_matrix /= qk_matrix.max(axis=(-2, -1), keepdims=True)
     
     # For OV, create a related but different matrix
-    ov_matrix = np.roll(qk_matrix, shift=1, axis=0)
+    ov_matrix = np.roll(qk_matrix, shift=1, axis=-2)
+    
+    if not stacked:
+        qk_matrix = qk_matrix[0, 0]
+        ov_matrix = ov_matrix[0, 0]
     
     return {
         "qk": qk_matrix,
         "ov": ov_matrix,
-        "tokens": tokens
+        "tokens": tokens,
+        "layers": layers
     }
@@ -0,0 +1,225 @@
+"""
+Ritual History - Bounded, indexed store of performed rituals
+"""
+
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from datetime import datetime
+
+from ..seeding import stable_digest
+
+# Format of ritual timestamps, which sort in time order as strings
+TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+
+
+class RitualHistory:
+    """
+    Ring buffer of recent rituals backed by an append-only JSONL log
+
+    The newest `capacity` rituals stay in memory, indexed by ritual id,
+    intent digest and drift tier. Every ritual is also queued for the
+    log, which is written in batches once `flush_every` records are
+    waiting or, from a background timer, `flush_interval` seconds after
+    the first record of a batch was queued, and again when the store is
+    closed or garbage collected.
+    """
+
+    def __init__(self, capacity=1024, log_path="output/rituals/history.jsonl", flush_every=64,
+                 flush_interval=5.0):
+        """
+        Initialize the history store
+
+        Args:
+            capacity: Maximum number of rituals kept in memory
+            log_path: JSONL file every ritual is appended to (None to keep
+                history in memory only)
+            flush_every: Queued records that trigger a write
+            flush_interval: Seconds after which queued records are written,
+                even if nothing else is added
+        """
+        self.capacity = capacity
+        # Resolved now so a later chdir cannot move the log
+        self.log_path = os.path.abspath(log_path) if log_path is not None else None
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+
+        self._records = deque()
+        self._by_id = {}
+        self._by_intent = {}
+        self._by_tier = {}
+        self._pending = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._timer = None
+
+        # Write whatever is still queued when the store goes away or at exit
+        self._finalizer = weakref.finalize(self, _write_pending, self.log_path, self._pending,
+                                           self._lock, self._write_lock)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(list(self._records))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, ritual, flush=True):
+        """
+        Record a ritual
+
+        Args:
+            ritual: Ritual dictionary from RitualSimulator
+            flush: Write the log now if a batch is due; pass False from
+                code that must not block and call flush_if_due() later
+        """
+        with self._lock:
+            if len(self._records) == self.capacity:
+                self._evict(self._records.popleft())
+            self._records.append(ritual)
+
+            self._by_id[ritual["id"]] = ritual
+            self._by_intent.setdefault(stable_digest(ritual["intent"]), deque()).append(ritual)
+            self._by_tier.setdefault(_tier_of(ritual), deque()).append(ritual)
+
+            if self.log_path is not None:
+                self._pending.append(ritual)
+                if self._timer is None:
+                    self._arm_timer()
+
+        if flush:
+            self.flush_if_due()
+
+    def get(self, ritual_id):
+        """Return the in-memory ritual with this id, or None"""
+        return self._by_id.get(ritual_id)
+
+    def query(self, tier=None, since=None, intent=None, limit=None):
+        """
+        Find in-memory rituals, newest first
+
+        Args:
+            tier: Drift tier to match ("safe", "caution", "critical")
+            since: Earliest timestamp, as a datetime or a ritual timestamp
+                string
+            intent: Exact intent statement to match
+            limit: Maximum number of rituals returned
+
+        Returns:
+            List of ritual dictionaries
+        """
+        if isinstance(since, datetime):
+            since = since.strftime(TIMESTAMP_FORMAT)
+
+        # Start from the smallest index that applies
+        with self._lock:
+            candidates = [self._records]
+            if tier is not None:
+                candidates.append(self._by_tier.get(tier, ()))
+            if intent is not None:
+                candidates.append(self._by_intent.get(stable_digest(intent), ()))
+            records = list(min(candidates, key=len))
+
+        # Rituals built concurrently may be added slightly out of time order,
+        # so `since` filters rather than ending the scan
+        results = []
+        for ritual in reversed(records):
+            if since is not None and ritual["timestamp"] < since:
+                continue
+            if tier is not None and _tier_of(ritual) != tier:
+                continue
+            if intent is not None and ritual["intent"] != intent:
+                continue
+            results.append(ritual)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def iter_log(self):
+        """Yield every ritual written to the log, oldest first"""
+        self.flush()
+        if self.log_path is None or not os.path.exists(self.log_path):
+            return
+
+        with open(self.log_path, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def flush_if_due(self):
+        """Write queued records if a full batch is waiting or the interval passed"""
+        if len(self._pending) >= self.flush_every or (
+                self._pending and time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write all queued records to the log"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        _write_pending(self.log_path, self._pending, self._lock, self._write_lock)
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """Flush the log and stop the flush timer; the store stays usable afterwards"""
+        self.flush()
+
+    def _arm_timer(self):
+        """Start a timer that flushes the batch just begun (lock held)"""
+        # The timer holds only a weak reference, so it never keeps the store alive
+        self._timer = threading.Timer(self.flush_interval, _flush_from_timer, args=(weakref.ref(self),))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _evict(self, ritual):
+        """Drop the oldest ritual from the indexes (lock held)"""
+        if self._by_id.get(ritual["id"]) is ritual:
+            del self._by_id[ritual["id"]]
+
+        # FIFO eviction means the ritual is the oldest entry of its indexes
+        for index, key in ((self._by_intent, stable_digest(ritual["intent"])),
+                           (self._by_tier, _tier_of(ritual))):
+            entries = index[key]
+            entries.popleft()
+            if not entries:
+                del index[key]
+
+
+def _tier_of(ritual):
+    """Drift tier name of a ritual"""
+    return ritual["drift_assessment"]["tier"]
+
+
+def _flush_from_timer(ref):
+    """Flush a history store if it still exists"""
+    history = ref()
+    if history is not None:
+        history.flush()
+
+
+def _write_pending(log_path, pending, lock, write_lock):
+    """Append queued rituals to the log as one write and clear the queue"""
+    # The write lock keeps batches in order; the index lock is only held
+    # long enough to take the batch, so adds never wait on the disk
+    with write_lock:
+        with lock:
+            batch = pending[:]
+            pending.clear()
+        if not batch or log_path is None:
+            return
+        lines = "".join(json.dumps(ritual, ensure_ascii=False) + "\n" for ritual in batch)
+
+        directory = os.path.dirname(log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(lines)
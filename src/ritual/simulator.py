@@ -4,13 +4,36 @@ for transformer attention visualization and ethical exploration
 """
 
 import numpy as np
+import asyncio
 import hashlib
+import re
+import weakref
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import os
 from pathlib import Path
 
-# Create output directory
-os.makedirs("output/rituals", exist_ok=True)
+from .history import RitualHistory
+from ..concurrency import loop_semaphore, worker_context
+from ..seeding import stable_rng, stable_seed
+
+# Directory for ritual glyphs and records, created on first write
+OUTPUT_DIR = "output/rituals"
+
+# Keywords that double the weight of each symbol, in symbol order
+SYMBOL_KEYWORDS = (
+    ("diverge", "split", "branch", "different"),  # ⊻ (Divergence)
+    ("repeat", "cycle", "recursive", "loop"),     # ∇ (Recursion)
+    ("align", "harmony", "balance", "peace"),     # ◇ (Alignment)
+    ("complete", "finish", "final", "whole"),     # Ω (Completion)
+)
+
+# Every keyword at once; the lookahead also reports overlapping matches,
+# so this agrees with testing each keyword as a substring
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(word for words in SYMBOL_KEYWORDS for word in words) + "))")
+_KEYWORD_SYMBOL = {word: index for index, words in enumerate(SYMBOL_KEYWORDS) for word in words}
 
 class RitualSimulator:
     """
@@ -18,10 +41,26 @@ class RitualSimulator:
     visual patterns and ethical insights
     """
     
-    def __init__(self):
-        """Initialize the ritual simulator"""
+    def __init__(self, max_concurrency=64, executor=None, history=None, text_records=False):
+        """
+        Initialize the ritual simulator
+        
+        Args:
+            max_concurrency: Maximum aperform_ritual calls working at once
+            executor: Executor for aperform_ritual's CPU work (default:
+                the event loop's default thread pool)
+            history: RitualHistory to record rituals in (default: the last
+                1024 in memory, all of them in output/rituals/history.jsonl)
+            text_records: Also write a readable .txt record per ritual
+        """
         self.symbols = ["⊻", "∇", "◇", "Ω"]
-        self.ritual_history = []
+        self.history = history if history is not None else RitualHistory(
+            log_path=f"{OUTPUT_DIR}/history.jsonl")
+        self.text_records = text_records
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        # One semaphore per event loop, see loop_semaphore
+        self._semaphores = weakref.WeakKeyDictionary()
     
     def perform_ritual(self, intent, depth=3, theme="cosmic"):
         """
@@ -35,6 +74,119 @@ class RitualSimulator:
         Returns:
             Dictionary with ritual results
         """
+        ritual = self._build_ritual(intent, depth, theme)
+        
+        # Add to history, which appends it to the log in batches
+        self.history.add(ritual)
+        
+        # Save readable ritual record
+        if self.text_records:
+            self._save_ritual_record(ritual)
+        
+        return ritual
+    
+    @property
+    def ritual_history(self):
+        """Rituals held in memory, oldest first"""
+        return list(self.history)
+    
+    def query_history(self, tier=None, since=None, intent=None, limit=None):
+        """
+        Find recent rituals through the history indexes
+        
+        Args:
+            tier: Drift tier to match ("safe", "caution", "critical")
+            since: Earliest timestamp, as a datetime or a ritual timestamp
+                string
+            intent: Exact intent statement to match
+            limit: Maximum number of rituals returned
+            
+        Returns:
+            List of ritual dictionaries, newest first
+        """
+        return self.history.query(tier=tier, since=since, intent=intent, limit=limit)
+    
+    async def aperform_ritual(self, intent, depth=3, theme="cosmic", timeout=None):
+        """
+        Perform a ritual without blocking the event loop
+        
+        The ritual is built on the executor and its record is written from a
+        worker thread. Calls beyond max_concurrency wait their turn.
+        
+        Args:
+            intent: The user's intention statement
+            depth: Ritual depth/complexity (1-5)
+            theme: Visual theme ("cosmic", "void", "flame")
+            timeout: Seconds to wait, including time queued for a slot
+                (None for no limit); raises asyncio.TimeoutError
+            
+        Returns:
+            Dictionary with ritual results
+        """
+        return await asyncio.wait_for(self._aperform_ritual(intent, depth, theme), timeout)
+    
+    async def _aperform_ritual(self, intent, depth, theme):
+        """Perform one ritual once a concurrency slot is free"""
+        loop = asyncio.get_running_loop()
+        async with loop_semaphore(self._semaphores, self.max_concurrency):
+            ritual = await loop.run_in_executor(self.executor, self._build_ritual, intent, depth, theme)
+            
+            # Index in memory now and leave any due log write to a worker thread
+            self.history.add(ritual, flush=False)
+            await asyncio.to_thread(self.history.flush_if_due)
+            if self.text_records:
+                await asyncio.to_thread(self._save_ritual_record, ritual)
+            return ritual
+    
+    def perform_rituals(self, intents, depth=3, theme="cosmic", workers=None):
+        """
+        Perform many rituals in one batch
+        
+        Attention for every intent is generated as one stacked array, drift
+        is scored in a single vectorized pass and glyphs render on a process
+        pool. Each ritual's sequence, glyph and tier match perform_ritual;
+        holograms are only built when asked for.
+        
+        Args:
+            intents: Sequence of intention statements
+            depth: Ritual depth/complexity (1-5)
+            theme: Visual theme ("cosmic", "void", "flame")
+            workers: Number of glyph rendering processes (default: CPU
+                count); 1 or fewer renders in this process
+            
+        Returns:
+            RitualBatch with one column per ritual field
+        """
+        from ..ethics.drift_tier import DriftMonitor
+        
+        intents = list(intents)
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        
+        # The position keeps ids unique when an intent repeats in a batch
+        ids = [hashlib.md5(f"{intent}{timestamp}{i}".encode()).hexdigest()[:8]
+               for i, intent in enumerate(intents)]
+        
+        attention = self._generate_attention_batch(intents)
+        codes, entropy = DriftMonitor().assess_batch(attention, return_entropy=True)
+        sequences = self.generate_symbol_sequences(intents, depth)
+        
+        glyph_paths = [f"{OUTPUT_DIR}/ritual_{ritual_id}.svg" for ritual_id in ids]
+        if intents:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            _render_glyphs_parallel(attention, glyph_paths, theme, workers)
+        
+        batch = RitualBatch(self, ids, timestamp, intents, depth, theme, sequences,
+                            glyph_paths, codes, entropy)
+        
+        # Queue every record, then write the log once
+        for ritual in batch.records(holograms=False):
+            self.history.add(ritual, flush=False)
+        self.history.flush()
+        
+        return batch
+    
+    def _build_ritual(self, intent, depth, theme):
+        """Compute a ritual record, including its glyph, without saving it"""
         # Create a timestamp
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         
@@ -69,27 +221,20 @@ class RitualSimulator:
             "drift_assessment": drift
         }
         
-        # Add to history
-        self.ritual_history.append(ritual)
-        
-        # Save ritual record
-        self._save_ritual_record(ritual)
-        
         return ritual
     
     def _generate_attention(self, intent):
         """Generate an attention pattern from user intent"""
-        # Create a deterministic seed from the intent
-        seed = int.from_bytes(hashlib.md5(intent.encode()).digest()[:4], 'big')
-        np.random.seed(seed)
+        # Create a deterministic generator from the intent
+        rng = stable_rng("ritual-attention", intent)
         
         # Generate a 12x12 attention matrix
-        attention = np.random.rand(12, 12)
+        attention = rng.random((12, 12))
         
         # Add structure based on word patterns in intent
         words = intent.split()
         for i, word in enumerate(words[:10]):
-            word_hash = hash(word) % 100
+            word_hash = _word_hash(word)
             row = i % 12
             
             # Add emphasis based on word
@@ -101,6 +246,29 @@ class RitualSimulator:
         
         return attention
     
+    def _generate_attention_batch(self, intents):
+        """Generate stacked (N, 12, 12) attention patterns, one per intent"""
+        attention = np.stack([stable_rng("ritual-attention", intent).random((12, 12))
+                              for intent in intents]) if intents else np.empty((0, 12, 12))
+        
+        # Gather the word emphasis of every intent, then apply it at once
+        matrix_index, rows, word_hashes = [], [], []
+        for n, intent in enumerate(intents):
+            for i, word in enumerate(intent.split()[:10]):
+                matrix_index.append(n)
+                rows.append(i % 12)
+                word_hashes.append(_word_hash(word))
+        
+        if word_hashes:
+            stops = np.pi * np.array(word_hashes) / 50
+            waves = np.sin(np.linspace(0, stops, 12, axis=1))
+            attention[matrix_index, rows] = attention[matrix_index, rows] * 0.8 + 0.2 * waves
+        
+        # Normalize each matrix
+        low = attention.min(axis=(1, 2), keepdims=True)
+        high = attention.max(axis=(1, 2), keepdims=True)
+        return (attention - low) / (high - low + 1e-8)
+    
     def _generate_glyph(self, attention, ritual_id, theme):
         """Generate a glyph from attention pattern"""
         try:
@@ -108,7 +276,8 @@ class RitualSimulator:
             from ..glyphs.generator import generate_glyph
             
             # Generate glyph
-            output_path = f"output/rituals/ritual_{ritual_id}.svg"
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            output_path = f"{OUTPUT_DIR}/ritual_{ritual_id}.svg"
             return generate_glyph(attention, output_path, theme)
         except ImportError:
             # If import fails, return a placeholder path
@@ -116,42 +285,44 @@ class RitualSimulator:
     
     def _generate_symbol_sequence(self, intent, depth):
         """Generate a symbolic sequence based on intent and depth"""
-        # Seed based on intent
-        seed = int.from_bytes(hashlib.md5(intent.encode()).digest()[:4], 'big')
-        np.random.seed(seed)
+        return self.generate_symbol_sequences([intent], depth)[0]
+    
+    def generate_symbol_sequences(self, intents, depth=3):
+        """
+        Generate symbolic sequences for many intents at once
+        
+        Each sequence matches what perform_ritual produces for its intent.
         
-        # Generate sequence
-        sequence = []
-        for _ in range(depth * 3):
-            # Choose symbol with bias based on intent
-            weights = self._calculate_symbol_weights(intent)
-            symbol = np.random.choice(self.symbols, p=weights)
-            sequence.append(symbol)
+        Args:
+            intents: Sequence of intention statements
+            depth: Ritual depth/complexity (1-5)
+            
+        Returns:
+            List of sequence strings in input order
+        """
+        if not len(intents):
+            return []
+        
+        # Generator based on each intent, choosing every symbol at once with
+        # bias based on the intent
+        length = depth * 3
+        codes = np.stack([
+            stable_rng("ritual-sequence", intent).choice(len(self.symbols), size=length,
+                                                          p=self._calculate_symbol_weights(intent))
+            for intent in intents
+        ])
         
-        return "".join(sequence)
+        symbols = np.array(self.symbols)
+        return ["".join(row) for row in symbols[codes].tolist()]
     
     def _calculate_symbol_weights(self, intent):
         """Calculate weights for symbol selection based on intent"""
-        intent_lower = intent.lower()
-        
-        # Default weights
-        weights = np.ones(len(self.symbols)) / len(self.symbols)
-        
-        # Adjust weights based on keywords
-        if any(word in intent_lower for word in ["diverge", "split", "branch", "different"]):
-            weights[0] *= 2  # Favor ⊻ (Divergence)
-        if any(word in intent_lower for word in ["repeat", "cycle", "recursive", "loop"]):
-            weights[1] *= 2  # Favor ∇ (Recursion)
-        if any(word in intent_lower for word in ["align", "harmony", "balance", "peace"]):
-            weights[2] *= 2  # Favor ◇ (Alignment)
-        if any(word in intent_lower for word in ["complete", "finish", "final", "whole"]):
-            weights[3] *= 2  # Favor Ω (Completion)
-        
-        # Normalize weights
-        return weights / weights.sum()
+        return np.array(_symbol_weights(intent, len(self.symbols)))
     
     def _generate_hologram(self, intent, sequence, depth):
         """Generate an ASCII hologram"""
+        rng = stable_rng("ritual-hologram", intent, sequence, depth)
+        
         # Calculate dimensions based on depth
         width = depth * 4 + 10
         
@@ -175,7 +346,7 @@ class RitualSimulator:
         
         # Add ritual matrix
         for i in range(depth):
-            symbols = np.random.choice(list(sequence), min(width-6, 10))
+            symbols = rng.choice(list(sequence), min(width-6, 10))
             line = " ".join(symbols)
             lines.append(f"|  {line}  |".center(width))
         
@@ -214,7 +385,8 @@ class RitualSimulator:
     
     def _save_ritual_record(self, ritual):
         """Save ritual record to a text file"""
-        output_path = f"output/rituals/ritual_{ritual['id']}.txt"
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        output_path = f"{OUTPUT_DIR}/ritual_{ritual['id']}.txt"
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(f"RITUAL ID: {ritual['id']}\n")
@@ -236,6 +408,109 @@ class RitualSimulator:
         
         return output_path
 
+class RitualBatch:
+    """
+    Columnar results of RitualSimulator.perform_rituals
+    
+    Ids, sequences, tiers and glyph paths are stored as one column each.
+    Holograms are built on first access to a ritual's hologram.
+    """
+    
+    def __init__(self, simulator, ids, timestamp, intents, depth, theme, sequences,
+                 glyph_paths, tier_codes, entropy):
+        """Store the columns of a performed batch"""
+        from ..ethics.drift_tier import DriftMonitor
+        
+        self._simulator = simulator
+        self._holograms = {}
+        self.ids = ids
+        self.timestamp = timestamp
+        self.intents = intents
+        self.depth = depth
+        self.theme = theme
+        self.sequences = sequences
+        self.glyph_paths = glyph_paths
+        self.tier_codes = tier_codes
+        self.tiers = np.array(DriftMonitor.TIERS)[tier_codes]
+        self.entropy = entropy
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __getitem__(self, index):
+        """Ritual dictionary in the same form perform_ritual returns"""
+        return self._record(index, self.hologram(index))
+    
+    def hologram(self, index):
+        """ASCII hologram of one ritual, built on first access"""
+        if index not in self._holograms:
+            self._holograms[index] = self._simulator._generate_hologram(
+                self.intents[index], self.sequences[index], self.depth)
+        return self._holograms[index]
+    
+    def records(self, holograms=True):
+        """
+        Iterate over the rituals as dictionaries
+        
+        Args:
+            holograms: Include hologram text; without it no hologram is built
+        """
+        for index in range(len(self)):
+            yield self._record(index, self.hologram(index) if holograms else None)
+    
+    def _record(self, index, hologram):
+        """Assemble one ritual dictionary, leaving out a missing hologram"""
+        from ..ethics.drift_tier import DriftMonitor
+        
+        ritual = {
+            "id": self.ids[index],
+            "timestamp": self.timestamp,
+            "intent": self.intents[index],
+            "depth": self.depth,
+            "theme": self.theme,
+            "sequence": self.sequences[index],
+            "glyph_path": self.glyph_paths[index],
+            "drift_assessment": dict(DriftMonitor.TIER_DETAILS[int(self.tier_codes[index])]),
+        }
+        if hologram is not None:
+            ritual["hologram"] = hologram
+        return ritual
+
+def _render_glyphs_parallel(attention, paths, theme, workers):
+    """Render a stack of ritual glyphs, split across worker processes"""
+    from ..glyphs.generator import generate_glyphs_batch
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    # The template serializer writes the same bytes as generate_glyph
+    if workers <= 1 or len(paths) < 2 * workers:
+        generate_glyphs_batch(attention, theme, paths, backend="template")
+        return
+    
+    bounds = np.linspace(0, len(paths), workers * 4 + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context()) as executor:
+        futures = [executor.submit(generate_glyphs_batch, attention[start:stop], theme,
+                                   paths[start:stop], backend="template")
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        for future in futures:
+            future.result()
+
+@lru_cache(maxsize=65536)
+def _word_hash(word):
+    """Stable 0-99 hash of a word used to shape attention rows"""
+    return stable_seed(word) % 100
+
+@lru_cache(maxsize=4096)
+def _symbol_weights(intent, n_symbols):
+    """Normalized symbol weights for an intent, doubled for each keyword group found"""
+    weights = np.ones(n_symbols) / n_symbols
+    for index in {_KEYWORD_SYMBOL[word] for word in _KEYWORD_PATTERN.findall(intent.lower())}:
+        weights[index] *= 2
+    
+    # Normalize weights
+    return tuple(weights / weights.sum())
+
 # Helper function for easy import
 def perform_ritual(intent, depth=3, theme="cosmic"):
     """
@@ -249,5 +524,28 @@ def perform_ritual(intent, depth=3, theme="cosmic"):
     Returns:
         Dictionary with ritual results
     """
-    simulator = RitualSimulator()
-    return simulator.perform_ritual(intent, depth, theme)
+    return _default_simulator().perform_ritual(intent, depth, theme)
+
+def perform_rituals(intents, depth=3, theme="cosmic", workers=None):
+    """
+    Perform many rituals in one batch
+    
+    Args:
+        intents: Sequence of intention statements
+        depth: Ritual depth/complexity (1-5)
+        theme: Visual theme ("cosmic", "void", "flame")
+        workers: Number of glyph rendering processes (default: CPU count)
+        
+    Returns:
+        RitualBatch with one column per ritual field
+    """
+    return _default_simulator().perform_rituals(intents, depth, theme, workers)
+
+_simulator = None
+
+def _default_simulator():
+    """Shared simulator behind the helpers, created on first use"""
+    global _simulator
+    if _simulator is None:
+        _simulator = RitualSimulator()
+    return _simulator
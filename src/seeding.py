@@ -0,0 +1,124 @@
+"""
+Stable Seeding - Process-independent randomness and memoization for extractors
+
+Python's hash() of a string is salted per process, so seeding from it gives
+each worker different matrices for the same prompt. Everything here derives
+from blake2b digests instead and draws from per-call Generators, leaving the
+global NumPy random state untouched.
+"""
+
+import numpy as np
+import functools
+import hashlib
+import os
+import pickle
+import sys
+
+from .cache import DigestCache
+
+# Directory shared by every worker for memoized results; unset keeps the
+# memoization in memory only. Entries are pickles, so it must be trusted.
+MEMO_DIR_ENV = "CROWNBRIDGE_MEMO_DIR"
+
+
+def stable_digest(*parts):
+    """
+    Digest values that are stable across processes and Python runs
+
+    Args:
+        parts: Values whose repr() identifies the input
+
+    Returns:
+        32-character hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def stable_seed(*parts, bits=32):
+    """Integer seed derived from a stable digest"""
+    return int(stable_digest(*parts), 16) % (1 << bits)
+
+
+def stable_rng(*parts):
+    """
+    Create a random generator seeded from a stable digest
+
+    Args:
+        parts: Values identifying the input, e.g. a namespace and the text
+
+    Returns:
+        np.random.Generator private to the caller
+    """
+    return np.random.default_rng(int(stable_digest(*parts), 16))
+
+
+def memoize_by_digest(namespace, version, max_entries=128, max_disk_bytes=256 * 1024 * 1024,
+                      max_memory_bytes=128 * 1024 * 1024, max_result_bytes=8 * 1024 * 1024):
+    """
+    Memoize a deterministic function on a stable digest of its arguments
+
+    Results are kept pickled in an in-memory LRU tier and, when the
+    CROWNBRIDGE_MEMO_DIR environment variable names a directory, in an
+    on-disk tier under it that every worker process shares. Callers never
+    share an object with the cache, so mutating a result does not corrupt
+    it. Results whose arrays exceed max_result_bytes are returned without
+    being memoized, since pickling them costs about as much as recomputing.
+    Results persist across runs, so bump `version` whenever the function's
+    output changes; older entries then live in a directory nothing reads.
+
+    Args:
+        namespace: Name separating this function's entries from others
+        version: Version of the function's output, part of every key;
+            bump it whenever the output changes to invalidate old results
+        max_entries: Maximum number of results held in memory
+        max_disk_bytes: Maximum total size of the on-disk tier
+        max_memory_bytes: Maximum total size of the in-memory tier
+        max_result_bytes: Largest result, by _result_nbytes, worth memoizing
+
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        cache = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal cache
+            if cache is None:
+                memo_dir = os.environ.get(MEMO_DIR_ENV)
+                cache = DigestCache(
+                    cache_dir=os.path.join(memo_dir, namespace, str(version)) if memo_dir else None,
+                    max_entries=max_entries, max_disk_bytes=max_disk_bytes, suffix=".pkl",
+                    max_memory_bytes=max_memory_bytes)
+                wrapper.cache = cache
+
+            key = stable_digest(namespace, version, args, sorted(kwargs.items()))
+            cached = cache.get(key)
+            if cached is not None:
+                return pickle.loads(cached)
+
+            result = func(*args, **kwargs)
+            if _result_nbytes(result) <= max_result_bytes:
+                # The cache keeps its own pickle, so the result itself can be returned
+                cache.put(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            return result
+
+        wrapper.cache = None
+        return wrapper
+
+    return decorator
+
+
+def _result_nbytes(value):
+    """Approximate size of a result, counting arrays by their buffers"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_result_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_result_nbytes(item) for item in value)
+    return sys.getsizeof(value)
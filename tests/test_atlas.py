@@ -0,0 +1,269 @@
+"""
+Tests for the Drift Atlas node store, spatial index and renderer
+"""
+
+import sys
+import os
+import io
+import base64
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.atlas.raster import splat_disks, static_layer
+from src.atlas.spatial import GridIndex
+from src.atlas.store import NodeStore
+from src.atlas.tiles import TileRenderer
+from src.atlas.visualizer import DriftAtlas
+
+def random_atlas(count, seed=0):
+    """Atlas with uniformly scattered nodes of random tiers"""
+    rng = np.random.default_rng(seed)
+    atlas = DriftAtlas()
+    atlas.store.extend([f"node {i}" for i in range(count)], rng.uniform(-1, 1, count),
+                       rng.uniform(-1, 1, count), rng.integers(0, 3, count))
+    return atlas
+
+class TestNodeStore(unittest.TestCase):
+    """Test cases for the columnar node store"""
+
+    def test_columns_and_growth(self):
+        """Test that nodes survive array growth and read back as dicts"""
+        store = NodeStore(capacity=2)
+        store.append("Origin Point", 0.0, 0.0, "safe", "Neutral start")
+        store.extend(["ψ", "b", "c"], [0.1, 0.2, 0.3], [-0.1, -0.2, -0.3], ["critical", "caution", "safe"])
+
+        self.assertEqual(len(store), 4)
+        self.assertEqual(store.names.take([0, 1]), ["Origin Point", "ψ"])
+        self.assertEqual(list(store.tier_codes), [0, 2, 1, 0])
+        self.assertEqual(store.descriptions[0], "Neutral start")
+        with self.assertRaises(ValueError):
+            store.extend(["bad"], [0], [0], [3])
+
+        atlas = DriftAtlas()
+        atlas.add_sample_nodes()
+        self.assertEqual(atlas.nodes[4]["name"], "Boundary Erosion")
+        self.assertEqual(atlas.nodes[4]["symbol"], "⊻")
+
+    def test_unknown_tiers_render_as_before(self):
+        """Test that other tier names are kept and drawn white with ◇"""
+        atlas = DriftAtlas()
+        atlas.add_node("Origin Point", 0.0, 0.0, "safe")
+        atlas.add_node("Uncharted", 0.5, 0.5, "experimental")
+
+        self.assertEqual(atlas.node(1)["tier"], "experimental")
+        self.assertEqual(atlas.node(1)["symbol"], "◇")
+        self.assertEqual(atlas.tier_counts(), {"safe": 1, "caution": 0, "critical": 0, "experimental": 1})
+        self.assertEqual(tuple(atlas.tier_colors()[atlas.store.tier_codes[1]]), (255, 255, 255))
+        self.assertEqual(list(atlas.label_indices(max_labels=1)), [0])
+        self.assertTrue(atlas.visualize(size=2, dpi=40).startswith("data:image/png;base64,"))
+
+class TestGridIndex(unittest.TestCase):
+    """Test cases for the grid spatial index"""
+
+    def test_query_box_matches_scan(self):
+        """Test box queries against a brute-force scan"""
+        rng = np.random.default_rng(1)
+        x, y = rng.normal(0, 0.6, 5000), rng.normal(0, 0.6, 5000)
+        index = GridIndex(x, y)
+
+        for box in [(-0.2, 0.3, -0.1, 0.4), (-5, 5, -5, 5), (0.9, 2.5, -3, -0.5)]:
+            xmin, xmax, ymin, ymax = box
+            expected = np.flatnonzero((x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax))
+            np.testing.assert_array_equal(index.query_box(*box), expected)
+
+    def test_nearest_and_radius_match_scan(self):
+        """Test neighbor queries against a brute-force scan"""
+        rng = np.random.default_rng(2)
+        x, y = rng.normal(0, 0.4, 5000), rng.uniform(-1, 1, 5000)
+        index = GridIndex(x, y)
+
+        for point in [(0.1, 0.2), (-0.99, 0.99), (3.0, -2.0)]:
+            distances = np.hypot(x - point[0], y - point[1])
+            for k in (1, 7, 300):
+                expected = np.lexsort((np.arange(len(x)), distances))[:k]
+                indices, found = index.nearest(*point, k=k)
+                np.testing.assert_array_equal(indices, expected)
+                np.testing.assert_allclose(found, distances[expected])
+            np.testing.assert_array_equal(index.query_radius(*point, 0.3), np.flatnonzero(distances <= 0.3))
+
+        self.assertEqual(len(GridIndex([], []).nearest(0, 0, k=3)[0]), 0)
+
+    def test_extended_tail_matches_scan(self):
+        """Test that queries see nodes appended after the grid was built"""
+        rng = np.random.default_rng(3)
+        x, y = rng.uniform(-1, 1, 3000), rng.uniform(-1, 1, 3000)
+        index = GridIndex(x[:2000], y[:2000])
+        index.extend(x, y)
+        self.assertEqual(index.tail, 1000)
+
+        distances = np.hypot(x - 0.2, y + 0.1)
+        np.testing.assert_array_equal(index.nearest(0.2, -0.1, k=20)[0],
+                                      np.lexsort((np.arange(len(x)), distances))[:20])
+        np.testing.assert_array_equal(index.query_radius(0.2, -0.1, 0.2), np.flatnonzero(distances <= 0.2))
+        np.testing.assert_array_equal(index.query_box(-0.5, 0, 0, 0.5),
+                                      np.flatnonzero((x >= -0.5) & (x <= 0) & (y >= 0) & (y <= 0.5)))
+
+class TestDriftAtlas(unittest.TestCase):
+    """Test cases for level-of-detail rendering"""
+
+    def test_add_nodes_bulk(self):
+        """Test CSV, column and numeric array ingestion"""
+        atlas = DriftAtlas()
+        csv_text = "name,x,y,tier,description\nψ,0.1,-0.2,critical,\"Drift, fast\"\nb,0.3,0.4,safe,\n"
+        self.assertEqual(atlas.add_nodes_bulk(io.StringIO(csv_text)), range(0, 2))
+        self.assertEqual(atlas.node(0)["description"], "Drift, fast")
+        self.assertEqual(atlas.node(0)["tier"], "critical")
+
+        atlas.add_nodes_bulk({"name": ["c", "d"], "x": [0.5, 0.6], "y": [0.0, 0.0], "tier": [1, 1]})
+        added = atlas.add_nodes_bulk(np.array([[0.7, 0.7], [0.8, 0.8]]))
+        self.assertEqual(added, range(4, 6))
+        self.assertEqual(atlas.tier_counts(), {"safe": 3, "caution": 2, "critical": 1})
+
+        with self.assertRaises(ValueError):
+            atlas.add_nodes_bulk(io.StringIO("name,x,tier\na,0.1,safe\n"))
+        with self.assertRaises(ValueError):
+            atlas.add_nodes_bulk(io.StringIO("name,x,y,tier\na,oops,0.1,safe\n"))
+
+    def test_added_nodes_extend_index(self):
+        """Test that adding a node before a query does not rebuild the grid"""
+        atlas = random_atlas(5000)
+        grid = atlas.index
+        atlas.add_node("Fresh Glyph", 0.123, 0.456, "caution")
+
+        indices, distances = atlas.nearest(0.123, 0.456, k=1)
+        self.assertIs(atlas.index, grid)
+        self.assertEqual(atlas.node(indices[0])["name"], "Fresh Glyph")
+        self.assertEqual(distances[0], 0)
+
+        atlas.add_nodes_bulk(np.zeros((2000, 2)))
+        self.assertIsNot(atlas.index, grid)
+        self.assertEqual(atlas.index.tail, 0)
+
+    def test_tier_counts_grid(self):
+        """Test per-cell tier counts against the node columns"""
+        atlas = random_atlas(3000)
+        counts = atlas.tier_counts((-1, 1, -1, 1), bins=2)
+        store = atlas.store
+        north_east = (store.x >= 0) & (store.y >= 0)
+        self.assertEqual(counts.sum(), 3000)
+        np.testing.assert_array_equal(counts[1, 1], np.bincount(store.tier_codes[north_east], minlength=3))
+
+    def test_label_budget(self):
+        """Test that labels respect the budget and grow as the view zooms in"""
+        atlas = random_atlas(20000)
+        full = atlas.label_indices(max_labels=100)
+        zoomed = atlas.label_indices((0, 0.5, 0, 0.5), max_labels=100)
+
+        self.assertLessEqual(len(full), 100)
+        self.assertGreater(len(zoomed), np.sum((atlas.store.x[full] >= 0) & (atlas.store.x[full] <= 0.5)
+                                                & (atlas.store.y[full] >= 0) & (atlas.store.y[full] <= 0.5)))
+        self.assertGreater(np.mean(atlas.store.tier_codes[full] == 2), 0.9)
+
+    def test_visualize_viewport(self):
+        """Test rendering a zoomed view of a large atlas"""
+        atlas = random_atlas(5000)
+        image = atlas.visualize(viewport=(-0.25, 0.25, -0.25, 0.25), max_labels=20)
+        self.assertTrue(image.startswith("data:image/png;base64,"))
+
+    def test_static_layer_cached(self):
+        """Test that backgrounds are drawn once per size and dpi"""
+        from PIL import Image
+
+        calls = []
+        draw = lambda ax: calls.append(ax.plot([0, 1], [0, 1], color='white'))
+        first = static_layer("test_layer", draw, 2, 40, (0, 1), (0, 1))
+        self.assertIs(static_layer("test_layer", draw, 2, 40, (0, 1), (0, 1)), first)
+        self.assertEqual(first.shape, (80, 80, 3))
+        static_layer("test_layer", draw, 2, 50, (0, 1), (0, 1))
+        self.assertEqual(len(calls), 2)
+
+        atlas = DriftAtlas()
+        atlas.add_sample_nodes()
+        png = base64.b64decode(atlas.visualize(size=3, dpi=50).split(",", 1)[1])
+        self.assertEqual(Image.open(io.BytesIO(png)).size, (150, 150))
+
+    def test_splat_disks_last_node_on_top(self):
+        """Test that overlapping disks match painting them one at a time"""
+        rng = np.random.default_rng(3)
+        px, py = rng.integers(-2, 22, 200), rng.integers(-2, 22, 200)
+        colors = rng.integers(0, 256, (200, 3)).astype(np.uint8)
+        image = np.zeros((20, 20, 3), dtype=np.uint8)
+        splat_disks(image, px, py, colors, 2)
+
+        expected = np.zeros_like(image)
+        for i in range(200):
+            splat_disks(expected, px[i:i + 1], py[i:i + 1], colors[i:i + 1], 2)
+        np.testing.assert_array_equal(image, expected)
+
+class TestTileRenderer(unittest.TestCase):
+    """Test cases for the z/x/y tile pyramid"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+
+    def cached(self):
+        """Paths of the cached tiles"""
+        return {os.path.join(root, name) for root, _, names in os.walk(self.cache_dir)
+                for name in names if name.endswith(".png")}
+
+    def test_tiles_cached_and_invalidated(self):
+        """Test that tiles are served from disk and only nearby ones re-render"""
+        atlas = random_atlas(2000)
+        renderer = TileRenderer(atlas, cache_dir=self.cache_dir, label_zoom=2)
+
+        self.assertEqual(renderer.render_pyramid(2), 21)
+        tile = renderer.get_tile(2, 1, 1)
+        self.assertTrue(tile.startswith(b"\x89PNG"))
+        self.assertEqual(renderer.get_tile(2, 1, 1), tile)
+        with self.assertRaises(ValueError):
+            renderer.get_tile(1, 2, 0)
+
+        # A node in the north-west quarter leaves the other quarters cached
+        atlas.add_node("Far Drift", -0.9, 0.9, "critical")
+        renderer.sync()
+        missing = {renderer.tile_path(z, 0, 0) for z in range(3)}
+        self.assertEqual(self.cached(), {renderer.tile_path(z, x, y) for z in range(3)
+                                         for x in range(2 ** z) for y in range(2 ** z)} - missing)
+        self.assertEqual(renderer.render_pyramid(2), 3)
+
+        # A new renderer over the same atlas trusts the cached pyramid
+        self.assertEqual(TileRenderer(atlas, cache_dir=self.cache_dir, label_zoom=2).render_pyramid(2), 0)
+        self.assertEqual(TileRenderer(atlas, cache_dir=self.cache_dir).render_pyramid(2), 21)
+
+    def test_other_atlas_never_served_cached_tiles(self):
+        """Test that a different atlas over the same cache directory re-renders"""
+        first, second = random_atlas(500, seed=1), random_atlas(500, seed=2)
+        TileRenderer(first, cache_dir=self.cache_dir).get_tile(1, 1, 0)
+
+        renderer = TileRenderer(second, cache_dir=self.cache_dir)
+        self.assertEqual(renderer.get_tile(1, 1, 0), renderer.render_tile(1, 1, 0))
+
+        # Growing the drawn atlas keeps its pyramid; changing a drawn node does not
+        second.add_node("Late Drift", -0.9, -0.9, "caution")
+        self.assertEqual(TileRenderer(second, cache_dir=self.cache_dir).render_pyramid(1), 4)
+        self.assertEqual(TileRenderer(second, cache_dir=self.cache_dir).render_pyramid(1), 0)
+        second.store.x[0] += 0.01
+        self.assertEqual(TileRenderer(second, cache_dir=self.cache_dir).render_pyramid(1), 5)
+
+    def test_clearing_keeps_unrelated_files(self):
+        """Test that a stale or cleared pyramid only deletes the renderer's own files"""
+        report = os.path.join(self.cache_dir, "report.png")
+        with open(report, "wb") as f:
+            f.write(b"report")
+
+        renderer = TileRenderer(random_atlas(200), cache_dir=self.cache_dir)
+        self.assertEqual(renderer.render_pyramid(1), 5)
+        renderer.clear()
+
+        self.assertEqual(os.listdir(self.cache_dir), ["report.png"])
+        with open(report, "rb") as f:
+            self.assertEqual(f.read(), b"report")
+
+if __name__ == '__main__':
+    unittest.main()
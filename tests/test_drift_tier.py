@@ -0,0 +1,84 @@
+"""
+Tests for the Drift Tier protocol
+"""
+
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ethics.drift_tier import DriftMonitor, StreamingDriftMonitor, assess_drift, assess_drift_batch
+
+class TestDriftMonitor(unittest.TestCase):
+    """Test cases for the drift monitor"""
+
+    def test_assess_risk_tiers(self):
+        """Test that concentrated and uniform attention land in different tiers"""
+        concentrated = np.zeros((12, 12))
+        concentrated[0, 0] = 1.0
+        self.assertEqual(assess_drift(concentrated)["tier"], "safe")
+        self.assertEqual(assess_drift(np.ones((12, 12)))["tier"], "critical")
+
+    def test_assess_batch_matches_single(self):
+        """Test that batch codes agree with per-matrix assessment"""
+        monitor = DriftMonitor()
+        rng = np.random.default_rng(0)
+        attention = rng.random((3, 4, 10, 10)) ** rng.uniform(1, 40, size=(3, 4, 1, 1))
+
+        codes, entropy = monitor.assess_batch(attention, return_entropy=True)
+        self.assertEqual(codes.shape, (3, 4))
+        self.assertEqual(codes.dtype, np.uint8)
+
+        for index in np.ndindex(codes.shape):
+            single = monitor.assess_risk(attention[index])
+            self.assertEqual(monitor.TIERS[codes[index]], single["tier"])
+            self.assertAlmostEqual(entropy[index], monitor._calculate_pattern_entropy(attention[index]))
+        self.assertEqual(monitor.describe_tier(codes[0, 0])["tier"], monitor.TIERS[codes[0, 0]])
+
+    def test_assess_drift_batch_shape(self):
+        """Test the batch helper on an (N, H, W) stack"""
+        codes = assess_drift_batch(np.random.rand(5, 12, 12))
+        self.assertEqual(codes.shape, (5,))
+        with self.assertRaises(ValueError):
+            assess_drift_batch(np.random.rand(12))
+
+class TestStreamingDriftMonitor(unittest.TestCase):
+    """Test cases for the streaming drift monitor"""
+
+    def test_running_entropy_matches_full_scan(self):
+        """Test that incremental entropy agrees with a full rescan"""
+        attention = np.random.default_rng(1).random((30, 30)) ** 6
+        monitor = DriftMonitor()
+
+        streaming = StreamingDriftMonitor()
+        streaming.update_many(attention)
+        self.assertAlmostEqual(streaming.entropy, monitor._calculate_pattern_entropy(attention), places=5)
+
+        windowed = StreamingDriftMonitor(window=8)
+        windowed.update_many(attention)
+        self.assertAlmostEqual(windowed.entropy, monitor._calculate_pattern_entropy(attention[-8:]), places=5)
+
+    def test_transition_callbacks(self):
+        """Test that tier changes are reported as they happen"""
+        transitions = []
+        monitor = StreamingDriftMonitor(window=2, on_transition=lambda *args: transitions.append(args))
+
+        focused = np.zeros(16)
+        focused[0] = 1.0
+        monitor.update(focused)
+        monitor.update(focused)
+        self.assertFalse(monitor.critical)
+
+        monitor.update(np.ones(16))
+        monitor.update(np.ones(16))
+        self.assertTrue(monitor.critical)
+
+        self.assertEqual(transitions[0][:2], (None, "safe"))
+        self.assertEqual(transitions[-1][1], "critical")
+        self.assertEqual(monitor.assessment()["tier"], "critical")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,13 +4,15 @@ Tests for the glyph generation system
 
 import sys
 import os
+import tempfile
 import unittest
 import numpy as np
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.glyphs.generator import generate_glyph
+from src.glyphs.cache import GlyphCache
+from src.glyphs.generator import generate_glyph, generate_glyphs_batch, render_glyph
 
 class TestGlyphGenerator(unittest.TestCase):
     """Test cases for the glyph generator"""
@@ -62,5 +64,108 @@ class TestGlyphGenerator(unittest.TestCase):
             if os.path.exists(path):
                 os.remove(path)
 
+    def test_batch_matches_single(self):
+        """Test that batch rendering is byte-identical to single rendering"""
+        attention_stack = np.random.rand(4, 12, 12)
+        themes = ["cosmic", "void", "flame", "cosmic"]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            batch_paths = generate_glyphs_batch(attention_stack, themes=themes, output_dir=tmp)
+            self.assertEqual(len(batch_paths), 4)
+
+            for i, batch_path in enumerate(batch_paths):
+                single_path = generate_glyph(attention_stack[i], os.path.join(tmp, f"single_{i}.svg"),
+                                             theme=themes[i])
+                with open(batch_path, 'rb') as f:
+                    batch_content = f.read()
+                with open(single_path, 'rb') as f:
+                    single_content = f.read()
+                self.assertEqual(batch_content, single_content)
+
+    def test_batch_rejects_bad_shapes(self):
+        """Test that batch rendering validates its inputs"""
+        with self.assertRaises(ValueError):
+            generate_glyphs_batch(np.random.rand(12, 12))
+        with self.assertRaises(ValueError):
+            generate_glyphs_batch(np.random.rand(2, 12, 12), themes=["cosmic"])
+
+    def test_template_backend_matches_svgwrite(self):
+        """Test that the template serializer writes the same bytes as svgwrite"""
+        with tempfile.TemporaryDirectory() as tmp:
+            for theme in ["cosmic", "void", "flame", "unknown"]:
+                for shape in [(12, 12), (5, 7), (20, 16)]:
+                    attention = np.random.rand(*shape)
+                    svgwrite_path = generate_glyph(attention, os.path.join(tmp, "svgwrite.svg"),
+                                                   theme=theme, backend="svgwrite")
+                    template_path = generate_glyph(attention, os.path.join(tmp, "template.svg"),
+                                                   theme=theme, backend="template")
+                    with open(svgwrite_path, 'rb') as f:
+                        svgwrite_content = f.read()
+                    with open(template_path, 'rb') as f:
+                        template_content = f.read()
+                    self.assertEqual(svgwrite_content, template_content)
+
+    def test_unknown_backend(self):
+        """Test that an unknown serializer backend is rejected"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                generate_glyph(np.random.rand(12, 12), os.path.join(tmp, "x.svg"), backend="xml")
+
+class TestGlyphCache(unittest.TestCase):
+    """Test cases for the content-addressed glyph cache"""
+
+    def test_repeated_render_hits_cache(self):
+        """Test that identical attention is rendered once and reused"""
+        attention = np.random.rand(12, 12)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = GlyphCache(cache_dir=tmp)
+            first_path = generate_glyph(attention, cache=cache)
+            second_path = generate_glyph(attention.copy(), cache=cache)
+
+            self.assertEqual(first_path, second_path)
+            self.assertEqual(cache.stats()["misses"], 1)
+            self.assertEqual(cache.stats()["hits"], 1)
+
+            # A different theme is a different glyph
+            generate_glyph(attention, cache=cache, theme="void")
+            self.assertEqual(cache.stats()["misses"], 2)
+
+            # A fresh cache over the same directory hits the disk tier
+            disk_cache = GlyphCache(cache_dir=tmp)
+            output_path = os.path.join(tmp, "copy.svg")
+            generate_glyph(attention, output_path, cache=disk_cache)
+            self.assertEqual(disk_cache.stats()["disk_hits"], 1)
+            with open(first_path, 'rb') as f:
+                cached_content = f.read()
+            with open(output_path, 'rb') as f:
+                self.assertEqual(f.read(), cached_content)
+
+    def test_bounded_eviction(self):
+        """Test that both tiers stay within their bounds"""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = GlyphCache(cache_dir=tmp, max_entries=2, max_disk_bytes=2500)
+            for i in range(5):
+                cache.put(f"key{i}", b"x" * 1000)
+
+            stats = cache.stats()
+            self.assertEqual(stats["entries"], 2)
+            self.assertLessEqual(stats["disk_bytes"], 2500)
+            self.assertLessEqual(len(os.listdir(tmp)), 2)
+            self.assertEqual(cache.get("key4"), b"x" * 1000)
+
+    def test_returned_paths_exist_under_small_disk_budget(self):
+        """Test that cached glyph paths stay readable when the disk tier overflows"""
+        a, b = np.random.rand(12, 12), np.random.rand(12, 12)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # One glyph alone overflows the budget, and a second evicts the first
+            for budget in (100, 12000):
+                cache = GlyphCache(cache_dir=os.path.join(tmp, str(budget)), max_disk_bytes=budget)
+                for attention in (a, b, a):
+                    path = generate_glyph(attention, cache=cache)
+                    with open(path, 'rb') as f:
+                        self.assertEqual(f.read(), render_glyph(attention))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the mythic documentation visualizer
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from src.docs.mythic_visualizer import MythicVisualizer
+
+class TestMythicVisualizer(unittest.TestCase):
+    """Test cases for the concept visuals"""
+
+    def setUp(self):
+        self.visualizer = MythicVisualizer()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, ignore_errors=True)
+
+    def test_divergence_uses_collections(self):
+        """Test that ray segments are drawn as one collection, not one line each"""
+        fig, ax = plt.subplots()
+        self.visualizer._draw_concept(ax, "divergence")
+        plt.close(fig)
+
+        self.assertEqual(len(ax.lines), 0)
+        self.assertEqual(sum(len(c.get_segments()) for c in ax.collections if hasattr(c, "get_segments")),
+                         8 * 99)
+
+    def test_render_all_concepts(self):
+        """Test that every concept is saved from one figure"""
+        paths = self.visualizer.render_all_concepts(self.output_dir)
+
+        self.assertEqual(list(paths), ["divergence", "recursion", "alignment", "completion"])
+        for path in paths.values():
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(8), b"\x89PNG\r\n\x1a\n")
+        self.assertEqual(plt.get_fignums(), [])
+
+        with self.assertRaises(ValueError):
+            self.visualizer.create_concept_visualization("entropy")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Tests for the ψCORE hybrid transformer and its attention backends
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.psycore.backends import NumpyTransformerBackend, SimulatedBackend, load_backend
+from src.ethics.drift_tier import assess_drift
+from src.psycore.hybrid_transformer import PsiCore
+
+VOCAB = ["the", "glyph", "drifts", "toward", "balance", "ritual", "of", "recursion"]
+
+class TestAttentionBackends(unittest.TestCase):
+    """Test cases for batched attention extraction"""
+
+    def setUp(self):
+        self.backend = NumpyTransformerBackend.init_random(VOCAB, batch_size=4)
+        self.texts = [
+            "the glyph drifts toward balance",
+            "ritual",
+            "the ritual of recursion drifts toward the glyph of balance",
+            "",
+            "unknown words still attend",
+        ]
+
+    def test_batched_matches_single(self):
+        """Test that padding and bucketing do not change any prompt's attention"""
+        batched = self.backend.extract_batch(self.texts)
+
+        for text, maps in zip(self.texts, batched):
+            tokens = len(self.backend.tokenize(text))
+            self.assertEqual(maps.shape, (2, 4, tokens, tokens))
+            np.testing.assert_allclose(maps, self.backend.extract(text), atol=1e-12)
+            np.testing.assert_allclose(maps.sum(axis=-1), 1.0)
+
+    def test_save_and_load(self):
+        """Test that weights round-trip through an .npz file"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "reference.npz")
+            self.backend.save(path)
+            loaded = load_backend(path)
+
+        self.assertIsInstance(loaded, NumpyTransformerBackend)
+        np.testing.assert_allclose(loaded.extract(self.texts[0]), self.backend.extract(self.texts[0]))
+
+    def test_psicore_uses_backend(self):
+        """Test that PsiCore reduces backend attention to one matrix per prompt"""
+        core = PsiCore(backend=self.backend)
+        matrices = core.extract_attention_batch(self.texts[:3])
+        self.assertEqual([m.shape for m in matrices], [(5, 5), (1, 1), (10, 10)])
+        self.assertEqual(matrices[0].max(), core._extract_attention(self.texts[0]).max())
+
+        simulated = PsiCore()
+        self.assertIsInstance(simulated.transformer, SimulatedBackend)
+        self.assertEqual(simulated._extract_attention("hello world").shape, (12, 12))
+
+class TestAuditMany(unittest.TestCase):
+    """Test cases for the pipelined bulk audit"""
+
+    def test_matches_serial_audit(self):
+        """Test that pipelined results arrive in order and match audit()"""
+        texts = [f"prompt {i} about the glyph" for i in range(7)]
+        core = PsiCore()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for workers in (1, 2):
+                results = list(core.audit_many(iter(texts), workers=workers, batch_size=3,
+                                               queue_size=1, output_dir=tmp))
+                self.assertEqual([result["text"] for result in results], texts)
+                self.assertEqual(set(results[0]["timings"]), {"extract", "render", "score"})
+
+                for text, result in zip(texts, results):
+                    with open(result["glyph_path"]) as f:
+                        pipelined = f.read()
+                    with open(core.audit(text, os.path.join(tmp, "serial.svg"))) as f:
+                        self.assertEqual(pipelined, f.read())
+                    self.assertEqual(result["assessment"]["tier"],
+                                     assess_drift(core._extract_attention(text))["tier"])
+
+class TestAsyncAudit(unittest.TestCase):
+    """Test cases for the asyncio audit API"""
+
+    def test_aaudit_matches_audit(self):
+        """Test that concurrent async audits write the same glyphs as audit()"""
+        core = PsiCore(max_concurrency=2)
+        texts = [f"async prompt {i}" for i in range(5)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            async def run():
+                return await asyncio.gather(*(
+                    core.aaudit(text, os.path.join(tmp, f"{i}.svg")) for i, text in enumerate(texts)))
+
+            paths = asyncio.run(run())
+            for text, path in zip(texts, paths):
+                with open(path) as f:
+                    async_svg = f.read()
+                with open(core.audit(text, os.path.join(tmp, "serial.svg"))) as f:
+                    self.assertEqual(async_svg, f.read())
+
+    def test_aaudit_timeout(self):
+        """Test that a call stuck waiting for a slot times out"""
+        core = PsiCore(max_concurrency=1)
+
+        async def run():
+            core._semaphores[asyncio.get_running_loop()] = asyncio.Semaphore(0)
+            await core.aaudit("never runs", timeout=0.01)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+    def test_aaudit_across_event_loops(self):
+        """Test that one instance serves contended calls from successive loops"""
+        core = PsiCore(max_concurrency=1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            async def run(loop_id):
+                return await asyncio.gather(*(
+                    core.aaudit(f"loop {loop_id} prompt {i}", os.path.join(tmp, f"{loop_id}-{i}.svg"))
+                    for i in range(3)))
+
+            for loop_id in range(2):
+                self.assertEqual(len(asyncio.run(run(loop_id))), 3)
+
+if __name__ == '__main__':
+    unittest.main()
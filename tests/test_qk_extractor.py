@@ -0,0 +1,71 @@
+"""
+Tests for the QK/OV attribution extractor
+"""
+
+import sys
+import os
+import importlib.util
+import unittest
+import numpy as np
+
+# The recursive-field package name is not importable, so load the module by path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+spec = importlib.util.spec_from_file_location(
+    "qk_extractor", os.path.join(ROOT, "src", "recursive-field", "qk_extractor.py"))
+qk_extractor = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(qk_extractor)
+
+from src.seeding import stable_rng
+
+class TestQKOVExtractor(unittest.TestCase):
+    """Test cases for extract_qkov"""
+
+    def test_structure_terms(self):
+        """Test that the broadcast structure matches the per-element definition"""
+        text = " ".join(f"token{i}" for i in range(15))
+        result = qk_extractor.extract_qkov(text)
+
+        expected = stable_rng("qkov", text).random((15, 15))
+        for i in range(15):
+            for j in range(15):
+                expected[i, j] += 0.3 if i == j else 0.1 / (1 + abs(i - j))
+        expected = expected / expected.max()
+
+        np.testing.assert_allclose(result["qk"], expected)
+        np.testing.assert_allclose(result["ov"], np.roll(expected, shift=1, axis=0))
+
+    def test_token_cap(self):
+        """Test that the token cap defaults to 20 and can be lifted"""
+        text = " ".join(["word"] * 50)
+        self.assertEqual(qk_extractor.extract_qkov(text)["qk"].shape, (20, 20))
+        self.assertEqual(qk_extractor.extract_qkov(text, max_tokens=None)["qk"].shape, (50, 50))
+
+    def test_stacked_layers_and_heads(self):
+        """Test that several layers and heads come back as stacked arrays"""
+        result = qk_extractor.extract_qkov("a b c d e", layer_idx=[0, 1, 2], num_heads=4)
+        self.assertEqual(result["qk"].shape, (3, 4, 5, 5))
+        self.assertEqual(result["ov"].shape, (3, 4, 5, 5))
+        np.testing.assert_allclose(result["qk"].max(axis=(-2, -1)), 1.0)
+
+    def test_memoized_result_is_independent(self):
+        """Test that repeated calls agree and callers cannot corrupt the cache"""
+        first = qk_extractor.extract_qkov("the same prompt twice")
+        first["qk"][:] = 0
+        second = qk_extractor.extract_qkov("the same prompt twice")
+        self.assertGreater(second["qk"].max(), 0)
+
+    def test_large_results_not_memoized(self):
+        """Test that long prompts are recomputed rather than filling the cache"""
+        text = " ".join(f"token{i}" for i in range(2000))
+        result = qk_extractor.extract_qkov(text, max_tokens=None)
+        self.assertEqual(result["qk"].shape, (2000, 2000))
+
+        stats = qk_extractor.extract_qkov.cache.stats()
+        self.assertLessEqual(stats["memory_bytes"], 8 * 1024 * 1024)
+        key_count = stats["entries"]
+        qk_extractor.extract_qkov(text, max_tokens=None)
+        self.assertEqual(qk_extractor.extract_qkov.cache.stats()["entries"], key_count)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests for the Ritual Simulator
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ritual.history import RitualHistory
+from src.ritual.simulator import RitualSimulator
+
+class TestRitualSimulator(unittest.TestCase):
+    """Test cases for the ritual simulator"""
+
+    def setUp(self):
+        # Rituals are written relative to the working directory
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_aperform_ritual_matches_sync(self):
+        """Test that async rituals match the blocking path and save records"""
+        simulator = RitualSimulator(max_concurrency=2)
+        intents = ["seek balance", "complete the cycle", "diverge"]
+
+        async def run():
+            return await asyncio.gather(*(simulator.aperform_ritual(intent, depth=2) for intent in intents))
+
+        rituals = asyncio.run(run())
+        for intent, ritual in zip(intents, rituals):
+            self.assertIs(simulator.history.get(ritual["id"]), ritual)
+            expected = simulator.perform_ritual(intent, depth=2)
+            self.assertEqual(ritual["sequence"], expected["sequence"])
+            self.assertEqual(ritual["hologram"], expected["hologram"])
+        self.assertEqual(len(simulator.ritual_history), 6)
+
+        logged = [ritual["id"] for ritual in simulator.history.iter_log()]
+        self.assertEqual(sorted(logged), sorted(ritual["id"] for ritual in simulator.ritual_history))
+
+    def test_aperform_ritual_across_event_loops(self):
+        """Test that one simulator serves contended calls from successive loops"""
+        simulator = RitualSimulator(max_concurrency=1)
+
+        async def run(loop_id):
+            return await asyncio.gather(*(simulator.aperform_ritual(f"loop {loop_id} intent {i}", depth=1)
+                                          for i in range(3)))
+
+        for loop_id in range(2):
+            self.assertEqual(len(asyncio.run(run(loop_id))), 3)
+
+    def test_symbol_sequences(self):
+        """Test keyword weighting and that bulk sequences match single ones"""
+        simulator = RitualSimulator(history=RitualHistory(log_path=None))
+        weights = simulator._calculate_symbol_weights("Seek BALANCE through the loophole")
+        self.assertEqual(list(weights), [1 / 6, 1 / 3, 1 / 3, 1 / 6])
+
+        intents = ["diverge", "complete the cycle", "", "harmony and peace"]
+        sequences = simulator.generate_symbol_sequences(intents, depth=4)
+        self.assertEqual(sequences, [simulator._generate_symbol_sequence(i, 4) for i in intents])
+        self.assertTrue(all(len(sequence) == 12 for sequence in sequences))
+
+    def test_perform_rituals_matches_single(self):
+        """Test that batched rituals match one-at-a-time rituals"""
+        simulator = RitualSimulator()
+        intents = ["seek balance", "seek balance", "diverge and split the final loop", ""]
+
+        batch = simulator.perform_rituals(intents, depth=2, theme="flame", workers=1)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(len(set(batch.ids)), 4)
+        self.assertEqual(len(list(simulator.history.iter_log())), 4)
+        self.assertNotIn("hologram", simulator.history.get(batch.ids[0]))
+
+        for index, intent in enumerate(intents):
+            ritual = simulator.perform_ritual(intent, depth=2, theme="flame")
+            self.assertEqual(batch.sequences[index], ritual["sequence"])
+            self.assertEqual(batch.tiers[index], ritual["drift_assessment"]["tier"])
+            self.assertEqual(batch[index]["hologram"], ritual["hologram"])
+            with open(batch.glyph_paths[index]) as batched, open(ritual["glyph_path"]) as single:
+                self.assertEqual(batched.read(), single.read())
+
+class TestRitualHistory(unittest.TestCase):
+    """Test cases for the bounded ritual history store"""
+
+    def _ritual(self, i, tier):
+        return {
+            "id": f"r{i}",
+            "timestamp": f"202401010000{i:02d}",
+            "intent": f"intent {i % 3}",
+            "drift_assessment": {"tier": tier},
+        }
+
+    def test_ring_buffer_and_indexes(self):
+        """Test that eviction keeps the indexes consistent with the ring"""
+        history = RitualHistory(capacity=4, log_path=None)
+        tiers = ["safe", "caution", "critical"]
+        for i in range(10):
+            history.add(self._ritual(i, tiers[i % 3]))
+
+        self.assertEqual([ritual["id"] for ritual in history], ["r6", "r7", "r8", "r9"])
+        self.assertIsNone(history.get("r5"))
+        self.assertEqual([r["id"] for r in history.query(tier="safe")], ["r9", "r6"])
+        self.assertEqual([r["id"] for r in history.query(intent="intent 0")], ["r9", "r6"])
+        self.assertEqual([r["id"] for r in history.query(since="20240101000008")], ["r9", "r8"])
+        self.assertEqual([r["id"] for r in history.query(tier="critical", limit=1)], ["r8"])
+
+    def test_log_is_batched(self):
+        """Test that records reach the log in batches and on close"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs", "history.jsonl")
+            history = RitualHistory(capacity=2, log_path=path, flush_every=3, flush_interval=3600)
+
+            history.add(self._ritual(0, "safe"))
+            history.add(self._ritual(1, "safe"))
+            self.assertFalse(os.path.exists(path))
+            history.add(self._ritual(2, "safe"))
+            history.add(self._ritual(3, "safe"))
+            with open(path) as f:
+                self.assertEqual(len(f.readlines()), 3)
+
+            history.close()
+            self.assertEqual([r["id"] for r in history.iter_log()], ["r0", "r1", "r2", "r3"])
+
+    def test_quiet_log_flushed_by_timer(self):
+        """Test that queued records are written after the interval with no further adds"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.jsonl")
+            history = RitualHistory(log_path=path, flush_every=100, flush_interval=0.05)
+            self.addCleanup(history.close)
+
+            history.add(self._ritual(0, "safe"))
+            self.assertFalse(os.path.exists(path))
+            deadline = time.monotonic() + 5
+            while not (os.path.exists(path) and os.path.getsize(path)) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            with open(path) as f:
+                self.assertEqual([json.loads(line)["id"] for line in f], ["r0"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Tests for the privacy sanitizer
+"""
+
+import sys
+import os
+import json
+import tempfile
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.privacy.sanitizer import Sanitizer, sanitize_text
+
+class TestSanitizer(unittest.TestCase):
+    """Test cases for the sanitizer"""
+
+    def test_clean_redacts_each_type(self):
+        """Test that every PII type is replaced by a typed token"""
+        text = ("Mail john.doe@example.com, call 555-123-4567, ssn 123-45-6789, "
+                "card 1234 5678 9012 3456, visit 42 Main street.")
+        sanitized, sanitizer = sanitize_text(text)
+
+        for pii_type in ["email", "phone", "ssn", "credit_card", "address"]:
+            self.assertIn(f"[REDACTED:{pii_type}:", sanitized)
+        for value in ["john.doe@example.com", "555-123-4567", "123-45-6789", "1234 5678 9012 3456"]:
+            self.assertNotIn(value, sanitized)
+        self.assertEqual(len(sanitizer.redacted_items), 5)
+
+    def test_restore_round_trip(self):
+        """Test that restore reverses clean"""
+        text = "a@b.com and c@d.org wrote from 555-123-4567 and 555-765-4321 " * 50
+        sanitizer = Sanitizer()
+        sanitized = sanitizer.clean(text)
+
+        self.assertNotIn("@", sanitized)
+        self.assertEqual(sanitizer.restore(sanitized), text)
+
+    def test_repeated_values_get_distinct_ids(self):
+        """Test that repeated values are stored under distinct ids"""
+        sanitizer = Sanitizer()
+        sanitizer.clean("x@y.com x@y.com x@y.com")
+        self.assertEqual(len(sanitizer.redacted_items), 3)
+
+    def test_empty_text(self):
+        """Test that empty input yields empty output"""
+        self.assertEqual(Sanitizer().clean(""), "")
+
+    def test_clean_stream_matches_clean(self):
+        """Test that streaming catches PII across chunk boundaries"""
+        text = ("Reach jane.roe@example.org or 555-123-4567. Card 1234-5678-9012-3456 "
+                "ships to 42 Main street. ") * 20
+        reference = Sanitizer()
+        expected = reference.clean(text)
+
+        for chunk_size in [1, 7, 64]:
+            chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+            sanitizer = Sanitizer()
+            segments = list(sanitizer.clean_stream(chunks, overlap=128))
+
+            self.assertEqual("".join(segment for segment, _ in segments), expected)
+            streamed_map = {}
+            for _, redactions in segments:
+                streamed_map.update(redactions)
+            self.assertEqual(streamed_map, reference.redacted_items)
+
+    def test_clean_file(self):
+        """Test that files are sanitized with the map written alongside"""
+        text = "Write to a@b.com about ssn 123-45-6789.\n" * 100
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path_in = os.path.join(tmp, "in.txt")
+            path_out = os.path.join(tmp, "out.txt")
+            map_path = os.path.join(tmp, "map.jsonl")
+            with open(path_in, "w", encoding="utf-8") as f:
+                f.write(text)
+
+            sanitizer = Sanitizer()
+            redacted = sanitizer.clean_file(path_in, path_out, map_path, chunk_size=50, overlap=64)
+            self.assertEqual(redacted, 200)
+
+            with open(path_out, encoding="utf-8") as f:
+                sanitized = f.read()
+            with open(map_path, encoding="utf-8") as f:
+                sanitizer.redacted_items = {
+                    entry["id"]: entry["value"] for entry in map(json.loads, f)
+                }
+            self.assertNotIn("a@b.com", sanitized)
+            self.assertEqual(sanitizer.restore(sanitized), text)
+
+    def test_clean_many_preserves_order_and_maps(self):
+        """Test that parallel cleaning matches serial cleaning per document"""
+        texts = [f"user{i}@example.com called 555-123-{i:04d}" for i in range(20)] + ["", "no pii"]
+
+        for workers in [1, 2]:
+            results = Sanitizer().clean_many(texts, workers=workers)
+            self.assertEqual(len(results), len(texts))
+
+            for text, (sanitized, sanitizer) in zip(texts, results):
+                self.assertEqual(sanitized, Sanitizer().clean(text))
+                self.assertEqual(sanitizer.restore(sanitized), text)
+
+    def test_restore_many(self):
+        """Test bulk restoration with shared and per-document maps"""
+        texts = ["ping a@b.com", "ping 555-123-4567 and a@b.com", "nothing"]
+        results = Sanitizer().clean_many(texts, workers=1)
+        sanitized = [text for text, _ in results]
+
+        restored = Sanitizer().restore_many(sanitized, [s.redacted_items for _, s in results])
+        self.assertEqual(restored, texts)
+
+        sanitizer = Sanitizer()
+        document = sanitizer.clean(" | ".join(texts))
+        self.assertEqual(sanitizer.restore_many(document.split(" | ")), texts)
+
+        # Unknown tokens are left untouched
+        self.assertEqual(Sanitizer().restore("[REDACTED:email:00000000]"), "[REDACTED:email:00000000]")
+
+if __name__ == '__main__':
+    unittest.main()